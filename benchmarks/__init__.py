@@ -0,0 +1 @@
+"""Benchmarks for sphinx-modeling."""
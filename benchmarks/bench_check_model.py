@@ -0,0 +1,206 @@
+"""
+Micro benchmark for the model check.
+
+Times each phase of the model check separately on generated need graphs:
+
+- ``views``: creation of the need views, which replaced the deep copy of all needs
+- ``resolve_links``: creation of the need views with link fields resolved from the link graph
+- ``reduce_fields``: reduction of each need to the fields passed to pydantic
+- ``validate``: pydantic validation including the collection of structured errors
+- ``fast_check``: validation with the compiled pre-check, only failing needs are validated by pydantic
+- ``write_messages``: writing the results of all needs into an empty result store
+
+Additionally, the complete ``check_model`` call is timed with default configuration.
+
+Usage::
+
+    python benchmarks/bench_check_model.py --needs 1000 10000 --output bench_check_model.json
+    python benchmarks/bench_check_model.py --compare bench_check_model.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pydantic import ValidationError  # noqa: E402
+
+from benchmarks.models import MODELING_MODELS, MODELING_REMOVE_FIELDS_BENCHMARK  # noqa: E402
+from benchmarks.needs_generator import LINK_TYPES, NEED_TYPES, generate_needs  # noqa: E402
+from sphinx_modeling.modeling import defaults  # noqa: E402
+from sphinx_modeling.modeling.errors import get_validation_errors  # noqa: E402
+from sphinx_modeling.modeling.fast_check import compile_checker  # noqa: E402
+from sphinx_modeling.modeling.links import NeedView, resolve_needs  # noqa: E402
+from sphinx_modeling.modeling.main import check_model  # noqa: E402
+from sphinx_modeling.modeling.plan import ValidationPlan  # noqa: E402
+from sphinx_modeling.modeling.store import NeedResult, ResultStore  # noqa: E402
+from sphinx_modeling.standalone import CONFIG_DEFAULTS, StandaloneEnv  # noqa: E402
+
+
+PHASES = ["views", "resolve_links", "reduce_fields", "validate", "fast_check", "write_messages", "check_model"]
+SIZES = [1000, 10000, 100000]
+
+
+def _get_git_revision() -> Optional[str]:
+    """Return the current commit of the repository, if available."""
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, check=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _create_env(needs: Dict[str, Dict[str, Any]]) -> Any:
+    """Create a stand-in for the Sphinx build environment with the default configuration and the benchmark models."""
+    config = SimpleNamespace(
+        **{
+            **CONFIG_DEFAULTS,
+            "modeling_models": MODELING_MODELS,
+            "modeling_remove_fields": MODELING_REMOVE_FIELDS_BENCHMARK,
+            # sphinx-needs adds "links" itself
+            "needs_extra_links": [{"option": link_type} for link_type in LINK_TYPES],
+        }
+    )
+    return StandaloneEnv(needs, config)
+
+
+def run_phases(needs: Dict[str, Dict[str, Any]], out_dir: str) -> Dict[str, float]:
+    """
+    Run all phases of the model check on the given needs.
+
+    :return: mapping of phase name to duration in seconds
+    """
+    all_link_types = set(LINK_TYPES) | {f"{link_type}_back" for link_type in LINK_TYPES}
+    plans = {
+        need_type: ValidationPlan(
+            model,
+            MODELING_REMOVE_FIELDS_BENCHMARK,
+            defaults.MODELING_REMOVE_BACKLINKS,
+            [f"{link_type}_back" for link_type in LINK_TYPES],
+        )
+        for need_type, model in MODELING_MODELS.items()
+    }
+    timings: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    views = {need_id: NeedView(need) for need_id, need in needs.items()}
+    timings["views"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    views = resolve_needs(needs, all_link_types)
+    timings["resolve_links"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reduced = [(need_id, plans[view["type"]], plans[view["type"]].project(view)) for need_id, view in views.items()]
+    timings["reduce_fields"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results: List[NeedResult] = []
+    for need_id, plan, fields in reduced:
+        errors = []
+        try:
+            plan.model(**fields, all_needs=needs, env=None)
+        except ValidationError as exc:
+            errors = get_validation_errors(exc)
+        results.append(NeedResult(need_id, needs[need_id]["docname"], plan.model.__name__, None, errors))
+    timings["validate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    checks = {need_type: compile_checker(model) for need_type, model in MODELING_MODELS.items()}
+    for need_id, plan, fields in reduced:
+        check = checks[needs[need_id]["type"]]
+        if check is not None and check(fields, None):
+            continue
+        try:
+            plan.model(**fields, all_needs=needs, env=None)
+        except ValidationError as exc:
+            get_validation_errors(exc)
+    timings["fast_check"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ResultStore(os.path.join(out_dir, "phases.sqlite")) as store:
+        store.update(results, "")
+    timings["write_messages"] = time.perf_counter() - start
+
+    env = _create_env(needs)
+    start = time.perf_counter()
+    check_model(env, os.path.join(out_dir, "results.sqlite"))
+    timings["check_model"] = time.perf_counter() - start
+    return timings
+
+
+def run_benchmark(sizes: List[int], fan_out: int, failure_rate: float, repeat: int) -> Dict[str, Any]:
+    """Run the phases for all need counts, the best time of all repetitions is reported."""
+    results = []
+    for count in sizes:
+        needs = generate_needs(count, fan_out=fan_out, failure_rate=failure_rate)
+        best: Dict[str, float] = {}
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as out_dir:
+                timings = run_phases(needs, out_dir)
+            for phase, seconds in timings.items():
+                best[phase] = min(best.get(phase, seconds), seconds)
+        results.append({"needs": count, "seconds": {phase: round(best[phase], 4) for phase in PHASES}})
+    return {
+        "revision": _get_git_revision(),
+        "python": sys.version.split()[0],
+        "fan_out": fan_out,
+        "failure_rate": failure_rate,
+        "need_types": NEED_TYPES,
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Return a line per need count and phase with the relative change against the baseline."""
+    baseline_results = {result["needs"]: result["seconds"] for result in baseline["results"]}
+    lines = [f"baseline {baseline.get('revision')} -> current {current.get('revision')}"]
+    for result in current["results"]:
+        old = baseline_results.get(result["needs"])
+        if old is None:
+            continue
+        for phase, seconds in result["seconds"].items():
+            if old.get(phase):
+                change = (seconds - old[phase]) / old[phase] * 100
+                lines.append(
+                    f"{result['needs']:>7} needs {phase:<15} {old[phase]:>9.4f}s {seconds:>9.4f}s {change:+7.1f}%"
+                )
+    return lines
+
+
+def main() -> None:
+    """Run the benchmark, print the results as JSON and optionally store or compare them."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--needs", type=int, nargs="+", default=SIZES, help="numbers of generated needs")
+    parser.add_argument("--fan-out", type=int, default=3, help="outgoing links per need")
+    parser.add_argument("--failure-rate", type=float, default=0.05, help="share of needs that fail validation")
+    parser.add_argument("--repeat", type=int, default=1, help="repetitions per need count, the best time is reported")
+    parser.add_argument("--output", help="JSON file to store the results in")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare the results against")
+    args = parser.parse_args()
+
+    # check_model logs each validation message
+    logging.getLogger("sphinx").addHandler(logging.NullHandler())
+    logging.getLogger("sphinx").propagate = False
+
+    results = run_benchmark(args.needs, args.fan_out, args.failure_rate, args.repeat)
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fp:
+            print("\n".join(compare(json.load(fp), results)))
+
+
+if __name__ == "__main__":
+    main()
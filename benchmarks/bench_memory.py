@@ -0,0 +1,94 @@
+"""
+Memory benchmark for need link resolution.
+
+Compares the peak memory of the former deep copy approach against the need views with an overlay layer.
+Each strategy runs in a separate process to get comparable peak RSS values.
+
+Usage::
+
+    python benchmarks/bench_memory.py --needs 10000
+"""
+
+import argparse
+import copy
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Set
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.needs_generator import generate_needs  # noqa: E402
+from sphinx_modeling.modeling.links import resolve_needs  # noqa: E402
+
+
+ALL_LINK_TYPES = {"links", "links_back", "parent_needs", "parent_needs_back"}
+STRATEGIES = ["deepcopy", "overlay"]
+
+
+def resolve_deepcopy(needs: Dict[str, Dict[str, Any]], all_link_types: Set[str]) -> Any:
+    """Link resolution as done up to version 0.2.0: deep copy all needs and replace link IDs in place."""
+    needs_copy = copy.deepcopy(needs)
+    for need in needs_copy.values():
+        for field, link_targets in need.items():
+            if field in all_link_types and link_targets:
+                need[field] = [needs_copy[target] for target in link_targets if target in needs_copy]
+        if need["parent_need"] and need["parent_need"] in needs_copy:
+            need["parent_need"] = needs_copy[need["parent_need"]]
+    return needs_copy
+
+
+def run_strategy(strategy: str, count: int) -> Dict[str, Any]:
+    """Run a single strategy in the current process and return the measurements."""
+    needs = generate_needs(count)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    start = time.perf_counter()
+    if strategy == "deepcopy":
+        resolved = resolve_deepcopy(needs, ALL_LINK_TYPES)
+    else:
+        resolved = resolve_needs(needs, ALL_LINK_TYPES)
+    duration = time.perf_counter() - start
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    assert len(resolved) == count
+    return {
+        "strategy": strategy,
+        "needs": count,
+        "seconds": round(duration, 3),
+        "traced_peak_mib": round(traced_peak / 1024 / 1024, 1),
+        "peak_rss_mib": round(rss_after / 1024, 1),  # ru_maxrss is given in KiB on Linux
+        "peak_rss_increase_mib": round((rss_after - rss_before) / 1024, 1),
+    }
+
+
+def main() -> None:
+    """Run all strategies in sub processes and print the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--needs", type=int, default=10000, help="number of generated needs")
+    parser.add_argument("--strategy", choices=STRATEGIES, help="run a single strategy in this process")
+    args = parser.parse_args()
+
+    if args.strategy:
+        print(json.dumps(run_strategy(args.strategy, args.needs)))
+        return
+
+    results = []
+    for strategy in STRATEGIES:
+        out = subprocess.run(
+            [sys.executable, __file__, "--strategy", strategy, "--needs", str(args.needs)],
+            capture_output=True,
+            check=True,
+        )
+        results.append(json.loads(out.stdout))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+End-to-end benchmark of Sphinx builds with and without sphinx-modeling.
+
+Generates a Sphinx project in the style of ``tests/doc_test/doc_modeling`` with one need graph spread over many
+RST files. The following scenarios get built with the extension enabled and disabled:
+
+- ``full``: fresh build of all documents
+- ``incremental``: rebuild after a single document changed
+- ``no_change``: rebuild without any changes, sphinx-modeling re-emits the messages of the previous build
+
+Each build runs in a separate process, which reports its own peak RSS.
+
+Usage::
+
+    python benchmarks/bench_sphinx_build.py --docs 1000 --needs-per-doc 5 --output bench_sphinx_build.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, ".."))
+
+from benchmarks.needs_generator import NEED_TYPES, generate_needs  # noqa: E402
+
+
+SCENARIOS = ["full", "incremental", "no_change"]
+
+CONF_PY = '''\
+"""Sphinx configuration file of the generated benchmark project."""
+import sys
+
+sys.path.insert(0, {repo_dir!r})
+
+from benchmarks.models import MODELING_MODELS, MODELING_REMOVE_FIELDS_BENCHMARK  # noqa: E402
+
+extensions = ["sphinx_needs", "sphinx_modeling"]
+
+needs_types = {needs_types!r}
+needs_extra_options = ["active"]
+
+modeling_models = MODELING_MODELS
+modeling_remove_fields = MODELING_REMOVE_FIELDS_BENCHMARK
+
+master_doc = "index"
+project = "sphinx-modeling benchmark"
+exclude_patterns = ["_build"]
+'''
+
+
+def create_project(project_dir: str, docs: int, needs_per_doc: int, failure_rate: float) -> None:
+    """Write conf.py, an index and all generated documents with their needs."""
+    needs_types = [
+        {
+            "directive": need_type,
+            "title": need_type.title(),
+            "prefix": f"{need_type.upper()}_",
+            "color": "#BFD8D2",
+            "style": "node",
+        }
+        for need_type in NEED_TYPES
+    ]
+    with open(os.path.join(project_dir, "conf.py"), "w", encoding="utf-8") as fp:
+        fp.write(CONF_PY.format(repo_dir=os.path.dirname(BENCHMARKS_DIR), needs_types=needs_types))
+
+    needs = list(generate_needs(docs * needs_per_doc, failure_rate=failure_rate).values())
+    os.makedirs(os.path.join(project_dir, "docs"))
+    for doc_index in range(docs):
+        lines = [f"Document {doc_index}", "=" * 20, ""]
+        for need in needs[doc_index * needs_per_doc : (doc_index + 1) * needs_per_doc]:  # noqa: E203
+            lines.append(f".. {need['type']}:: {need['title']}")
+            lines.append(f"   :id: {need['id']}")
+            lines.append(f"   :status: {need['status']}")
+            lines.append(f"   :active: {need['active']}")
+            if need["links"]:
+                lines.append(f"   :links: {', '.join(need['links'])}")
+            lines.extend(["", f"   Content of {need['id']}.", ""])
+        with open(os.path.join(project_dir, "docs", f"doc_{doc_index:05d}.rst"), "w", encoding="utf-8") as fp:
+            fp.write("\n".join(lines))
+
+    with open(os.path.join(project_dir, "index.rst"), "w", encoding="utf-8") as fp:
+        fp.write("Benchmark\n=========\n\n.. toctree::\n   :glob:\n\n   docs/*\n")
+
+
+def run_build(args: List[str]) -> None:
+    """Run sphinx-build in the current process and print its exit code and peak RSS as JSON in the last line."""
+    from sphinx.cmd.build import build_main  # pylint: disable=import-outside-toplevel
+
+    returncode = build_main(args)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # given in KiB on Linux
+    print(json.dumps({"returncode": returncode, "peak_rss_mib": round(rss / 1024, 1)}))
+
+
+def measure_build(project_dir: str, out_dir: str, extension: bool) -> Dict[str, Any]:
+    """Run a build in a sub process and return wall time, peak RSS and number of validation failures."""
+    build_args = ["-b", "html", project_dir, out_dir]
+    if not extension:
+        build_args = ["-D", "extensions=sphinx_needs"] + build_args
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, __file__, "--run-build", "--"] + build_args, capture_output=True, check=True, text=True
+    )
+    seconds = time.perf_counter() - start
+    result = json.loads(out.stdout.splitlines()[-1])
+    if result["returncode"]:
+        raise RuntimeError(f"Sphinx build failed:\n{out.stderr}")
+    return {
+        "seconds": round(seconds, 2),
+        "peak_rss_mib": result["peak_rss_mib"],
+        "failed_needs": (out.stdout + out.stderr).count("Model validation: failed for need"),
+    }
+
+
+def run_benchmark(docs: int, needs_per_doc: int, failure_rate: float) -> List[Dict[str, Any]]:
+    """Build all scenarios with the extension enabled and disabled."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for extension in (True, False):
+            project_dir = os.path.join(tmp_dir, f"project_{extension}")
+            os.makedirs(project_dir)
+            create_project(project_dir, docs, needs_per_doc, failure_rate)
+            out_dir = os.path.join(project_dir, "_build")
+            for scenario in SCENARIOS:
+                if scenario == "incremental":
+                    with open(os.path.join(project_dir, "docs", "doc_00000.rst"), "a", encoding="utf-8") as fp:
+                        fp.write("\nChanged paragraph.\n")
+                result = measure_build(project_dir, out_dir, extension)
+                results.append({"extension": extension, "scenario": scenario, **result})
+            shutil.rmtree(project_dir)
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    if len(sys.argv) > 2 and sys.argv[1] == "--run-build":
+        run_build(sys.argv[3:])
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=1000, help="number of generated RST files")
+    parser.add_argument("--needs-per-doc", type=int, default=5, help="number of needs per RST file")
+    parser.add_argument("--failure-rate", type=float, default=0.05, help="share of needs that fail validation")
+    parser.add_argument("--output", help="JSON file to store the results in")
+    args = parser.parse_args()
+
+    results = {
+        "docs": args.docs,
+        "needs": args.docs * args.needs_per_doc,
+        "failure_rate": args.failure_rate,
+        "results": run_benchmark(args.docs, args.needs_per_doc, args.failure_rate),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Pydantic models for the generated needs, modeled after tests/doc_test/doc_modeling/conf.py."""
+
+from typing import List
+
+
+try:
+    from typing import Literal
+except ImportError:
+    from typing_extensions import Literal
+
+from pydantic import BaseModel, Extra, constr
+
+from sphinx_modeling.modeling.defaults import MODELING_REMOVE_FIELDS
+from sphinx_modeling.modeling.main import BaseModelNeeds
+
+
+needs_bool = Literal["True", "False"]
+story_id = constr(regex=r"^STORY_\d{6}$")
+spec_id = constr(regex=r"^SPEC_\d{6}$")
+impl_id = constr(regex=r"^IMPL_\d{6}$")
+test_id = constr(regex=r"^TEST_\d{6}$")
+
+
+class LinkedStory(BaseModel):
+    type: Literal["story"]
+
+
+class LinkedSpec(BaseModel):
+    type: Literal["spec"]
+
+
+class LinkedImpl(BaseModel):
+    type: Literal["impl"]
+
+
+class Story(BaseModelNeeds, extra=Extra.forbid):
+    id: story_id  # type: ignore[valid-type]
+    type: Literal["story"]
+    status: Literal["open", "closed"]
+    active: needs_bool
+
+
+class Spec(BaseModelNeeds, extra=Extra.forbid):
+    id: spec_id  # type: ignore[valid-type]
+    type: Literal["spec"]
+    status: Literal["open", "closed"]
+    active: needs_bool
+    links: List[LinkedStory]
+
+
+class Impl(BaseModelNeeds, extra=Extra.forbid):
+    id: impl_id  # type: ignore[valid-type]
+    type: Literal["impl"]
+    status: Literal["open", "closed"]
+    active: needs_bool
+    links: List[LinkedSpec]
+
+
+class Test(BaseModelNeeds, extra=Extra.forbid):
+    id: test_id  # type: ignore[valid-type]
+    type: Literal["test"]
+    status: Literal["open", "closed"]
+    active: needs_bool
+    links: List[LinkedImpl]
+
+
+MODELING_MODELS = {
+    "story": Story,
+    "spec": Spec,
+    "impl": Impl,
+    "test": Test,
+}
+
+MODELING_REMOVE_FIELDS_BENCHMARK = MODELING_REMOVE_FIELDS + [
+    "content",
+    "full_title",
+    "is_external",
+    "is_need",
+    "is_part",
+    "parent_need",
+    "parent_needs",
+    "section_name",
+    "sections",
+    "tags",
+    "title",
+]
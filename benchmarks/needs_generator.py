@@ -0,0 +1,98 @@
+"""Generator for synthetic sphinx-needs need dictionaries."""
+
+import random
+from typing import Any, Dict, List, Mapping, Optional
+
+from docutils import nodes
+
+
+NEED_TYPES = ["story", "spec", "impl", "test"]
+"""Need types in link order, each type links to needs of the previous type."""
+
+LINK_TYPES = ["links"]
+
+
+def generate_needs(
+    count: int,
+    type_mix: Optional[Mapping[str, float]] = None,
+    fan_out: int = 3,
+    failure_rate: float = 0.0,
+    seed: int = 42,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate needs that look like the ones in env.needs_all_needs after sphinx-needs finished processing.
+
+    :param count: number of needs
+    :param type_mix: relative weight of each need type, all types of NEED_TYPES are equally weighted by default
+    :param fan_out: number of outgoing links per need, each need links to needs of the previous type
+    :param failure_rate: share of needs that violate the benchmark models, see benchmarks/models.py
+    :param seed: random seed to get reproducible need graphs
+    """
+    rnd = random.Random(seed)
+    type_mix = type_mix or {need_type: 1.0 for need_type in NEED_TYPES}
+    need_types = rnd.choices(list(type_mix), weights=list(type_mix.values()), k=count)
+
+    needs: Dict[str, Dict[str, Any]] = {}
+    ids_by_type: Dict[str, List[str]] = {need_type: [] for need_type in NEED_TYPES}
+    for index, need_type in enumerate(need_types):
+        need_id = f"{need_type.upper()}_{index:06d}"
+        ids_by_type[need_type].append(need_id)
+        needs[need_id] = _create_need(need_id, need_type, index)
+        if rnd.random() < failure_rate:
+            needs[need_id]["active"] = "Maybe"
+
+    for need_id, need in needs.items():
+        type_index = NEED_TYPES.index(need["type"])
+        if type_index == 0:
+            continue
+        candidates = ids_by_type[NEED_TYPES[type_index - 1]]
+        for target in rnd.sample(candidates, min(fan_out, len(candidates))):
+            need["links"].append(target)
+            needs[target]["links_back"].append(need_id)
+    return needs
+
+
+def _create_need(need_id: str, need_type: str, index: int) -> Dict[str, Any]:
+    """Create a single need with the fields sphinx-needs generates."""
+    docname = f"doc_{index // 100:04d}"
+    return {
+        "docname": docname,
+        "doctype": ".rst",
+        "lineno": index % 100 * 10 + 1,
+        "target_node": nodes.target("", "", ids=[need_id]),
+        "content_node": nodes.paragraph("", f"Content of {need_id}"),
+        "external_url": None,
+        "type": need_type,
+        "type_name": need_type.title(),
+        "type_prefix": f"{need_type.upper()}_",
+        "type_color": "#BFD8D2",
+        "type_style": "node",
+        "status": "open",
+        "tags": ["generated", need_type],
+        "constraints": [],
+        "constraints_passed": None,
+        "constraints_results": {},
+        "id": need_id,
+        "title": f"Title of {need_id}",
+        "full_title": f"Title of {need_id}",
+        "content": f"Content of {need_id}. " * 20,
+        "style": None,
+        "layout": "",
+        "hide": False,
+        "parts": {},
+        "is_part": False,
+        "is_need": True,
+        "is_external": False,
+        "external_css": "external_link",
+        "is_modified": False,
+        "modifications": 0,
+        "active": "True",
+        "parent_need": "",
+        "parent_needs": [],
+        "parent_needs_back": [],
+        "links": [],
+        "links_back": [],
+        "sections": [f"Section {index // 10}", f"Chapter {index // 100}"],
+        "section_name": f"Section {index // 10}",
+        "signature": "",
+    }
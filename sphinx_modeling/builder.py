@@ -0,0 +1,79 @@
+"""
+Sphinx builder that only validates the models.
+
+The builder reads all sources like any other builder, but instead of writing each document it resolves a single
+doctree. This lets sphinx-needs resolve links and back links of all needs, after which the model check runs once.
+The only output is the result store and a JSON report of all failed needs.
+
+Sphinx skips :meth:`~sphinx.builders.Builder.finish` if no document is outdated, so the report gets written by
+:func:`write_report` on ``build-finished`` instead, which fires on every build.
+"""
+import os
+from typing import Any, Dict, Iterable, Optional, Sequence, Set
+
+from docutils import nodes
+from sphinx.builders import Builder
+
+from sphinx_modeling.logging import get_logger
+from sphinx_modeling.modeling.files import write_json_atomic
+from sphinx_modeling.modeling.store import ResultStore
+
+
+MODELING_REPORT_FILE = "report.json"
+log = get_logger(__name__)
+
+
+class ModelingBuilder(Builder):
+    """Builder that validates all needs against their models without writing any documents."""
+
+    name = "modeling"
+    format = "modeling"
+    epilog = "The model validation report is in %(outdir)s."
+
+    def get_outdated_docs(self) -> Iterable[str]:
+        """Return no documents, as no document gets written."""
+        return []
+
+    def get_target_uri(self, docname: str, typ: Optional[str] = None) -> str:
+        """Return an empty URI, as no document gets written."""
+        return ""
+
+    def prepare_writing(self, docnames: Set[str]) -> None:
+        """Nothing to prepare, as no document gets written."""
+
+    def write(self, build_docnames: Iterable[str], updated_docnames: Sequence[str], method: str = "update") -> None:
+        """
+        Resolve the doctree of the root document, which triggers sphinx-needs and the model check.
+
+        sphinx-needs resolves links and back links of all needs on the first resolved doctree, so resolving
+        one doctree is sufficient.
+        """
+        self.env.get_and_resolve_doctree(self.config.root_doc, self)
+
+    def write_doc(self, docname: str, doctree: nodes.document) -> None:
+        """Do not write any documents."""
+
+
+def write_report(store_path: str, report_path: str) -> None:
+    """
+    Write the report of all failed needs from the result store.
+
+    :param store_path: path to the result store
+    :param report_path: path to the JSON report
+    """
+    report: Dict[str, Any] = {"needs": 0, "failed_needs": 0, "failures": []}
+    if os.path.exists(store_path):
+        with ResultStore(store_path) as store:
+            report["needs"] = store.get_need_count()
+            report["failures"] = [
+                {
+                    "id": failure.need_id,
+                    "docname": failure.docname,
+                    "model": failure.model,
+                    "errors": failure.errors,
+                }
+                for failure in store.iter_failures()
+            ]
+            report["failed_needs"] = len(report["failures"])
+    write_json_atomic(report_path, report)
+    log.info(f"Model validation: {report['failed_needs']} of {report['needs']} needs failed, see {report_path}")
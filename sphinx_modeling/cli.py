@@ -0,0 +1,131 @@
+"""
+Command line interface of sphinx-modeling.
+
+``sphinx-modeling validate needs.json --conf conf.py`` validates a sphinx-needs export against the models of a
+Sphinx configuration without running Sphinx.
+"""
+
+import argparse
+from contextlib import closing
+import logging
+import sys
+from typing import Generator, Iterable, List, Optional
+
+from sphinx.errors import ConfigError
+
+from sphinx_modeling.modeling.errors import FailureReport, NeedFailure
+from sphinx_modeling.modeling.main import PYDANTIC_INSTANCES, get_types_without_model, iter_validation
+from sphinx_modeling.modeling.store import NeedResult
+from sphinx_modeling.standalone import (
+    StandaloneEnv,
+    check_streamable,
+    index_needs,
+    iter_streaming_validation,
+    load_config,
+    load_needs,
+    restore_need_fields,
+)
+
+
+EXIT_FAILED = 1
+"""Exit code if needs failed validation."""
+
+EXIT_ERROR = 2
+"""Exit code if the input could not be read, same as for command line usage errors."""
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line interface and return the exit code."""
+    parser = argparse.ArgumentParser(prog="sphinx-modeling", description=__doc__)
+    parser.add_argument("-v", "--verbose", action="store_true", help="show verbose validation output")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    validate_parser = subparsers.add_parser("validate", help="validate a needs.json file")
+    validate_parser.add_argument("needs_json", help="needs.json file written by the sphinx-needs needs builder")
+    validate_parser.add_argument("--conf", required=True, help="Sphinx conf.py that defines modeling_models")
+    validate_parser.add_argument("--needs-version", help="version to validate, defaults to the current version")
+    validate_parser.add_argument("--fail-fast", type=int, help="overrides modeling_fail_fast")
+    validate_parser.add_argument("--max-messages", type=int, help="overrides modeling_max_messages")
+    validate_parser.add_argument(
+        "--stream", action="store_true", help="read the needs one by one, for files too large to be loaded at once"
+    )
+    args = parser.parse_args(argv)
+
+    # the validation logs through Sphinx loggers, which have no handlers outside of Sphinx
+    logging.basicConfig(format="%(message)s", level=logging.DEBUG if args.verbose else logging.INFO)
+    return validate(args.needs_json, args.conf, args.needs_version, args.fail_fast, args.max_messages, args.stream)
+
+
+def validate(
+    needs_path: str,
+    conf_path: str,
+    version: Optional[str] = None,
+    fail_fast: Optional[int] = None,
+    max_messages: Optional[int] = None,
+    stream: bool = False,
+) -> int:
+    """
+    Validate the needs of a needs.json file and print the messages of failed needs.
+
+    :param needs_path: path to the needs.json file
+    :param conf_path: path to the Sphinx conf.py that defines modeling_models
+    :param version: version to validate, defaults to the current version of the file
+    :param fail_fast: overrides modeling_fail_fast if given
+    :param max_messages: overrides modeling_max_messages if given
+    :param stream: flag to read the needs one by one in two passes instead of loading the whole file
+    :return: exit code
+    """
+    validation: Generator[NeedResult, None, None]
+    try:
+        config = load_config(conf_path)
+        if not config.modeling_models:
+            raise ValueError(f"no modeling_models defined in {conf_path}")
+        # nothing reads the pydantic instances of valid needs on the command line, keeping them only costs memory
+        config.modeling_instances = "off"
+        PYDANTIC_INSTANCES.configure(config.modeling_instances, config.modeling_instances_max_size)
+        link_types = [link["option"] for link in config.needs_extra_links]
+        if stream:
+            check_streamable(config)
+            index = index_needs(needs_path, link_types, version)
+            need_types: Iterable[str] = index.types.values()
+            validation = iter_streaming_validation(needs_path, config, index, version)
+        else:
+            needs = load_needs(needs_path, version)
+            restore_need_fields(needs, link_types)
+            need_types = (need["type"] for need in needs.values())
+            validation = iter_validation(StandaloneEnv(needs, config))  # type: ignore[arg-type]
+    except (ConfigError, OSError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return EXIT_ERROR
+    if fail_fast is not None:
+        config.modeling_fail_fast = fail_fast
+    if max_messages is not None:
+        config.modeling_max_messages = max_messages
+
+    types_without_model = get_types_without_model(need_types, config.modeling_models)
+    for need_type in types_without_model:
+        print(f"Model validation: no model defined for need type '{need_type}'", file=sys.stderr)
+
+    report = FailureReport(config.modeling_max_messages)
+    validated = 0
+    with closing(validation):
+        for result in validation:
+            validated += 1
+            if not result.errors:
+                continue
+            for msg in report.add(NeedFailure(result.need_id, result.model, result.errors, result.docname)):
+                print(msg)
+            if config.modeling_fail_fast and report.count >= config.modeling_fail_fast:
+                print(f"Model validation: stopped after {report.count} failed needs (modeling_fail_fast)")
+                break
+    for line in report.get_summary():
+        print(line)
+
+    if report.count or types_without_model:
+        print(f"Model validation: {report.count} of {validated} validated needs failed")
+        return EXIT_FAILED
+    print("Validation was successful!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
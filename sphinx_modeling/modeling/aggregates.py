@@ -0,0 +1,242 @@
+"""
+Declarative aggregate constraints that span several needs.
+
+Constraints are declared in the ``Config`` of a model and apply to all needs of the model's need type::
+
+    class Story(BaseModelNeeds):
+        class Config:
+            aggregate_constraints = [
+                Unique("title"),
+                LinkCount("links", direction="incoming", need_type="test", min_items=1),
+                NoCycles("links", need_types=["story"]),
+            ]
+
+All constraints get checked in a single pass over hash indexes of the needs, path and cycle constraints in linear
+time over the link graph, see :mod:`sphinx_modeling.modeling.paths`. Violations are reported as
+validation errors of the affected needs, so they show up in the same messages as the errors of the model.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from sphinx_modeling.modeling.errors import ErrorDict
+from sphinx_modeling.modeling.query import NeedsQuery
+
+
+AGGREGATE_ERROR_TYPE = "value_error.aggregate"
+"""Prefix of the error types of aggregate constraints."""
+
+DIRECTIONS = ("outgoing", "incoming")
+"""Supported link directions of :class:`LinkCount`."""
+
+
+class AggregateConstraint(ABC):
+    """Base class of constraints that depend on several needs."""
+
+    @abstractmethod
+    def check(self, need_ids: List[str], query: NeedsQuery) -> Iterator[Tuple[str, ErrorDict]]:
+        """
+        Yield the violations of the constraint.
+
+        :param need_ids: IDs of all needs the constraint applies to
+        :param query: indexed access to all needs
+        :return: pairs of need ID and validation error
+        """
+
+
+class Unique(AggregateConstraint):
+    """Constraint that the value of a field is unique among all needs of a need type."""
+
+    def __init__(self, field: str) -> None:
+        """
+        Create the constraint.
+
+        :param field: need field whose value must be unique, needs without a value are not checked
+        """
+        self.field = field
+
+    def check(self, need_ids: List[str], query: NeedsQuery) -> Iterator[Tuple[str, ErrorDict]]:
+        """Yield an error for each need that shares its value with other needs."""
+        need_ids_by_value: Dict[Any, List[str]] = {}
+        for need_id in need_ids:
+            value = query.get(need_id).get(self.field)  # type: ignore[union-attr]
+            if value not in (None, "", []):
+                need_ids_by_value.setdefault(_hashable(value), []).append(need_id)
+        for value, duplicate_ids in need_ids_by_value.items():
+            if len(duplicate_ids) < 2:
+                continue
+            for need_id in duplicate_ids:
+                others = ", ".join(other_id for other_id in duplicate_ids if other_id != need_id)
+                yield need_id, {
+                    "loc": [self.field],
+                    "msg": f"value is not unique, also used by {others}",
+                    "type": f"{AGGREGATE_ERROR_TYPE}.unique",
+                    "ctx": f"value={value}",
+                }
+
+
+class LinkCount(AggregateConstraint):
+    """Constraint on the number of outgoing or incoming links of a need."""
+
+    def __init__(
+        self,
+        link_type: str = "links",
+        direction: str = "outgoing",
+        need_type: Optional[str] = None,
+        min_items: int = 0,
+        max_items: Optional[int] = None,
+    ) -> None:
+        """
+        Create the constraint.
+
+        :param link_type: link field, e.g. links or an option of needs_extra_links
+        :param direction: count the links of the need (outgoing) or the links to the need (incoming)
+        :param need_type: only count links from or to needs of this type
+        :param min_items: minimum number of links
+        :param max_items: maximum number of links, None means no limit
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction must be one of {', '.join(DIRECTIONS)}, got '{direction}'")
+        self.link_type = link_type
+        self.direction = direction
+        self.need_type = need_type
+        self.min_items = min_items
+        self.max_items = max_items
+
+    def check(self, need_ids: List[str], query: NeedsQuery) -> Iterator[Tuple[str, ErrorDict]]:
+        """Yield an error for each need with too few or too many links."""
+        lookup = query.incoming if self.direction == "incoming" else query.outgoing
+        loc = f"{self.link_type}_back" if self.direction == "incoming" else self.link_type
+        description = f"{self.direction} links of type '{self.link_type}'"
+        if self.need_type is not None:
+            description += f" {'from' if self.direction == 'incoming' else 'to'} {self.need_type} needs"
+        for need_id in need_ids:
+            linked_needs = lookup(need_id, self.link_type)
+            if self.need_type is None:
+                count = len(linked_needs)
+            else:
+                count = sum(1 for need in linked_needs if need["type"] == self.need_type)
+            if count < self.min_items:
+                limit, error_type = self.min_items, "min_items"
+                msg = f"ensure at least {limit} {description}"
+            elif self.max_items is not None and count > self.max_items:
+                limit, error_type = self.max_items, "max_items"
+                msg = f"ensure at most {limit} {description}"
+            else:
+                continue
+            yield need_id, {
+                "loc": [loc],
+                "msg": msg,
+                "type": f"{AGGREGATE_ERROR_TYPE}.{error_type}",
+                "ctx": f"count={count}; limit_value={limit}",
+            }
+
+
+class LinkPath(AggregateConstraint):
+    """Constraint that a need traces over links through needs of the given types, e.g. from a test to a story."""
+
+    def __init__(self, *need_types: str, link_types: Union[str, Sequence[str]] = "links") -> None:
+        """
+        Create the constraint.
+
+        :param need_types: types of the needs along the path, e.g. ``"impl", "spec", "story"``
+        :param link_types: link types the path may follow, ``<type>_back`` follows links of ``<type>`` in reverse
+        """
+        if not need_types:
+            raise ValueError("a link path needs at least one need type")
+        self.need_types = list(need_types)
+        self.link_types = _as_list(link_types)
+
+    def check(self, need_ids: List[str], query: NeedsQuery) -> Iterator[Tuple[str, ErrorDict]]:
+        """Yield an error for each need without such a path."""
+        tracing = query.paths.get_tracing(self.need_types, self.link_types)
+        positions = query.paths.graph.positions
+        path = " -> ".join(self.need_types)
+        for need_id in need_ids:
+            if not tracing[positions[need_id]]:
+                yield need_id, {
+                    "loc": [", ".join(self.link_types)],
+                    "msg": f"ensure a link path to {path}",
+                    "type": f"{AGGREGATE_ERROR_TYPE}.path",
+                    "ctx": f"path={path}",
+                }
+
+
+class NoCycles(AggregateConstraint):
+    """Constraint that a need is not part of a link cycle."""
+
+    def __init__(
+        self, link_types: Union[str, Sequence[str]] = "links", need_types: Optional[Sequence[str]] = None
+    ) -> None:
+        """
+        Create the constraint.
+
+        :param link_types: link types a cycle may follow, ``<type>_back`` follows links of ``<type>`` in reverse
+        :param need_types: only look for cycles between needs of these types, None for all needs
+        """
+        self.link_types = _as_list(link_types)
+        self.need_types = None if need_types is None else list(need_types)
+
+    def check(self, need_ids: List[str], query: NeedsQuery) -> Iterator[Tuple[str, ErrorDict]]:
+        """Yield an error for each need on a cycle."""
+        ids = query.paths.graph.ids
+        checked_ids = set(need_ids)
+        for cycle in query.paths.get_cycles(self.link_types, self.need_types):
+            cycle_ids = [ids[position] for position in cycle]
+            for need_id in cycle_ids:
+                if need_id not in checked_ids:
+                    continue
+                if len(cycle_ids) == 1:
+                    msg = "need links to itself"
+                else:
+                    others = ", ".join(other_id for other_id in cycle_ids if other_id != need_id)
+                    msg = f"need is part of a link cycle with {others}"
+                yield need_id, {
+                    "loc": [", ".join(self.link_types)],
+                    "msg": msg,
+                    "type": f"{AGGREGATE_ERROR_TYPE}.cycle",
+                }
+
+
+def get_aggregate_constraints(model: Type[BaseModel]) -> List[AggregateConstraint]:
+    """Return the aggregate constraints declared in the Config of a model."""
+    return list(getattr(model.__config__, "aggregate_constraints", ()))
+
+
+def get_aggregate_errors(
+    pydantic_models: Mapping[str, Type[BaseModel]], query: NeedsQuery
+) -> Dict[str, List[ErrorDict]]:
+    """
+    Check the aggregate constraints of all models.
+
+    :param pydantic_models: models by need type
+    :param query: indexed access to all needs
+    :return: errors by need ID, only for needs that violate constraints
+    """
+    errors: Dict[str, List[ErrorDict]] = {}
+    for need_type, model in pydantic_models.items():
+        constraints = get_aggregate_constraints(model)
+        if not constraints:
+            continue
+        need_ids = [need["id"] for need in query.by_type(need_type)]
+        for constraint in constraints:
+            for need_id, error in constraint.check(need_ids, query):
+                errors.setdefault(need_id, []).append(error)
+    return errors
+
+
+def remove_aggregate_errors(errors: Iterable[ErrorDict]) -> List[ErrorDict]:
+    """Return the errors without the ones of aggregate constraints, which depend on other needs."""
+    return [error for error in errors if not error["type"].startswith(AGGREGATE_ERROR_TYPE)]
+
+
+def _as_list(link_types: Union[str, Sequence[str]]) -> List[str]:
+    """Return link types as list, a single link type may be given as string."""
+    return [link_types] if isinstance(link_types, str) else list(link_types)
+
+
+def _hashable(value: Any) -> Any:
+    """Return a hashable form of a field value, lists become tuples."""
+    return tuple(value) if isinstance(value, list) else value
@@ -0,0 +1,130 @@
+"""
+Persistent per-need validation cache.
+
+Each need gets a fingerprint that is derived from
+
+- the reduced need dictionary that gets passed to pydantic,
+- a hash of the pydantic model class.
+
+Additionally the digest of each need is stored. Needs whose digest changed invalidate the results of the needs
+that resolve them, see :mod:`sphinx_modeling.modeling.dependencies`.
+
+Validation results of needs with an unchanged fingerprint that do not depend on changed needs are taken from the
+result store of the previous build, see :mod:`sphinx_modeling.modeling.store`.
+"""
+
+from contextlib import suppress
+import hashlib
+import inspect
+import json
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+
+CacheEntries = Dict[str, Tuple[str, List[Any]]]
+"""Mapping of need ID to a tuple of need fingerprint and validation errors."""
+
+JSON_TYPES = (str, int, float, bool, list, dict, type(None))
+"""Types of need fields that are part of the need snapshot."""
+
+
+def _json_default(obj: Any) -> str:
+    """Serialize objects unknown to JSON by their type name only; those are rendering artifacts like nodes."""
+    return type(obj).__name__
+
+
+def _hash(obj: Any) -> str:
+    """Return a stable hash for a JSON serializable object."""
+    return hashlib.sha1(_serialize(obj).encode("utf-8")).hexdigest()
+
+
+def _serialize(obj: Any) -> str:
+    """Return the stable JSON representation of an object."""
+    return json.dumps(obj, sort_keys=True, default=_json_default)
+
+
+def _function_signature(func: Any) -> List[Any]:
+    """Return a hashable representation of a validator function including its code."""
+    func = getattr(func, "__func__", func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return [repr(func)]
+    with suppress(OSError, TypeError):
+        return [func.__qualname__, inspect.getsource(func)]
+    return [func.__qualname__, code.co_code.hex(), repr(code.co_consts)]
+
+
+def get_config_hash(config_values: Iterable[Any]) -> str:
+    """Return a hash of all configuration values that influence validation results."""
+    return _hash(list(config_values))
+
+
+def get_model_hash(model: Type[BaseModel]) -> str:
+    """
+    Return a hash of a pydantic model class.
+
+    The hash covers the JSON schema of the model as well as the code of all field and root validators.
+    """
+    try:
+        schema: Any = model.schema()
+    except Exception:  # pylint: disable=broad-except # schema generation fails for some custom types
+        schema = {name: repr(field) for name, field in model.__fields__.items()}
+    validators = []
+    for field_name, field in sorted(model.__fields__.items()):
+        for validator in field.class_validators.values():
+            validators.append([field_name, _function_signature(validator.func)])
+    for root_validator in model.__pre_root_validators__:
+        validators.append(["__pre_root__", _function_signature(root_validator)])
+    for _, root_validator in model.__post_root_validators__:
+        validators.append(["__post_root__", _function_signature(root_validator)])
+    return _hash([model.__name__, schema, sorted(validators, key=repr)])
+
+
+def get_model_hashes(pydantic_models: Mapping[str, Type[BaseModel]]) -> Dict[str, str]:
+    """Return the hashes of all models by need type."""
+    return {need_type: get_model_hash(model) for need_type, model in pydantic_models.items()}
+
+
+def get_need_digest(need: Dict[str, Any]) -> str:
+    """Return a digest of the content of a need, it equals for the need and its snapshot."""
+    return _hash(_get_need_content(need))
+
+
+def get_need_snapshot(need: Dict[str, Any]) -> str:
+    """Return the content of a need as JSON."""
+    return _serialize(_get_need_content(need))
+
+
+def _get_need_content(need: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the need without rendering artifacts like docutils nodes, they cannot be restored from JSON."""
+    return {key: value for key, value in need.items() if isinstance(value, JSON_TYPES)}
+
+
+def get_changed_types(previous_hashes: Mapping[str, str], model_hashes: Mapping[str, str]) -> List[str]:
+    """Return the need types whose model got added, changed or removed, sorted by name."""
+    return sorted(
+        need_type
+        for need_type in set(previous_hashes) | set(model_hashes)
+        if previous_hashes.get(need_type) != model_hashes.get(need_type)
+    )
+
+
+def get_need_fingerprint(reduced_need: Dict[str, Any], model_hash: str) -> str:
+    """
+    Return the fingerprint of a need which decides whether the cached validation result can be re-used.
+
+    Linked needs are not part of the fingerprint, changes of them are tracked by their digests.
+
+    :param reduced_need: need dictionary as passed to pydantic, link fields still contain need IDs
+    :param model_hash: hash of the pydantic model the need gets validated against
+    """
+    return _hash([reduced_need, model_hash])
+
+
+def get_cached_errors(entries: CacheEntries, need_id: str, fingerprint: str) -> Optional[List[Any]]:
+    """Return cached validation errors for a need if its fingerprint did not change, else None."""
+    entry = entries.get(need_id)
+    if entry is not None and entry[0] == fingerprint:
+        return entry[1]
+    return None
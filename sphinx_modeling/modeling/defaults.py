@@ -25,4 +25,37 @@ MODELING_REMOVE_BACKLINKS = True
 """Flag to remove back-referencing links (e.g. blocks -> blocks_back) before validation."""
 
 MODELING_RESOLVE_LINKS = True
-"""Flag to replace linked need IDs with the linked need dictionary itself."""
+"""Flag to replace linked need IDs with the linked need dictionary itself, 'lazy' resolves links on first access."""
+
+MODELING_CACHE = False
+"""Flag to re-use validation results of unchanged needs from the previous build."""
+
+MODELING_PARALLEL = False
+"""Number of worker processes for validation, True uses all CPU cores and False validates serially."""
+
+MODELING_PARALLEL_CHUNK_SIZE = 500
+"""Number of needs a worker process validates at once."""
+
+MODELING_MEMOIZE_LINKS = False
+"""Flag to validate each linked need only once per link model."""
+
+MODELING_TYPE_ONLY_LINKS = False
+"""Flag to validate links to models that only check the need type against an index of need types."""
+
+MODELING_FAST_CHECK = False
+"""Flag to check needs of models with common constraints in plain Python and skip pydantic for valid ones."""
+
+MODELING_PROFILE = False
+"""Flag to time model instantiation and user validators and write the results to a JSON file."""
+
+MODELING_MAX_MESSAGES = 0
+"""Maximum number of failed needs whose messages get logged, 0 means no limit."""
+
+MODELING_FAIL_FAST = 0
+"""Number of failed needs after which validation stops and the build fails, 0 means no limit."""
+
+MODELING_INSTANCES = "all"
+"""Retention of the pydantic instances of valid needs: 'all', 'lru' (most recently used ones) or 'off'."""
+
+MODELING_INSTANCES_MAX_SIZE = 1000
+"""Maximum number of retained pydantic instances if modeling_instances is 'lru'."""
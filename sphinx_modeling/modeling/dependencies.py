@@ -0,0 +1,133 @@
+"""
+Dependencies of validation results between needs.
+
+With resolved links the validation result of a need depends on the needs it links to, and on the needs that
+link to it if back links are kept. Nested link models pass this on to the needs linked by the linked needs,
+up to the depth the models resolve.
+
+The incoming links of each link field in the :class:`~sphinx_modeling.modeling.graph.LinkGraph` serve as
+reverse dependency index. After a change only the changed needs and their transitive dependents up to the
+resolution depth of the dependent's model get validated again, see :func:`get_dependents`.
+"""
+
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Set, Type
+
+from pydantic import BaseModel, Extra
+from pydantic.typing import is_literal_type
+from pydantic.utils import lenient_issubclass
+
+from sphinx_modeling.modeling.graph import LinkGraph
+from sphinx_modeling.modeling.plan import ValidationPlan
+from sphinx_modeling.modeling.type_links import _get_leaf_fields
+
+
+SCALAR_TYPES = (str, int, float, bool)
+"""Leaf types of link fields that hold linked need IDs, their value does not depend on the linked needs."""
+
+
+def get_changed_needs(digests: Mapping[str, str], previous_digests: Mapping[str, str]) -> Set[str]:
+    """Return the IDs of all needs that were added, changed or removed since the previous build."""
+    changed = {need_id for need_id, digest in digests.items() if previous_digests.get(need_id) != digest}
+    changed.update(need_id for need_id in previous_digests if need_id not in digests)
+    return changed
+
+
+def get_dependents(
+    graph: LinkGraph,
+    link_fields: Iterable[str],
+    changed: Iterable[str],
+    resolved_fields: Mapping[str, FrozenSet[str]],
+    depths: Mapping[str, Optional[int]],
+) -> Set[str]:
+    """
+    Return the IDs of the needs whose validation result depends on a changed need.
+
+    Needs that are linked by a need get resolved with all their link fields, so the search follows all link
+    fields up to the largest depth. The last step towards a dependent only follows its resolved link fields.
+
+    :param link_fields: names of all link fields including back links and parent_need
+    :param changed: IDs of the changed needs, removed needs included
+    :param resolved_fields: link fields that get resolved into the needs, by need type
+    :param depths: resolution depth by need type, None if the depth is unbounded; types without a model are missing
+    """
+    link_fields = list(link_fields)
+    ids = graph.ids
+    if all(depth == 0 for depth in depths.values()):
+        return set()
+    max_distance: Optional[int] = None
+    if None not in depths.values():
+        max_distance = max(depth for depth in depths.values() if depth is not None) - 1
+
+    # number of links from a need to the nearest changed need
+    distances: Dict[str, int] = dict.fromkeys(changed, 0)
+    current = list(distances)
+    distance = 0
+    while current and (max_distance is None or distance < max_distance):
+        distance += 1
+        following = []
+        for need_id in current:
+            for field in link_fields:
+                for source in graph.iter_sources(field, need_id):
+                    if ids[source] not in distances:
+                        distances[ids[source]] = distance
+                        following.append(ids[source])
+        current = following
+
+    dependents: Set[str] = set()
+    for need_id, distance in distances.items():
+        for field in link_fields:
+            for source in graph.iter_sources(field, need_id):
+                linking_id = ids[source]
+                need_type = graph.needs[linking_id]["type"]
+                if need_type not in depths or field not in resolved_fields[need_type]:
+                    continue
+                depth = depths[need_type]
+                if depth is None or distance < depth:
+                    dependents.add(linking_id)
+    return dependents
+
+
+def get_resolved_fields(plan: ValidationPlan, link_fields: Iterable[str]) -> FrozenSet[str]:
+    """
+    Return the link fields whose linked needs get passed to the model of a plan.
+
+    Models that do not allow extra fields only read the link fields they declare.
+    """
+    fields = frozenset(link_fields) - plan.remove_fields - (plan.back_link_types - plan.model_fields)
+    if plan.model.__config__.extra != Extra.allow:
+        fields &= plan.model_fields
+    return fields
+
+
+def get_resolution_depth(model: Type[BaseModel], link_fields: Iterable[str]) -> Optional[int]:
+    """
+    Return how many links deep the validation of a model reads linked needs.
+
+    Link fields with nested models add the depth of the nested model, link fields with other types than models,
+    literals and scalars as well as models that allow extra fields make the depth unbounded.
+
+    :param link_fields: names of all link fields including back links and parent_need
+    :return: the depth, 0 if the model has no link fields, None if it is unbounded
+    """
+    return _get_depth(model, frozenset(link_fields), set())
+
+
+def _get_depth(model: Type[BaseModel], link_fields: FrozenSet[str], visiting: Set[Type[BaseModel]]) -> Optional[int]:
+    """Return the resolution depth of a model, models that link to themselves are unbounded."""
+    if model in visiting or model.__config__.extra == Extra.allow:
+        return None
+    visiting.add(model)
+    depth = 0
+    for name in link_fields & set(model.__fields__):
+        for leaf in _get_leaf_fields(model.__fields__[name]):
+            if lenient_issubclass(leaf.type_, BaseModel):
+                nested_depth = _get_depth(leaf.type_, link_fields, visiting)
+                if nested_depth is None:
+                    return None
+                depth = max(depth, nested_depth + 1)
+            elif lenient_issubclass(leaf.type_, SCALAR_TYPES) or is_literal_type(leaf.type_):
+                depth = max(depth, 1)
+            else:
+                return None
+    visiting.discard(model)
+    return depth
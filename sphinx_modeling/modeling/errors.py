@@ -0,0 +1,122 @@
+"""
+Structured validation errors.
+
+Validation errors are kept in the structure of pydantic's ``ValidationError.errors()`` and only get rendered
+to text for the messages that are actually shown. The rendered text equals ``str(ValidationError)``.
+
+Errors are JSON serializable, so they can be stored in the result store.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from pydantic import ValidationError
+from sphinx.errors import SphinxError
+
+
+ErrorDict = Dict[str, Any]
+"""Single validation error with the keys loc, msg, type and optionally ctx (the rendered error context)."""
+
+EXCEPTION_ERROR_TYPE = "exception"
+"""Error type of exceptions other than ValidationError, e.g. raised by user validators."""
+
+SUMMARY_SAMPLES = 3
+"""Number of sample need IDs shown per group in the summary."""
+
+
+class ModelingError(SphinxError):
+    """Error that stops the Sphinx build, e.g. once modeling_fail_fast is reached."""
+
+    category = "Model validation error"
+
+
+class NeedFailure(NamedTuple):
+    """Validation errors of a single need."""
+
+    need_id: str
+    model: str
+    errors: List[ErrorDict]
+    docname: Optional[str] = None
+
+
+def get_validation_errors(exc: ValidationError) -> List[ErrorDict]:
+    """
+    Return the errors of a ValidationError in a JSON serializable form.
+
+    The error context gets rendered right away as its values may be arbitrary objects.
+    """
+    errors = []
+    for error in exc.errors():
+        error_dict: ErrorDict = {"loc": list(error["loc"]), "msg": error["msg"], "type": error["type"]}
+        if error.get("ctx"):
+            error_dict["ctx"] = "; ".join(f"{key}={value}" for key, value in error["ctx"].items())
+        errors.append(error_dict)
+    return errors
+
+
+def get_exception_errors(exc: Exception) -> List[ErrorDict]:
+    """Return an exception that is not a ValidationError as single error."""
+    return [{"loc": [], "msg": repr(exc), "type": EXCEPTION_ERROR_TYPE}]
+
+
+def render_messages(failure: NeedFailure) -> List[str]:
+    """Render the messages of a failed need as they get logged."""
+    messages = [f"Model validation: failed for need {failure.need_id}"]
+    if failure.errors and failure.errors[0]["type"] == EXCEPTION_ERROR_TYPE:
+        messages.append(failure.errors[0]["msg"])
+        return messages
+    count = len(failure.errors)
+    lines = [f"{count} validation error{'' if count == 1 else 's'} for {failure.model}"]
+    for error in failure.errors:
+        error_type = f"type={error['type']}"
+        if error.get("ctx"):
+            error_type += f"; {error['ctx']}"
+        lines.append(" -> ".join(str(loc) for loc in error["loc"]))
+        lines.append(f"  {error['msg']} ({error_type})")
+    messages.append("\n".join(lines))
+    return messages
+
+
+class FailureReport:
+    """
+    Report of failed needs that renders the messages of the first failed needs as they come in.
+
+    If more needs fail, all failures get summarized instead. Identical failures are grouped by model,
+    error location and error type. List indices in the error location are replaced by ``*``,
+    so errors of different list items fall into the same group.
+    """
+
+    def __init__(self, max_messages: int) -> None:
+        """
+        Create an empty report.
+
+        :param max_messages: maximum number of failed needs whose messages get rendered, 0 means no limit
+        """
+        self.max_messages = max_messages
+        self.count = 0
+        """Number of failed needs."""
+        self._groups: Dict[Tuple[str, str, str], List[str]] = {}
+
+    def add(self, failure: NeedFailure) -> List[str]:
+        """Add a failed need and return its rendered messages, which are empty if the limit is reached."""
+        self.count += 1
+        for error in failure.errors:
+            loc = " -> ".join("*" if isinstance(loc, int) else str(loc) for loc in error["loc"])
+            need_ids = self._groups.setdefault((failure.model, loc, error["type"]), [])
+            if not need_ids or need_ids[-1] != failure.need_id:
+                need_ids.append(failure.need_id)
+        if self.max_messages and self.count > self.max_messages:
+            return []
+        return render_messages(failure)
+
+    def get_summary(self) -> List[str]:
+        """Return the summary lines of all failures, they are empty if all messages were rendered."""
+        if not self.max_messages or self.count <= self.max_messages:
+            return []
+        summary = [
+            f"Model validation: {self.count} needs failed, messages of {self.count - self.max_messages} needs "
+            f"are not shown (see modeling_max_messages)"
+        ]
+        for (model, loc, error_type), need_ids in sorted(self._groups.items(), key=lambda item: -len(item[1])):
+            samples = ", ".join(need_ids[:SUMMARY_SAMPLES]) + (", ..." if len(need_ids) > SUMMARY_SAMPLES else "")
+            summary.append(f"  {model} {loc or '-'} ({error_type}): {len(need_ids)} needs, e.g. {samples}")
+        return summary
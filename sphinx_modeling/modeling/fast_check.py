@@ -0,0 +1,180 @@
+"""
+Plain Python pre-check of needs against models that only use common constraints.
+
+Most model fields are ``Literal[...]``, ``constr(regex=...)``, ``conlist(...)``, type-only link models or
+``Optional`` variants of those. For models without validators that only use such fields, a checker gets compiled
+once per build with precompiled regular expressions and frozenset membership tests. A need that passes the checker
+is valid without creating the pydantic instance. Needs that fail it are validated by pydantic, so the error
+messages stay the same.
+
+The checker only accepts values that pydantic accepts unchanged, it never accepts a need pydantic would reject.
+Models with anything else, like other field types, validators, aliases or ``Config`` options that change strings,
+do not get a checker.
+"""
+
+import re
+from typing import Any, Callable, List, Mapping, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConstrainedList, ConstrainedStr, Extra
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.typing import all_literal_values, is_literal_type
+from pydantic.utils import lenient_issubclass
+
+from sphinx_modeling.modeling.plan import Checker, _is_remove_context
+from sphinx_modeling.modeling.type_links import is_type_only_model
+
+
+TypeIndex = Optional[Mapping[str, str]]
+ValueChecker = Callable[[Any, TypeIndex], bool]
+
+
+def compile_checker(model: Type[BaseModel]) -> Optional[Checker]:
+    """
+    Compile the pre-check of a model.
+
+    :param model: user defined pydantic model
+    :return: function that takes the reduced need and the need type index of type-only links (None if links are
+             resolved) and returns whether the need is valid; None if the model uses unsupported constructs
+    """
+    if not _has_plain_validation(model):
+        return None
+    field_checks: List[Tuple[str, bool, bool, ValueChecker]] = []
+    for name, field in model.__fields__.items():
+        value_check = _compile_field(field)
+        if field.alias != name or value_check is None:
+            return None
+        field_checks.append((name, bool(field.required), field.allow_none, value_check))
+    field_names = frozenset(model.__fields__)
+    forbid_extra = model.__config__.extra == Extra.forbid
+
+    def check(values: Mapping[str, Any], type_index: TypeIndex = None) -> bool:
+        if forbid_extra and not field_names.issuperset(values):
+            return False
+        try:
+            for name, required, allow_none, value_check in field_checks:
+                if name not in values:
+                    if required:
+                        return False
+                elif values[name] is None:
+                    if not allow_none:
+                        return False
+                elif not value_check(values[name], type_index):
+                    return False
+        except TypeError:  # unhashable values in literal checks
+            return False
+        return True
+
+    return check
+
+
+def _has_plain_validation(model: Type[BaseModel]) -> bool:
+    """Check that a model has no validators and no Config options that change the validation of strings."""
+    config = model.__config__
+    return (
+        not model.__validators__
+        and not model.__pre_root_validators__
+        and all(_is_remove_context(validator[1]) for validator in model.__post_root_validators__)
+        and not getattr(model, "__custom_root_type__", False)
+        and not config.validate_all
+        and not config.anystr_strip_whitespace
+        and not config.anystr_lower
+        and not getattr(config, "anystr_upper", False)
+        and not config.min_anystr_length
+        and config.max_anystr_length is None
+    )
+
+
+def _compile_field(field: ModelField) -> Optional[ValueChecker]:
+    """Compile the check of a field value that is not None, None if the field is not supported."""
+    if field.shape == SHAPE_SINGLETON and not field.sub_fields:
+        return _compile_type(field.type_)
+    if field.shape != SHAPE_LIST or not field.sub_fields:
+        return None
+    min_items: Optional[int] = None
+    max_items: Optional[int] = None
+    if lenient_issubclass(field.outer_type_, ConstrainedList):
+        if field.outer_type_.unique_items or not _has_builtin_validation(field.outer_type_, ConstrainedList):
+            return None
+        min_items, max_items = field.outer_type_.min_items, field.outer_type_.max_items
+    item_field = field.sub_fields[0]
+    item_check = _compile_field(item_field)
+    if item_check is None:
+        return None
+    allow_none_items = item_field.allow_none
+
+    def check_list(value: Any, type_index: TypeIndex) -> bool:
+        if not isinstance(value, list):
+            return False
+        if (min_items is not None and len(value) < min_items) or (max_items is not None and len(value) > max_items):
+            return False
+        for item in value:
+            if item is None:
+                if not allow_none_items:
+                    return False
+            elif not item_check(item, type_index):
+                return False
+        return True
+
+    return check_list
+
+
+def _compile_type(type_: Any) -> Optional[ValueChecker]:
+    """Compile the check of a single value of a type, None if the type is not supported."""
+    if type_ is Any:
+        return lambda value, type_index: True
+    if is_literal_type(type_):
+        permitted = frozenset(all_literal_values(type_))
+        return lambda value, type_index: value in permitted
+    if type_ is str:
+        return lambda value, type_index: isinstance(value, str)
+    if lenient_issubclass(type_, ConstrainedStr):
+        return _compile_constr(type_)
+    if is_type_only_model(type_):
+        return _compile_type_only_model(type_)
+    return None
+
+
+def _compile_constr(type_: Type[ConstrainedStr]) -> Optional[ValueChecker]:
+    """Compile the check of a constr type, types that change the string are not supported."""
+    if (
+        not _has_builtin_validation(type_, ConstrainedStr)
+        or type_.strip_whitespace
+        or type_.to_lower
+        or getattr(type_, "to_upper", False)
+        or type_.curtail_length is not None
+    ):
+        return None
+    min_length = type_.min_length or 0
+    max_length = type_.max_length
+    match = re.compile(type_.regex).match if type_.regex is not None else None
+
+    def check_constr(value: Any, type_index: TypeIndex) -> bool:
+        return (
+            isinstance(value, str)
+            and len(value) >= min_length
+            and (max_length is None or len(value) <= max_length)
+            and (match is None or match(value) is not None)
+        )
+
+    return check_constr
+
+
+def _compile_type_only_model(model: Type[BaseModel]) -> ValueChecker:
+    """Compile the check of a type-only link model, linked needs are resolved or checked by the need type index."""
+    permitted = frozenset(all_literal_values(model.__fields__["type"].outer_type_))
+
+    def check_link(value: Any, type_index: TypeIndex) -> bool:
+        if isinstance(value, str):
+            return type_index is not None and type_index.get(value) in permitted
+        return isinstance(value, Mapping) and value.get("type") in permitted
+
+    return check_link
+
+
+def _has_builtin_validation(type_: Any, base: Any) -> bool:
+    """Check that a constrained type does not override a class method of its pydantic base class."""
+    return all(
+        getattr(type_, name).__func__ is method.__func__
+        for name, method in vars(base).items()
+        if isinstance(method, classmethod)
+    )
@@ -0,0 +1,27 @@
+"""Helpers to write output files."""
+
+from contextlib import suppress
+import json
+import os
+import tempfile
+from typing import Any
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """
+    Write a JSON file atomically, so readers never see a partially written file.
+
+    The data is written to a temporary file in the same directory, which then replaces the target file.
+    Missing directories get created.
+    """
+    dir_name = os.path.dirname(os.path.abspath(path))
+    os.makedirs(dir_name, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            json.dump(data, fp, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,177 @@
+"""
+Compact adjacency of need links.
+
+Need IDs get interned to integer positions and the links of each link field are kept in compressed sparse row
+(CSR) format: the link targets of the need at position ``i`` are ``targets[offsets[i]:offsets[i + 1]]``.
+
+A link field is read from the needs once on its first use. The arrays are then shared by link resolution,
+need queries and dependency tracking; incoming links are derived from the same arrays without reading the
+needs again.
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+
+Adjacency = Tuple["array[int]", "array[int]"]
+"""Offsets and targets of a CSR adjacency."""
+
+
+class LinkGraph:
+    """Links of all needs by link field, with need IDs interned to integer positions."""
+
+    def __init__(self, needs: Mapping[str, Mapping[str, Any]]) -> None:
+        """
+        Intern the IDs of all needs, link fields are read on first use.
+
+        :param needs: all sphinx-needs needs, they must not change while the graph is used
+        """
+        self.needs = needs
+        self.ids: List[str] = list(needs)
+        """Interned IDs, the needs come first in need order, followed by link targets that are no needs."""
+        self.need_count = len(self.ids)
+        self.positions: Dict[str, int] = {need_id: position for position, need_id in enumerate(self.ids)}
+        self._outgoing: Dict[str, Adjacency] = {}
+        self._incoming: Dict[str, Adjacency] = {}
+        self._outgoing_needs: Dict[str, Adjacency] = {}
+        self._incoming_needs: Dict[str, Adjacency] = {}
+        self._need_positions = array("i")
+
+    def is_need(self, position: int) -> bool:
+        """Check whether an interned ID is the ID of a need."""
+        return position < self.need_count
+
+    def get_adjacency(self, field: str) -> Adjacency:
+        """Return offsets and interned targets of a link field, the offsets are indexed by need position."""
+        return self._get_outgoing(field)
+
+    def iter_targets(self, field: str, need_id: str) -> Iterator[int]:
+        """Yield the interned link targets of a need in link order, including links to unknown IDs."""
+        offsets, targets = self._get_outgoing(field)
+        position = self.positions[need_id]
+        return iter(targets[offsets[position] : offsets[position + 1]])  # noqa: E203
+
+    def iter_sources(self, field: str, target: str) -> Iterator[int]:
+        """Yield the positions of the needs that link to the given ID, each need once."""
+        adjacency = self._get_incoming(field)
+        position = self.positions.get(target)
+        if position is None:
+            return iter(())
+        return self._iter_sources(adjacency, position)
+
+    def iter_need_targets(self, field: str, need_id: str) -> Iterator[int]:
+        """Yield the positions of the needs a need links to, links to need parts count as links to the need."""
+        for target in self.iter_targets(field, need_id):
+            position = self._get_need_position(target)
+            if position >= 0:
+                yield position
+
+    def iter_need_sources(self, field: str, need_id: str) -> Iterator[int]:
+        """Yield the positions of the needs that link to a need or its parts, each need once."""
+        if need_id not in self.positions or not self.is_need(self.positions[need_id]):
+            return iter(())
+        return self._iter_sources(self.get_need_adjacency(field, incoming=True), self.positions[need_id])
+
+    def get_need_adjacency(self, field: str, incoming: bool = False) -> Adjacency:
+        """
+        Return the adjacency of a link field between needs, indexed and targeting need positions only.
+
+        Links to need parts count as links to the need, links to unknown IDs are dropped.
+
+        :param incoming: return the inverted adjacency, the sources of each need are in ascending order
+        """
+        cache = self._incoming_needs if incoming else self._outgoing_needs
+        adjacency = cache.get(field)
+        if adjacency is None:
+            if incoming:
+                offsets, targets = self.get_need_adjacency(field)
+                adjacency = _invert(offsets, targets, self.need_count)
+            else:
+                offsets, targets = self._get_outgoing(field)
+                need_offsets = array("i", [0])
+                need_targets = array("i")
+                for source in range(self.need_count):
+                    for target in targets[offsets[source] : offsets[source + 1]]:  # noqa: E203
+                        need_position = self._get_need_position(target)
+                        if need_position >= 0:
+                            need_targets.append(need_position)
+                    need_offsets.append(len(need_targets))
+                adjacency = (need_offsets, need_targets)
+            cache[field] = adjacency
+        return adjacency
+
+    def _get_outgoing(self, field: str) -> Adjacency:
+        """Return the adjacency of a link field, it is created in a single pass over all needs."""
+        adjacency = self._outgoing.get(field)
+        if adjacency is not None:
+            return adjacency
+        offsets = array("i", [0])
+        targets = array("i")
+        ids = self.ids
+        positions = self.positions
+        for need in self.needs.values():
+            value = need.get(field)
+            if value:
+                for link_target in [value] if isinstance(value, str) else value:
+                    position = positions.get(link_target)
+                    if position is None:
+                        position = positions[link_target] = len(ids)
+                        ids.append(link_target)
+                    targets.append(position)
+            offsets.append(len(targets))
+        adjacency = self._outgoing[field] = (offsets, targets)
+        return adjacency
+
+    def _get_incoming(self, field: str) -> Adjacency:
+        """Return the inverted adjacency of a link field."""
+        adjacency = self._incoming.get(field)
+        if adjacency is None:
+            offsets, targets = self._get_outgoing(field)
+            adjacency = self._incoming[field] = _invert(offsets, targets, len(self.ids))
+        return adjacency
+
+    def _get_need_position(self, position: int) -> int:
+        """Return the position of the need an interned ID belongs to, -1 if it is no need or need part."""
+        need_positions = self._need_positions
+        while len(need_positions) <= position:
+            need_id = self.ids[len(need_positions)].split(".")[0]
+            need_position = self.positions.get(need_id, -1)
+            need_positions.append(need_position if 0 <= need_position < self.need_count else -1)
+        return need_positions[position]
+
+    @staticmethod
+    def _iter_sources(adjacency: Adjacency, position: int) -> Iterator[int]:
+        """Yield the sources of an inverted adjacency, consecutive duplicates are skipped."""
+        offsets, sources = adjacency
+        if position + 1 >= len(offsets):
+            return  # the ID was interned after the adjacency was inverted, no link of the field targets it
+        previous = -1
+        for source in sources[offsets[position] : offsets[position + 1]]:  # noqa: E203
+            if source != previous:
+                yield source
+                previous = source
+
+
+def _invert(offsets: "array[int]", targets: Sequence[int], size: int) -> Adjacency:
+    """
+    Invert an adjacency by counting sort, sources of each target stay in ascending order.
+
+    :param targets: target of each link, negative targets are skipped
+    :param size: number of possible targets
+    """
+    counts = [0] * (size + 1)
+    for target in targets:
+        if target >= 0:
+            counts[target + 1] += 1
+    for position in range(size):
+        counts[position + 1] += counts[position]
+    inverted_offsets = array("i", counts)
+    sources = array("i", bytes(inverted_offsets.itemsize * counts[size]))
+    fill = counts[:size]
+    for source in range(len(offsets) - 1):
+        for link in range(offsets[source], offsets[source + 1]):
+            target = targets[link]
+            if target >= 0:
+                sources[fill[target]] = source
+                fill[target] += 1
+    return inverted_offsets, sources
@@ -0,0 +1,76 @@
+"""
+Retention of the pydantic instances created during validation.
+
+Each valid need results in a pydantic instance including its resolved links. Keeping all of them costs memory
+for the whole life of the process, e.g. in long-running sphinx-autobuild sessions. The store therefore keeps
+either all instances, a bounded number of the most recently used ones or none at all.
+Instances that are not retained can be rebuilt with :func:`sphinx_modeling.modeling.main.get_instance`.
+"""
+
+from collections import OrderedDict
+from typing import Any, Iterator, MutableMapping
+
+from sphinx_modeling.modeling.errors import ModelingError
+
+
+INSTANCE_MODES = ("all", "lru", "off")
+"""Supported values of modeling_instances."""
+
+
+class InstanceStore(MutableMapping[str, Any]):
+    """Mapping of need ID to pydantic instance that applies the configured retention mode."""
+
+    def __init__(self, mode: str = "all", max_size: int = 0) -> None:
+        """
+        Create an empty store.
+
+        :param mode: retention mode, see :data:`INSTANCE_MODES`
+        :param max_size: maximum number of retained instances in mode ``lru``
+        """
+        self.mode = "all"
+        self.max_size = 0
+        self._instances: "OrderedDict[str, Any]" = OrderedDict()
+        self.configure(mode, max_size)
+
+    def configure(self, mode: str, max_size: int) -> None:
+        """
+        Set the retention mode and drop all retained instances.
+
+        :raises ModelingError: if the mode is not supported or the maximum size of mode ``lru`` is not positive
+        """
+        if mode not in INSTANCE_MODES:
+            raise ModelingError(f"modeling_instances must be one of {', '.join(INSTANCE_MODES)}, got '{mode}'")
+        if mode == "lru" and max_size <= 0:
+            raise ModelingError(f"modeling_instances_max_size must be positive for mode 'lru', got {max_size}")
+        self.mode = mode
+        self.max_size = max_size
+        self._instances.clear()
+
+    def __getitem__(self, need_id: str) -> Any:
+        """Return the instance of a need, it becomes the most recently used one."""
+        instance = self._instances[need_id]
+        if self.mode == "lru":
+            self._instances.move_to_end(need_id)
+        return instance
+
+    def __setitem__(self, need_id: str, instance: Any) -> None:
+        """Retain an instance according to the retention mode."""
+        if self.mode == "off":
+            return
+        self._instances[need_id] = instance
+        if self.mode == "lru":
+            self._instances.move_to_end(need_id)
+            if len(self._instances) > self.max_size:
+                self._instances.popitem(last=False)
+
+    def __delitem__(self, need_id: str) -> None:
+        """Drop the instance of a need."""
+        del self._instances[need_id]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the IDs of all retained instances."""
+        return iter(self._instances)
+
+    def __len__(self) -> int:
+        """Return the number of retained instances."""
+        return len(self._instances)
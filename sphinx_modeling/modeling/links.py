@@ -0,0 +1,157 @@
+"""
+Resolution of need links.
+
+Sphinx-Needs stores need links as lists of need IDs. For validation those IDs get replaced with the linked need.
+The replacement happens in a separate overlay layer, so the sphinx-needs data is neither mutated nor copied.
+
+Links can either be resolved eagerly for all needs upfront or lazily once a link field gets read.
+"""
+
+from typing import Any, Dict, Iterator, Mapping, Optional, Set
+
+from sphinx_modeling.modeling.graph import LinkGraph
+
+
+class NeedView(Mapping[str, Any]):
+    """
+    Read-only view on a sphinx-needs need dictionary.
+
+    Fields in the overlay layer shadow the fields of the underlying need.
+    It is used to hold resolved link fields.
+    """
+
+    __slots__ = ("need", "layer")
+
+    def __init__(self, need: Dict[str, Any]) -> None:
+        """Create the view with an empty overlay layer."""
+        self.need = need
+        self.layer: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the overlay value if it exists, else the need value."""
+        if key in self.layer:
+            return self.layer[key]
+        return self.need[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the need fields, the overlay never adds new fields."""
+        return iter(self.need)
+
+    def __len__(self) -> int:
+        """Return the number of need fields."""
+        return len(self.need)
+
+    def __repr__(self) -> str:
+        """Return a short representation, the full view can be a cyclic graph."""
+        return f"NeedView({self.need.get('id')!r})"
+
+
+def resolve_needs(
+    needs: Dict[str, Dict[str, Any]], all_link_types: Set[str], graph: Optional[LinkGraph] = None
+) -> Dict[str, NeedView]:
+    """
+    Create views for all needs with resolved link fields.
+
+    The links are taken from the adjacency of the link graph, so the needs are only read once per link field.
+
+    :param needs: all sphinx-needs needs, they are not modified
+    :param all_link_types: names of all link fields including backlinks
+    :param graph: link graph of the needs, it gets created if not given
+    :return: mapping of need ID to need view
+    """
+    if graph is None:
+        graph = LinkGraph(needs)
+    views = {need_id: NeedView(need) for need_id, need in needs.items()}
+    view_list = list(views.values())  # views by need position
+    need_count = len(view_list)
+    for field in sorted(all_link_types | {"parent_need"}):
+        offsets, targets = graph.get_adjacency(field)
+        for position, view in enumerate(view_list):
+            start, end = offsets[position], offsets[position + 1]
+            if start == end:
+                continue
+            if field == "parent_need":
+                if targets[start] < need_count:
+                    view.layer[field] = view_list[targets[start]]
+            else:
+                view.layer[field] = [view_list[target] for target in targets[start:end] if target < need_count]
+    return views
+
+
+class LazyNeedView(NeedView):
+    """
+    Need view that resolves link fields on first access.
+
+    Linked needs are lazy views themselves, so resolution only follows the links that actually get read.
+    """
+
+    __slots__ = ("views", "all_link_types")
+
+    def __init__(self, need: Dict[str, Any], views: "LazyNeedViews", all_link_types: Set[str]) -> None:
+        """Create the view, links get resolved from the given views."""
+        super().__init__(need)
+        self.views = views
+        self.all_link_types = all_link_types
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the need value, link fields get resolved and stored in the overlay layer."""
+        if key in self.layer:
+            return self.layer[key]
+        value = self.need[key]
+        resolved = _resolve_link_field(key, value, self.views, self.all_link_types)
+        if resolved is not None:
+            self.layer[key] = resolved
+            return resolved
+        return value
+
+
+class LazyNeedViews(Mapping[str, NeedView]):
+    """Mapping of need ID to lazy need views which get created on first access."""
+
+    def __init__(self, needs: Dict[str, Dict[str, Any]], all_link_types: Set[str]) -> None:
+        """
+        Create the mapping.
+
+        :param needs: all sphinx-needs needs, they are not modified
+        :param all_link_types: names of all link fields including backlinks
+        """
+        self.needs = needs
+        self.all_link_types = all_link_types
+        self.views: Dict[str, LazyNeedView] = {}
+
+    def __getitem__(self, need_id: str) -> LazyNeedView:
+        """Return the view of a need, it gets created on first access."""
+        view = self.views.get(need_id)
+        if view is None:
+            view = self.views[need_id] = LazyNeedView(self.needs[need_id], self, self.all_link_types)
+        return view
+
+    def __contains__(self, need_id: object) -> bool:
+        """Check the need existence without creating a view."""
+        return need_id in self.needs
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all need IDs."""
+        return iter(self.needs)
+
+    def __len__(self) -> int:
+        """Return the number of needs."""
+        return len(self.needs)
+
+
+def _resolve_link_field(field: str, value: Any, views: Mapping[str, NeedView], all_link_types: Set[str]) -> Any:
+    """
+    Resolve a single need field.
+
+    Link fields hold a list of need IDs, the special field parent_need holds a single need ID.
+    Link targets that do not exist are removed.
+
+    :return: the resolved value or None if the field is no link field or holds no link
+    """
+    if not value:
+        return None
+    if field in all_link_types:
+        return [views[link_target] for link_target in value if link_target in views]
+    if field == "parent_need" and value in views:
+        return views[value]
+    return None
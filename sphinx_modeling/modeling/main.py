@@ -5,20 +5,53 @@ It contains some mypy '# type: ignore' which are used for Sphinx environment fie
 They are unknown to mypy as they are dynamically created.
 """
 
-from contextlib import suppress
-import copy
+from contextlib import ExitStack, closing, suppress
 import os
-import pickle
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
 
 from pydantic import BaseModel, ValidationError, root_validator
 from pydantic.fields import ModelField
 from sphinx.environment import BuildEnvironment
 
 from sphinx_modeling.logging import get_logger
-
-
-PYDANTIC_INSTANCES: Dict[str, Any] = {}  # fully created Pydantic instances
+from sphinx_modeling.modeling.aggregates import get_aggregate_errors, remove_aggregate_errors
+from sphinx_modeling.modeling.cache import (
+    CacheEntries,
+    get_cached_errors,
+    get_config_hash,
+    get_model_hash,
+    get_model_hashes,
+    get_need_digest,
+    get_need_fingerprint,
+)
+from sphinx_modeling.modeling.dependencies import (
+    get_changed_needs,
+    get_dependents,
+    get_resolution_depth,
+    get_resolved_fields,
+)
+from sphinx_modeling.modeling.errors import (
+    ErrorDict,
+    FailureReport,
+    ModelingError,
+    NeedFailure,
+    get_exception_errors,
+    get_validation_errors,
+)
+from sphinx_modeling.modeling.fast_check import compile_checker
+from sphinx_modeling.modeling.graph import LinkGraph
+from sphinx_modeling.modeling.instances import InstanceStore
+from sphinx_modeling.modeling.links import LazyNeedViews, resolve_needs
+from sphinx_modeling.modeling.memo import LinkValidationMemo
+from sphinx_modeling.modeling.parallel import get_worker_count, is_parallel_supported, validate_parallel
+from sphinx_modeling.modeling.plan import ValidationPlan
+from sphinx_modeling.modeling.profile import ValidationProfile
+from sphinx_modeling.modeling.query import NeedsQuery
+from sphinx_modeling.modeling.store import NeedResult, ResultStore
+from sphinx_modeling.modeling.type_links import TypeIndexValidation, get_id_link_fields, get_type_index, keep_link_ids
+
+
+PYDANTIC_INSTANCES = InstanceStore()  # fully created Pydantic instances, retained as per modeling_instances
 log = get_logger(__name__)
 
 
@@ -34,6 +67,7 @@ class BaseModelNeeds(BaseModel):
 
     all_needs: Any
     env: Any
+    needs_query: Any
 
     @root_validator()
     def remove_context(cls, values: Dict[str, ModelField]) -> Dict[str, ModelField]:  # noqa: N805
@@ -44,168 +78,409 @@ class BaseModelNeeds(BaseModel):
         """
         del values["all_needs"]
         del values["env"]
+        del values["needs_query"]
         return values
 
 
-def check_model(env: BuildEnvironment, msg_path: str) -> None:
+def check_model(env: BuildEnvironment, store_path: str, profile_path: Optional[str] = None) -> None:
     """
     Check all needs against a user defined pydantic model.
 
+    Messages of failed needs get logged as soon as the need was validated.
+
     :param env: Sphinx environment, source of all needs to be made available for validation
+    :param store_path: path to the result store, it also serves as cache if modeling_cache is active
+    :param profile_path: path to the JSON profile file, only used if modeling_profile is active
+    :raises ModelingError: if modeling_fail_fast is active and the given number of needs failed
     """
     # Only perform calculation if not already done yet
     if env.needs_modeling_workflow["models_checked"]:  # type: ignore
         return
 
-    # remove outdated messages file
-    with suppress(OSError):
-        os.remove(msg_path)
+    pydantic_models = env.config.modeling_models
+    # instances of the previous run may belong to changed or removed needs
+    PYDANTIC_INSTANCES.configure(env.config.modeling_instances, env.config.modeling_instances_max_size)
+
+    if not pydantic_models:
+        # user did not define any models, skip the check and remove outdated results
+        with suppress(OSError):
+            os.remove(store_path)
+        return
+
+    all_successful = True
+    need_types = (need["type"] for need in env.needs_all_needs.values())  # type: ignore
+    for need_type in get_types_without_model(need_types, pydantic_models):
+        all_successful = False
+        log.warning(f"Model validation: no model defined for need type '{need_type}'")
+
+    config_hash = get_config_hash(
+        [
+            sorted(_get_link_types(env)),
+            env.config.modeling_remove_fields,
+            env.config.modeling_remove_backlinks,
+            env.config.modeling_resolve_links,
+        ]
+    )
+    model_hashes = get_model_hashes(pydantic_models)
+    cache_entries: Optional[CacheEntries] = None
+    need_digests: Optional[Dict[str, str]] = None
+    changed_needs: Optional[Set[str]] = None
+    if env.config.modeling_cache:
+        need_digests = {need_id: get_need_digest(need) for need_id, need in env.needs_all_needs.items()}  # type: ignore
+        with ResultStore(store_path) as store:
+            cache_entries = store.get_cache_entries(config_hash)
+            changed_needs = get_changed_needs(need_digests, store.get_need_digests(config_hash))
+
+    fail_fast = env.config.modeling_fail_fast
+    report = FailureReport(env.config.modeling_max_messages)
+    results: List[NeedResult] = []
+    with closing(iter_validation(env, cache_entries, profile_path, changed_needs)) as validation:
+        for result in validation:
+            results.append(result)
+            if result.errors:
+                all_successful = False
+                for msg in report.add(NeedFailure(result.need_id, result.model, result.errors, result.docname)):
+                    log.info(msg, color="red")
+                if fail_fast and report.count >= fail_fast:
+                    break
+    stopped = bool(fail_fast and report.count >= fail_fast)
+
+    with ResultStore(store_path) as store:
+        # results of needs that did not get validated are kept after a fail-fast stop
+        changed_results = store.update(
+            results,
+            config_hash,
+            complete=not stopped,
+            digests=need_digests,
+            needs=env.needs_all_needs,  # type: ignore
+            model_hashes=model_hashes,
+        )
+    log.verbose(f"Model validation: stored {changed_results} changed results")
+    # failures of aggregate constraints cannot be detected by rebuilding an instance, see get_instance
+    env.needs_modeling_workflow["store_path"] = store_path  # type: ignore
+    if all_successful:
+        log.info("Validation was successful!")
+
+    # Finally set a flag so that this function gets not executed several times
+    env.needs_modeling_workflow["models_checked"] = True  # type: ignore
+
+    for line in report.get_summary():
+        log.info(line, color="red")
+    if stopped:
+        raise ModelingError(f"Model validation: stopped after {report.count} failed needs (modeling_fail_fast)")
+    if report.count:
+        log.warning("Validation errors appeared!")
+
 
+def iter_validation(
+    env: BuildEnvironment,
+    cache_entries: Optional[CacheEntries] = None,
+    profile_path: Optional[str] = None,
+    changed_needs: Optional[Set[str]] = None,
+) -> Generator[NeedResult, None, None]:
+    """
+    Validate all needs that have a model and yield their results one by one.
+
+    Results are yielded in need order as soon as they are available, so consumers can stop the validation
+    early by closing the generator.
+
+    :param env: Sphinx environment, source of all needs to be made available for validation
+    :param cache_entries: results of the previous build; if given, needs with an unchanged fingerprint
+                          are not validated again and all results contain the need fingerprint
+    :param profile_path: path to the JSON profile file, only used if modeling_profile is active
+    :param changed_needs: IDs of the needs that changed since the previous build, only used with cache_entries;
+                          cached results of needs that resolve them are not used, if not given all needs count
+                          as changed
+    """
     needs = env.needs_all_needs  # type: ignore
-    # deep copy needs dictionary as it is modified
-    needs_copy = copy.deepcopy(needs)
+    pydantic_models = env.config.modeling_models
+    all_link_types = _get_link_types(env)
+
+    # the sphinx-needs data is never modified, resolved links are kept in an overlay layer of need views
+    need_views: Mapping[str, Mapping[str, Any]] = needs
+    # links are read once per link field and shared by link resolution, need queries and dependency tracking
+    graph = LinkGraph(needs)
+    if env.config.modeling_resolve_links == "lazy":
+        # link fields get resolved once they are read, only links that are actually validated cost time
+        need_views = LazyNeedViews(needs, all_link_types)
+    elif env.config.modeling_resolve_links:
+        # user may decide to validate need IDs directly or resolve them in own (root) validators;
+        # normally it is more helpful to see resolved needs so far fields can be used for validation
+        need_views = resolve_needs(needs, all_link_types, graph)
 
-    # resolve all need links
+    sphinx_needs_link_types = [link["option"] for link in env.config.needs_extra_links]
+    sphinx_needs_link_types_back = [f"{link}_back" for link in sphinx_needs_link_types]
+    # type-only link models get validated against an index of need types instead of the resolved needs
+    use_type_index = bool(env.config.modeling_type_only_links and env.config.modeling_resolve_links)
+    type_index = get_type_index(needs) if use_type_index else None
+    plans = {
+        need_type: ValidationPlan(
+            model,
+            env.config.modeling_remove_fields,
+            env.config.modeling_remove_backlinks,
+            sphinx_needs_link_types_back,
+            get_id_link_fields(model, all_link_types | {"parent_need"}) if use_type_index else (),
+            compile_checker(model) if env.config.modeling_fast_check else None,
+        )
+        for need_type, model in pydantic_models.items()
+    }
+
+    model_hashes: Dict[str, str] = {}
+    dependents: Set[str] = set()
+    if cache_entries:
+        dependents = _get_dependents(env, graph, plans, all_link_types, changed_needs)
+    need_ids: List[str] = []  # IDs of all needs that have a model
+    cached_errors: Dict[str, List[ErrorDict]] = {}
+    fingerprints: Dict[str, str] = {}
+    need_ids_to_validate: List[str] = []
+
+    for need in need_views.values():
+        if need["type"] not in pydantic_models:
+            continue
+        need_ids.append(need["id"])
+
+        if cache_entries is not None:
+            if need["type"] not in model_hashes:
+                model_hashes[need["type"]] = get_model_hash(pydantic_models[need["type"]])
+            fingerprint = get_need_fingerprint(
+                plans[need["type"]].project(needs[need["id"]]), model_hashes[need["type"]]
+            )
+            fingerprints[need["id"]] = fingerprint
+            errors = get_cached_errors(cache_entries, need["id"], fingerprint)
+            if errors is not None and need["id"] not in dependents:
+                # aggregate constraints depend on other needs, they get checked again below
+                cached_errors[need["id"]] = remove_aggregate_errors(errors)
+                continue
+
+        need_ids_to_validate.append(need["id"])
+    if cache_entries is not None:
+        log.verbose(
+            f"Model validation: re-used {len(cached_errors)} of {len(fingerprints)} cached results, "
+            f"{len(dependents)} needs depend on changed needs"
+        )
+
+    profile = ValidationProfile(list(pydantic_models.values())) if env.config.modeling_profile else None
+    # indexes get built on first use and are shared by all validated needs
+    query = NeedsQuery(needs, graph)
+    # aggregate constraints are checked in a single pass upfront, the needs get validated one by one below
+    aggregate_errors = get_aggregate_errors(pydantic_models, query)
+
+    def validate(need_id: str) -> List[ErrorDict]:
+        """Validate a single need, the function is also called in forked worker processes."""
+        need = need_views[need_id]
+        plan = plans[need["type"]]
+        if profile:
+            with profile.measure_need(need_id, plan.model):
+                return _validate_need(need, needs, env, plan, query, type_index=type_index)
+        return _validate_need(need, needs, env, plan, query, type_index=type_index)
+
+    workers = get_worker_count(env.config.modeling_parallel)
+    if workers > 1 and not is_parallel_supported():
+        log.warning("Model validation: parallel validation is not supported on this platform, running serially")
+        workers = 1
+    if workers > 1 and profile:
+        # timings of worker processes would get lost
+        log.verbose("Model validation: profiling is enabled, running serially")
+        workers = 1
+    link_memo = LinkValidationMemo(list(pydantic_models.values())) if env.config.modeling_memoize_links else None
+    with ExitStack() as stack:
+        if profile:
+            stack.enter_context(profile)
+        if link_memo:
+            stack.enter_context(link_memo)
+        if type_index is not None:
+            stack.enter_context(TypeIndexValidation(list(pydantic_models.values()), type_index))
+        validated: Generator[Tuple[str, List[ErrorDict]], None, None]
+        if workers > 1 and len(need_ids_to_validate) > env.config.modeling_parallel_chunk_size:
+            log.verbose(f"Model validation: validating {len(need_ids_to_validate)} needs in {workers} worker processes")
+            validated = validate_parallel(
+                need_ids_to_validate, validate, workers, env.config.modeling_parallel_chunk_size
+            )
+        else:
+            validated = ((need_id, validate(need_id)) for need_id in need_ids_to_validate)
+        stack.enter_context(closing(validated))
+
+        # yield in need order, so the output does not depend on the cache or on parallel processing;
+        # validated needs come in the same order as they are a subsequence of all needs
+        for need_id in need_ids:
+            if need_id in cached_errors:
+                errors = cached_errors[need_id]
+            else:
+                errors = next(validated)[1]
+            if need_id in aggregate_errors:
+                errors = errors + aggregate_errors[need_id]
+                # only needs that pass validation have an instance
+                PYDANTIC_INSTANCES.pop(need_id, None)
+            need = needs[need_id]
+            yield NeedResult(
+                need_id, need.get("docname"), plans[need["type"]].model.__name__, fingerprints.get(need_id), errors
+            )
+
+    if link_memo:
+        log.info(f"Model validation: linked need memo had {link_memo.hits} hits and {link_memo.misses} misses")
+    if profile:
+        for line in profile.get_summary():
+            log.info(f"Model validation profile: {line}")
+        if profile_path:
+            profile.save(profile_path)
+            log.info(f"Model validation: profile written to {profile_path}")
+
+
+def get_instance(env: BuildEnvironment, need_id: str) -> Optional[BaseModel]:
+    """
+    Return the pydantic instance of a need, it gets rebuilt if it is not retained as per modeling_instances.
+
+    Rebuilt instances are added to PYDANTIC_INSTANCES like the ones created during validation.
+
+    :param env: Sphinx environment the models were checked for
+    :param need_id: ID of the need
+    :return: the instance or None if the need does not exist, has no model or does not pass validation,
+             including aggregate constraints
+    """
+    with suppress(KeyError):
+        return PYDANTIC_INSTANCES[need_id]  # type: ignore[no-any-return]
+    needs = env.needs_all_needs  # type: ignore
+    pydantic_models = env.config.modeling_models
+    if need_id not in needs or needs[need_id]["type"] not in pydantic_models:
+        return None
+    # aggregate constraints are not part of the model, their failures are only known from the stored results
+    store_path = env.needs_modeling_workflow.get("store_path")  # type: ignore
+    if store_path and os.path.exists(store_path):
+        with ResultStore(store_path) as store:
+            if store.is_failed(need_id):
+                return None
+
+    all_link_types = _get_link_types(env)
+    # only the links of the requested need get resolved
+    need: Mapping[str, Any] = (
+        LazyNeedViews(needs, all_link_types)[need_id] if env.config.modeling_resolve_links else needs[need_id]
+    )
+    plan = ValidationPlan(
+        pydantic_models[needs[need_id]["type"]],
+        env.config.modeling_remove_fields,
+        env.config.modeling_remove_backlinks,
+        [f"{link['option']}_back" for link in env.config.needs_extra_links],
+    )
+    try:
+        instance = _create_instance(need, needs, env, plan, NeedsQuery(needs))
+    except Exception:  # pylint: disable=broad-except # user validators might throw anything
+        return None
+    PYDANTIC_INSTANCES[need_id] = instance
+    return instance
+
+
+def get_types_without_model(need_types: Iterable[str], pydantic_models: Mapping[str, Any]) -> List[str]:
+    """Return the need types without a model in order of their first need, each type only once."""
+    return list(dict.fromkeys(need_type for need_type in need_types if need_type not in pydantic_models))
+
+
+def _get_link_types(env: BuildEnvironment) -> Set[str]:
+    """Return the names of all link fields including backlinks."""
     all_link_types = {"links"}
     all_link_types.update({link_config["option"] for link_config in env.config.needs_extra_links})
     back_types = set()
     for link_type in all_link_types:
         back_types.add(f"{link_type}_back")
     all_link_types.update(back_types)
+    return all_link_types
+
+
+def _validate_need(
+    need: Mapping[str, Any],
+    needs: Mapping[str, Any],
+    env: BuildEnvironment,
+    plan: ValidationPlan,
+    query: Optional[NeedsQuery],
+    keep_instance: bool = True,
+    type_index: Optional[Mapping[str, str]] = None,
+) -> List[ErrorDict]:
+    """
+    Validate a single need against its pydantic model.
 
-    if env.config.modeling_resolve_links:
-        # user may decide to validate need IDs directly or resolve them in own (root) validators;
-        # normally it is more helpful to see resolved needs so far fields can be used for validation
-        for need in needs_copy.values():
-            _resolve_links(need, needs_copy, all_link_types)
-
-    pydantic_models = env.config.modeling_models
+    Needs that pass the pre-check of the plan are valid without creating an instance.
 
-    if not pydantic_models:
-        # user did not define any models, skip the check
-        return
+    :param need: need view with resolved links
+    :param needs: all original sphinx-needs needs, made available to user validators
+    :param plan: compiled validation plan of the need's model
+    :param query: indexed access to all needs, made available to user validators
+    :param keep_instance: flag whether the created instance gets stored in PYDANTIC_INSTANCES
+    :param type_index: need type by need ID if type-only links keep the linked need IDs
+    :return: list of validation errors, empty in case of success
+    """
+    errors: List[ErrorDict] = []
+    if plan.check is not None and plan.check(_reduce_need(need, needs, plan), type_index):
+        return errors
+    try:
+        instance = _create_instance(need, needs, env, plan, query)
+        if keep_instance:
+            PYDANTIC_INSTANCES[need["id"]] = instance
+    except ValidationError as exc:
+        errors = get_validation_errors(exc)
+        # get field values as pydantic does not publish that in ValidationError
+        # in all cases, like for regex checks
+        # see https://github.com/pydantic/pydantic/issues/784
+        # TODO: the following code breaks in case a nested model is showing the errors;
+        #       the loc is then a tuple
+        # error_fields = set()
+        # for error in exc.errors():
+        #     for field in error["loc"]:
+        #         if "regex" in error["type"]:
+        #             if field not in error_fields:
+        #                 messages.append(f"Actual value: {need[field]}")
+        #                 error_fields.add(field)
+        # all_messages.extend(messages)
+    except Exception as exc:  # pylint: disable=broad-except # user validators might throw anything
+        errors = get_exception_errors(exc)
+    return errors
+
+
+def _create_instance(
+    need: Mapping[str, Any],
+    needs: Mapping[str, Any],
+    env: BuildEnvironment,
+    plan: ValidationPlan,
+    query: Optional[NeedsQuery],
+) -> BaseModel:
+    """
+    Create the pydantic instance of a need.
 
-    sphinx_needs_link_types = [link["option"] for link in env.config.needs_extra_links]
-    sphinx_needs_link_types_back = [f"{link}_back" for link in sphinx_needs_link_types]
+    :param need: need view with resolved links
+    :param needs: all original sphinx-needs needs, made available to user validators
+    :param plan: compiled validation plan of the need's model
+    :param query: indexed access to all needs, made available to user validators
+    :raises ValidationError: if the need does not match its model
+    """
+    need_relevant_fields = _reduce_need(need, needs, plan)
+    return plan.model(**need_relevant_fields, all_needs=needs, env=env, needs_query=query)  # run pydantic
 
-    for model in pydantic_models.values():
-        # invert the order of root validators to have
-        # context variables available in user defined root validators
-        model.__post_root_validators__.reverse()
 
-    logged_types_without_model = set()  # helper to avoid duplicate log output
-    all_successful = True
-    all_messages: List[str] = []  # return variable
-
-    for need in needs_copy.values():
-        try:
-            # expected model name is the need type with first letter capitalized (this is how Python class are named)
-            if need["type"] in pydantic_models:
-                model = pydantic_models[need["type"]]
-                # get all fields that exist as per the model
-                model_fields = [name for name, field in model.__fields__.items() if isinstance(field, ModelField)]
-                need_relevant_fields = _remove_unrequested_fields(
-                    need,
-                    model_fields,
-                    env.config.modeling_remove_fields,
-                    env.config.modeling_remove_backlinks,
-                    sphinx_needs_link_types_back,
-                )
-                instance = model(**need_relevant_fields, all_needs=needs, env=env)  # run pydantic
-                PYDANTIC_INSTANCES[need["id"]] = instance
-            else:
-                if need["type"] not in logged_types_without_model:
-                    all_successful = False
-                    log.warning(f"Model validation: no model defined for need type '{need['type']}'")
-                    logged_types_without_model.add(need["type"])
-        except ValidationError as exc:
-            all_successful = False
-            all_messages.append(f"Model validation: failed for need {need['id']}")
-            all_messages.append(str(exc))
-            # get field values as pydantic does not publish that in ValidationError
-            # in all cases, like for regex checks
-            # see https://github.com/pydantic/pydantic/issues/784
-            # TODO: the following code breaks in case a nested model is showing the errors;
-            #       the loc is then a tuple
-            # error_fields = set()
-            # for error in exc.errors():
-            #     for field in error["loc"]:
-            #         if "regex" in error["type"]:
-            #             if field not in error_fields:
-            #                 messages.append(f"Actual value: {need[field]}")
-            #                 error_fields.add(field)
-            # all_messages.extend(messages)
-        except Exception as exc:  # pylint: disable=broad-except # user validators might throw anything
-            all_successful = False
-            all_messages.append(f"Model validation: failed for need {need['id']}")
-            all_messages.append(repr(exc))
-    if all_successful:
-        log.info("Validation was successful!")
+def _reduce_need(need: Mapping[str, Any], needs: Mapping[str, Any], plan: ValidationPlan) -> Dict[str, Any]:
+    """Return the fields of a need that get passed to pydantic."""
+    need_relevant_fields = plan.project(need)
+    if plan.id_link_fields:
+        keep_link_ids(need_relevant_fields, need, plan.id_link_fields, needs)
+    return need_relevant_fields
 
-    # Finally set a flag so that this function gets not executed several times
-    env.needs_modeling_workflow["models_checked"] = True  # type: ignore
 
-    if all_messages:
-        for msg in all_messages:
-            log.info(msg, color="red")
-        log.warning("Validation errors appeared!")
-        dir_name = os.path.dirname(os.path.abspath(msg_path))
-        if not os.path.exists(dir_name):
-            os.makedirs(dir_name)
-        with open(msg_path, "wb") as fp:
-            pickle.dump(all_messages, fp)
-
-
-def _remove_unrequested_fields(
-    need: Dict[str, Any],
-    model_fields: List[str],
-    remove_fields: List[str],
-    remove_backlinks: bool,
-    sphinx_needs_link_types_back: List[str],
-) -> Any:
+def _get_dependents(
+    env: BuildEnvironment,
+    graph: LinkGraph,
+    plans: Mapping[str, ValidationPlan],
+    all_link_types: Set[str],
+    changed_needs: Optional[Set[str]],
+) -> Set[str]:
     """
-    Remove unneeded object fields.
+    Return the IDs of the needs whose validation result depends on changed needs.
 
-    :param model_fields: list of fields that are contained in the user defined model
-    :param remove_fields: list of fields to remove from the dict
-    :param remove_backlinks: flag indicating whether to remove backlink references
-    :param sphinx_needs_link_types_back: list of sphinx-needs link backreference names (e.g. blocks -> blocks_back)
+    :param plans: compiled validation plans by need type
+    :param changed_needs: IDs of the changed needs, None if all needs count as changed
     """
-    output_dict = {}
-    for key, value in need.items():
-        if key in remove_fields:
-            continue  # static user configuration
-        if value is None:
-            continue  # not considered a useful field for modeling (e.g. style)
-        keep = False
-        if key in model_fields:
-            keep = True
-        if key == "parent_need":
-            keep = True  # special sphinx-needs field that holds the nesting parent
-        if not keep:
-            if isinstance(value, bool):
-                # useful for flags such as is_need
-                keep = True
-            if isinstance(value, (str, list)):
-                # str:  do not return empty values as they cannot be set in RST
-                # list: need links, those can be empty by setting in RST or not giving them, cannot distinguish here;
-                #       empty lists should be removed unless they are part of model_fields
-                keep = bool(value)
-            if remove_backlinks and key in sphinx_needs_link_types_back:
-                keep = False
-        if keep:
-            output_dict[key] = value
-    return output_dict
-
-
-def _resolve_links(need: Dict[str, Any], needs: Dict[str, Dict[str, Any]], all_link_types: Set[str]) -> None:
-    """Resolve link fields and backlinks for a given need."""
-    for field, link_targets in need.items():
-        if field in all_link_types and link_targets:
-            resolved_link_targets = []
-            for link_target in link_targets:
-                if link_target in needs:
-                    resolved_link_targets.append(needs[link_target])
-            need[field] = resolved_link_targets
-    if need["parent_need"] and need["parent_need"] in needs:
-        need["parent_need"] = needs[need["parent_need"]]
+    link_fields = all_link_types | {"parent_need"}
+    if env.config.modeling_resolve_links:
+        depths = {need_type: get_resolution_depth(plan.model, link_fields) for need_type, plan in plans.items()}
+    else:
+        depths = dict.fromkeys(plans, 0)
+    resolved_fields = {need_type: get_resolved_fields(plan, link_fields) for need_type, plan in plans.items()}
+    return get_dependents(
+        graph, link_fields, graph.needs if changed_needs is None else changed_needs, resolved_fields, depths
+    )
@@ -0,0 +1,84 @@
+"""
+Memoized validation of linked needs.
+
+A linked need gets validated against a nested link model (e.g. the items of ``links: List[LinkedStory]``)
+for each need that links to it. The result only depends on the link model and the linked need, so it is
+stored in a memo table that lives for a single validation run.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.fields import ModelField
+
+from sphinx_modeling.modeling.plan import iter_sub_model_fields
+
+
+FieldValidator = Callable[..., Any]
+
+
+class LinkValidationMemo:
+    """
+    Context manager that memoizes the validation of linked needs against link models.
+
+    The validators of all fields that hold a nested model get replaced while the context is active.
+    Fields with own class validators are not touched, as those may depend on other field values.
+    """
+
+    def __init__(self, models: List[Type[BaseModel]]) -> None:
+        """Collect the fields of all given models and their nested models."""
+        self.table: Dict[Tuple[Any, str], Tuple[bool, Any]] = {}
+        """Maps link model class and linked need ID to a success flag and the model instance or exception."""
+        self.hits = 0
+        self.misses = 0
+        self._fields = [field for field in iter_sub_model_fields(models) if _is_memoizable(field)]
+        self._original_validators: List[Tuple[ModelField, List[FieldValidator]]] = []
+
+    def __enter__(self) -> "LinkValidationMemo":
+        """Replace the field validators with memoizing ones."""
+        for field in self._fields:
+            self._original_validators.append((field, field.validators))
+            field.validators = [self._create_validator(field.validators)]
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Restore the original field validators."""
+        for field, validators in reversed(self._original_validators):
+            field.validators = validators
+        self._original_validators = []
+
+    def _create_validator(self, validators: List[FieldValidator]) -> FieldValidator:
+        """Create a field validator that runs the given validators once per link model and linked need."""
+
+        def validate(cls: Any, value: Any, values: Any, field: ModelField, config: Any) -> Any:
+            need_id: Optional[str] = value.get("id") if isinstance(value, Mapping) else None
+            if need_id is None:
+                # not a resolved need
+                for validator in validators:
+                    value = validator(cls, value, values, field, config)
+                return value
+
+            key = (field.type_, need_id)
+            if key in self.table:
+                self.hits += 1
+                success, result = self.table[key]
+                if success:
+                    return result
+                raise result.with_traceback(None)
+
+            self.misses += 1
+            try:
+                for validator in validators:
+                    value = validator(cls, value, values, field, config)
+            except (ValueError, TypeError, AssertionError) as exc:  # errors pydantic turns into validation errors
+                self.table[key] = (False, exc)
+                raise
+            self.table[key] = (True, value)
+            return value
+
+        return validate
+
+
+def _is_memoizable(field: ModelField) -> bool:
+    """Return whether the field validators only depend on the validated value."""
+    return not field.class_validators and not field.pre_validators and not field.post_validators
@@ -0,0 +1,70 @@
+"""
+Parallel validation of needs.
+
+Worker processes are forked, so they inherit the resolved need graph and the user models copy-on-write.
+Only need IDs and validation errors get transferred between the processes.
+Forking is needed as user models are commonly defined in conf.py and cannot be pickled.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+from typing import Any, Callable, Generator, List, Optional, Tuple, Union
+
+
+_VALIDATE: Optional[Callable[[str], List[Any]]] = None  # set before forking, so workers inherit it
+
+
+def is_parallel_supported() -> bool:
+    """Return whether worker processes can be forked on this platform."""
+    return os.name == "posix" and "fork" in multiprocessing.get_all_start_methods()
+
+
+def get_worker_count(setting: Union[bool, int]) -> int:
+    """
+    Return the number of worker processes for the modeling_parallel setting.
+
+    :param setting: True to use all CPU cores, False to validate serially or the number of workers
+    """
+    if setting is True:
+        return os.cpu_count() or 1
+    if setting is False:
+        return 1
+    return max(int(setting), 1)
+
+
+def validate_parallel(
+    need_ids: List[str], validate: Callable[[str], List[Any]], workers: int, chunk_size: int
+) -> Generator[Tuple[str, List[Any]], None, None]:
+    """
+    Validate needs in forked worker processes.
+
+    :param need_ids: IDs of all needs to validate
+    :param validate: function that validates a single need and returns its errors
+    :param workers: maximum number of worker processes
+    :param chunk_size: number of needs validated by a worker at once
+    :return: tuples of need ID and validation errors in the order of need_ids
+    """
+    global _VALIDATE  # pylint: disable=global-statement # inherited by the forked workers
+    chunks = [need_ids[index : index + chunk_size] for index in range(0, len(need_ids), chunk_size)]  # noqa: E203
+    _VALIDATE = validate
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)), mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            futures = [executor.submit(_validate_chunk, chunk) for chunk in chunks]
+            try:
+                for future in futures:
+                    yield from future.result()
+            finally:
+                # chunks that did not start yet are dropped if the generator gets closed early
+                for future in futures:
+                    future.cancel()
+    finally:
+        _VALIDATE = None
+
+
+def _validate_chunk(need_ids: List[str]) -> List[Tuple[str, List[Any]]]:
+    """Validate a chunk of needs in a worker process."""
+    assert _VALIDATE is not None, "validation function is inherited from the parent process"
+    return [(need_id, _VALIDATE(need_id)) for need_id in need_ids]
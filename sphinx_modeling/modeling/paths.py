@@ -0,0 +1,162 @@
+"""
+Linear-time path and cycle analysis on the link graph.
+
+Path rules like "every test traces through impl and spec to a story" get evaluated backwards, one link step
+at a time: the needs that complete the rest of a path are computed once and re-used for each need that links
+to them, which is a memoized depth-first search in the order of the path. Link cycles are the strongly
+connected components of the link graph, found with an iterative version of Tarjan's algorithm.
+
+Both cost O(V + E) for the needs and links involved. Results are memoized for the validation run, so rules
+that share the end of a path or the link types of a cycle check only evaluate them once.
+"""
+
+from array import array
+from itertools import chain
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from sphinx_modeling.modeling.graph import Adjacency, LinkGraph
+
+
+BACK_LINK_SUFFIX = "_back"
+"""Suffix of back link types, they follow the links of the base link type in reverse."""
+
+
+class LinkPaths:
+    """Memoized path and cycle analysis of the needs of a link graph."""
+
+    def __init__(self, graph: LinkGraph) -> None:
+        """
+        Create the analysis, nothing gets computed before the first lookup.
+
+        :param graph: link graph of all needs
+        """
+        self.graph = graph
+        self._types: List[str] = [need["type"] for need in graph.needs.values()]
+        self._traces: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], bytearray] = {}
+        self._cycles: Dict[Tuple[Tuple[str, ...], Optional[FrozenSet[str]]], List[List[int]]] = {}
+
+    def get_tracing(self, need_types: Sequence[str], link_types: Sequence[str] = ("links",)) -> bytearray:
+        """
+        Return which needs have a link path through needs of the given types in order.
+
+        :param need_types: types of the needs along the path, e.g. ``["impl", "spec", "story"]``
+        :param link_types: link types a path may follow, ``<type>_back`` follows ``<type>`` links in reverse
+        :return: a flag by need position, 1 if the need starts such a path
+        """
+        key = (tuple(need_types), tuple(link_types))
+        flags = self._traces.get(key)
+        if flags is not None:
+            return flags
+        need_count = self.graph.need_count
+        if not need_types:
+            flags = bytearray(b"\x01") * need_count
+        else:
+            following = self.get_tracing(need_types[1:], link_types)
+            types = self._types
+            step_type = need_types[0]
+            targets_ok = bytearray(
+                following[position] and types[position] == step_type for position in range(need_count)
+            )
+            flags = bytearray(need_count)
+            for offsets, targets in self._get_adjacencies(link_types):
+                for source in range(need_count):
+                    if not flags[source] and any(
+                        targets_ok[target] for target in targets[offsets[source] : offsets[source + 1]]  # noqa: E203
+                    ):
+                        flags[source] = 1
+        self._traces[key] = flags
+        return flags
+
+    def get_cycles(
+        self, link_types: Sequence[str] = ("links",), need_types: Optional[Sequence[str]] = None
+    ) -> List[List[int]]:
+        """
+        Return the link cycles between needs.
+
+        :param link_types: link types a cycle may follow, ``<type>_back`` follows ``<type>`` links in reverse
+        :param need_types: only consider cycles between needs of these types, None for all needs
+        :return: need positions of each strongly connected component that contains a cycle, in need order
+        """
+        key = (tuple(link_types), None if need_types is None else frozenset(need_types))
+        cycles = self._cycles.get(key)
+        if cycles is None:
+            if need_types is None:
+                included = bytearray(b"\x01") * self.graph.need_count
+            else:
+                included = bytearray(need_type in key[1] for need_type in self._types)  # type: ignore[operator]
+            cycles = self._cycles[key] = _find_cycles(self._get_adjacencies(link_types), included)
+        return cycles
+
+    def _get_adjacencies(self, link_types: Sequence[str]) -> List[Adjacency]:
+        """Return the need adjacencies of the given link types."""
+        adjacencies = []
+        for link_type in link_types:
+            if link_type.endswith(BACK_LINK_SUFFIX):
+                adjacencies.append(self.graph.get_need_adjacency(link_type[: -len(BACK_LINK_SUFFIX)], incoming=True))
+            else:
+                adjacencies.append(self.graph.get_need_adjacency(link_type))
+        return adjacencies
+
+
+def _find_cycles(adjacencies: List[Adjacency], included: bytearray) -> List[List[int]]:
+    """
+    Return the strongly connected components with a cycle, using Tarjan's algorithm without recursion.
+
+    :param adjacencies: need adjacencies whose links get followed
+    :param included: a flag by need position, needs without the flag are left out of the graph
+    """
+
+    def iter_neighbors(node: int) -> Iterator[int]:
+        return chain.from_iterable(
+            targets[offsets[node] : offsets[node + 1]] for offsets, targets in adjacencies  # noqa: E203
+        )
+
+    need_count = len(included)
+    indexes = array("i", [-1]) * need_count
+    lowlinks = array("i", [0]) * need_count
+    on_stack = bytearray(need_count)
+    self_links = bytearray(need_count)
+    stack: List[int] = []
+    cycles: List[List[int]] = []
+    counter = 0
+    for root in range(need_count):
+        if indexes[root] >= 0 or not included[root]:
+            continue
+        indexes[root] = lowlinks[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter_neighbors(root))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if not included[neighbor]:
+                    continue
+                if neighbor == node:
+                    self_links[node] = 1
+                if indexes[neighbor] < 0:
+                    indexes[neighbor] = lowlinks[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    work.append((neighbor, iter_neighbors(neighbor)))
+                    break
+                if on_stack[neighbor]:
+                    lowlinks[node] = min(lowlinks[node], indexes[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+                if lowlinks[node] == indexes[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or self_links[node]:
+                        cycles.append(sorted(component))
+    cycles.sort()
+    return cycles
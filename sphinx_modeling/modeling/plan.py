@@ -0,0 +1,131 @@
+"""
+Validation plans that get compiled once per build for each user model.
+
+A plan holds all per-model information needed to reduce a need dictionary to the fields passed to pydantic.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Type
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_SINGLETON, ModelField
+from pydantic.utils import lenient_issubclass
+
+
+Projector = Callable[[Mapping[str, Any]], Dict[str, Any]]
+Checker = Callable[[Mapping[str, Any], Optional[Mapping[str, str]]], bool]
+
+
+class ValidationPlan:
+    """Compiled validation information of a single pydantic model."""
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        remove_fields: Iterable[str],
+        remove_backlinks: bool,
+        sphinx_needs_link_types_back: Iterable[str],
+        id_link_fields: Iterable[str] = (),
+        check: Optional[Checker] = None,
+    ) -> None:
+        """
+        Compile the plan for a model.
+
+        :param model: user defined pydantic model
+        :param remove_fields: list of fields to remove from the dict
+        :param remove_backlinks: flag indicating whether to remove backlink references
+        :param sphinx_needs_link_types_back: sphinx-needs link backreference names (e.g. blocks -> blocks_back)
+        :param id_link_fields: link fields that keep the linked need IDs instead of the resolved needs
+        :param check: compiled pre-check of the model, see :mod:`sphinx_modeling.modeling.fast_check`
+        """
+        self.model = model
+        self.model_fields: FrozenSet[str] = frozenset(
+            name for name, field in model.__fields__.items() if isinstance(field, ModelField)
+        )
+        """Fields that exist as per the model."""
+        self.remove_fields: FrozenSet[str] = frozenset(remove_fields)
+        """Fields that always get removed (static user configuration)."""
+        self.back_link_types: FrozenSet[str] = (
+            frozenset(sphinx_needs_link_types_back) if remove_backlinks else frozenset()
+        )
+        """Backlink fields that get removed unless they are part of the model."""
+        self.project: Projector = _create_projector(self.model_fields, self.remove_fields, self.back_link_types)
+        """Function that reduces a need to the fields passed to pydantic in a single pass."""
+        self.id_link_fields: FrozenSet[str] = frozenset(id_link_fields)
+        """Link fields that keep the linked need IDs, as they only validate the linked need type."""
+        self.check = check
+        """Function that returns whether a reduced need is valid without running pydantic, None if not available."""
+        _order_root_validators(model)
+
+
+def _create_projector(
+    model_fields: FrozenSet[str], remove_fields: FrozenSet[str], back_link_types: FrozenSet[str]
+) -> Projector:
+    """
+    Create a function that removes unneeded need fields.
+
+    Fields of the model and the special sphinx-needs field parent_need are kept.
+    Other fields are kept if they hold a flag (such as is_need) or a non-empty string or list.
+    Empty strings cannot be set in RST, empty link lists cannot be distinguished from not given ones.
+    None is not considered a useful value for modeling (e.g. style).
+    """
+    always_keep = model_fields | {"parent_need"}
+    never_keep = back_link_types - model_fields
+
+    def project(need: Mapping[str, Any]) -> Dict[str, Any]:
+        # values are only read for candidate fields, so lazy need views do not resolve removed link fields
+        output_dict = {}
+        for key in need:
+            if key in remove_fields:
+                continue
+            if key in always_keep:
+                value = need[key]
+                if value is not None:
+                    output_dict[key] = value
+            elif key not in never_keep:
+                value = need[key]
+                if isinstance(value, bool) or (isinstance(value, (str, list)) and value):
+                    output_dict[key] = value
+        return output_dict
+
+    return project
+
+
+def _order_root_validators(model: Type[BaseModel]) -> None:
+    """
+    Run the root validator that removes the context variables after all user defined root validators.
+
+    That way context variables are available in user defined root validators.
+    The function is idempotent, so it does not matter how often the plan of a model is compiled.
+    """
+    post_root_validators = model.__post_root_validators__
+    context_validators = [validator for validator in post_root_validators if _is_remove_context(validator[1])]
+    other_validators = [validator for validator in post_root_validators if not _is_remove_context(validator[1])]
+    post_root_validators[:] = other_validators + context_validators
+
+
+def _is_remove_context(func: Any) -> bool:
+    """Return whether the root validator is the one of BaseModelNeeds that removes the context variables."""
+    return getattr(func, "__qualname__", None) == "BaseModelNeeds.remove_context"
+
+
+def iter_sub_model_fields(models: Iterable[Type[BaseModel]]) -> Iterator[ModelField]:
+    """
+    Yield all fields that validate a single nested pydantic model, like the items of List[LinkedStory].
+
+    The fields of nested models are visited as well, each model only once.
+    """
+    visited: Set[Type[BaseModel]] = set()
+    pending: List[Type[BaseModel]] = list(models)
+    while pending:
+        model = pending.pop()
+        if model in visited:
+            continue
+        visited.add(model)
+        fields: List[ModelField] = list(model.__fields__.values())
+        while fields:
+            field = fields.pop()
+            if field.sub_fields:
+                fields.extend(field.sub_fields)
+            elif field.shape == SHAPE_SINGLETON and lenient_issubclass(field.type_, BaseModel):
+                pending.append(field.type_)
+                yield field
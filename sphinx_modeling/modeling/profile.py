@@ -0,0 +1,212 @@
+"""
+Timing instrumentation of model validation.
+
+While a profile is active, the instantiation of each model as well as every user defined ``@validator`` and
+``@root_validator`` gets timed. Validators are recorded by their qualified name (e.g. ``Story.check_id``),
+so validators inherited from a base model are reported once for the class that defines them.
+Validators that pydantic adds itself, like the length check of ``conlist``, are not timed.
+"""
+
+from contextlib import contextmanager
+import functools
+import heapq
+import time
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.class_validators import Validator
+from pydantic.fields import ModelField
+from pydantic.utils import lenient_issubclass
+
+from sphinx_modeling.modeling.files import write_json_atomic
+from sphinx_modeling.modeling.plan import _is_remove_context
+
+
+SLOWEST_NEEDS = 5
+"""Number of slowest need IDs recorded per model and validator."""
+
+
+class Timing:
+    """Accumulated timings of a single model or validator."""
+
+    __slots__ = ("calls", "total", "max", "slowest")
+
+    def __init__(self) -> None:
+        """Create an empty timing."""
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.slowest: List[Tuple[float, str]] = []  # min-heap of the slowest (duration, need ID) pairs
+
+    def add(self, duration: float, need_id: str) -> None:
+        """Record a single call for the given need."""
+        self.calls += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        if len(self.slowest) < SLOWEST_NEEDS:
+            heapq.heappush(self.slowest, (duration, need_id))
+        elif duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (duration, need_id))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the timing as JSON serializable dictionary, durations are given in seconds."""
+        return {
+            "calls": self.calls,
+            "total": round(self.total, 6),
+            "max": round(self.max, 6),
+            "slowest_needs": [
+                {"id": need_id, "seconds": round(duration, 6)}
+                for duration, need_id in sorted(self.slowest, reverse=True)
+            ],
+        }
+
+
+class ValidationProfile:
+    """
+    Context manager that times model instantiation and user validators.
+
+    The validator functions of all given models and their nested models get wrapped while the context is active.
+    Model instantiation gets timed by the caller with :meth:`measure_need`.
+    """
+
+    def __init__(self, models: List[Type[BaseModel]]) -> None:
+        """Collect the validators of all given models and their nested models."""
+        self.models: Dict[str, Timing] = {}
+        self.validators: Dict[str, Timing] = {}
+        self.need_id = ""
+        """ID of the need that currently gets validated, validator calls are attributed to it."""
+        self._models = _collect_models(models)
+        self._original_funcs: List[Tuple[Validator, Callable[..., Any]]] = []
+        self._original_root_validators: List[Tuple[Type[BaseModel], List[Any], List[Any]]] = []
+        self._fields: List[ModelField] = []
+
+    def __enter__(self) -> "ValidationProfile":
+        """Wrap all user validators with timing functions."""
+        wrapped = set()
+        for model in self._models:
+            # validators declared on the model, constrained types add own ones to the fields;
+            # pydantic types __validators__ as callables, but it holds lists of validators by field name
+            model_validators: Dict[str, List[Validator]] = model.__validators__  # type: ignore[assignment]
+            user_validators = {id(validator) for validators in model_validators.values() for validator in validators}
+            for field in _iter_fields(model):
+                validators = [
+                    validator for validator in field.class_validators.values() if id(validator) in user_validators
+                ]
+                if not validators:
+                    continue
+                for validator in validators:
+                    if id(validator) not in wrapped:
+                        wrapped.add(id(validator))
+                        self._original_funcs.append((validator, validator.func))
+                        validator.func = self._wrap(validator.func)
+                self._fields.append(field)
+            pre_root_validators = list(model.__pre_root_validators__)
+            post_root_validators = list(model.__post_root_validators__)
+            self._original_root_validators.append((model, pre_root_validators, post_root_validators))
+            model.__pre_root_validators__[:] = [self._wrap(func) for func in pre_root_validators]
+            model.__post_root_validators__[:] = [
+                (skip, func if _is_remove_context(func) else self._wrap(func)) for skip, func in post_root_validators
+            ]
+        self._populate_validators()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Restore the original validators."""
+        for validator, func in self._original_funcs:
+            validator.func = func
+        for model, pre_root_validators, post_root_validators in self._original_root_validators:
+            model.__pre_root_validators__[:] = pre_root_validators
+            model.__post_root_validators__[:] = post_root_validators
+        self._populate_validators()
+        self._original_funcs = []
+        self._original_root_validators = []
+        self._fields = []
+
+    @contextmanager
+    def measure_need(self, need_id: str, model: Type[BaseModel]) -> Iterator[None]:
+        """Time the instantiation of a model for the given need, validator calls within get attributed to it."""
+        self.need_id = need_id
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.models.setdefault(model.__name__, Timing()).add(time.perf_counter() - start, need_id)
+            self.need_id = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return all timings as JSON serializable dictionary, each sorted by total duration."""
+        return {
+            "models": _sorted_timings(self.models),
+            "validators": _sorted_timings(self.validators),
+        }
+
+    def save(self, path: str) -> None:
+        """Write all timings as JSON file."""
+        write_json_atomic(path, self.to_dict())
+
+    def get_summary(self, count: int = 3) -> List[str]:
+        """Return log lines for the models and validators with the highest total duration."""
+        lines = []
+        for kind, timings in (("model", self.models), ("validator", self.validators)):
+            for name, timing in sorted(timings.items(), key=lambda item: item[1].total, reverse=True)[:count]:
+                slowest = max(timing.slowest)[1] if timing.slowest else "-"
+                lines.append(
+                    f"{kind} {name}: {timing.calls} calls, {timing.total:.3f}s total, "
+                    f"{timing.max * 1000:.2f}ms max (need {slowest})"
+                )
+        return lines
+
+    def _wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a validator function with a timing function.
+
+        functools.wraps keeps the signature, which pydantic inspects to decide how to call the validator.
+        """
+        timing = self.validators.setdefault(getattr(func, "__qualname__", repr(func)), Timing())
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timing.add(time.perf_counter() - start, self.need_id)
+
+        return timed
+
+    def _populate_validators(self) -> None:
+        """Let pydantic rebuild the validator chains of all fields with class validators."""
+        for field in self._fields:
+            field.populate_validators()
+
+
+def _collect_models(models: List[Type[BaseModel]]) -> List[Type[BaseModel]]:
+    """Return all given models and their nested models, each only once."""
+    collected: List[Type[BaseModel]] = []
+    pending = list(models)
+    while pending:
+        model = pending.pop()
+        if model in collected:
+            continue
+        collected.append(model)
+        for field in _iter_fields(model):
+            if lenient_issubclass(field.type_, BaseModel):
+                pending.append(field.type_)
+    return collected
+
+
+def _iter_fields(model: Type[BaseModel]) -> Iterator[ModelField]:
+    """Yield all fields of a model including sub fields, e.g. the item field of a list."""
+    pending: List[ModelField] = list(model.__fields__.values())
+    while pending:
+        field = pending.pop()
+        yield field
+        if field.sub_fields:
+            pending.extend(field.sub_fields)
+
+
+def _sorted_timings(timings: Dict[str, Timing]) -> Dict[str, Any]:
+    """Return timings as dictionaries, the ones with the highest total duration first."""
+    return {
+        name: timing.to_dict() for name, timing in sorted(timings.items(), key=lambda item: item[1].total, reverse=True)
+    }
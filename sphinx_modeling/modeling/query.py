@@ -0,0 +1,115 @@
+"""
+Indexed, read-only access to all needs for custom validators.
+
+Validators that run cross-need checks on ``all_needs`` usually scan all needs for each validated need, which costs
+O(n²) per build. :class:`NeedsQuery` builds a hash index on the first lookup of a field or link type and keeps it
+for the whole validation run, so further lookups only cost the size of their result.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+from sphinx_modeling.modeling.graph import LinkGraph
+from sphinx_modeling.modeling.paths import LinkPaths
+
+
+NeedTuple = Tuple[Mapping[str, Any], ...]
+
+
+class NeedsQuery:
+    """
+    Read-only lookups of needs by ID, type, docname, field value and links.
+
+    Needs are returned as read-only views of the sphinx-needs need dictionaries, links hold the linked need IDs.
+    Results are in need order.
+    """
+
+    def __init__(self, needs: Mapping[str, Mapping[str, Any]], graph: Optional[LinkGraph] = None) -> None:
+        """
+        Create the query object, indexes get built on first use.
+
+        :param needs: all sphinx-needs needs, they are not modified
+        :param graph: link graph of the needs, it gets created if not given
+        """
+        self._needs = needs
+        self._graph = LinkGraph(needs) if graph is None else graph
+        self._views: Dict[str, Mapping[str, Any]] = {}
+        self._field_indexes: Dict[str, Dict[Hashable, List[str]]] = {}
+        self._paths: Optional[LinkPaths] = None
+
+    def __contains__(self, need_id: object) -> bool:
+        """Check whether a need exists."""
+        return need_id in self._needs
+
+    def __len__(self) -> int:
+        """Return the number of needs."""
+        return len(self._needs)
+
+    def get(self, need_id: str) -> Optional[Mapping[str, Any]]:
+        """Return a need by its ID, None if it does not exist."""
+        if need_id not in self._needs:
+            return None
+        return self._view(need_id)
+
+    def by_type(self, need_type: str) -> NeedTuple:
+        """Return all needs of a type."""
+        return self.by_field("type", need_type)
+
+    def by_docname(self, docname: str) -> NeedTuple:
+        """Return all needs of a document."""
+        return self.by_field("docname", docname)
+
+    def by_field(self, field: str, value: Hashable) -> NeedTuple:
+        """
+        Return all needs with the given value in a field.
+
+        For list fields like ``tags`` all needs are returned that contain the value.
+        """
+        index = self._field_indexes.get(field)
+        if index is None:
+            index = self._field_indexes[field] = self._create_field_index(field)
+        return self._views_of(index.get(value, ()))
+
+    def outgoing(self, need_id: str, link_type: str = "links") -> NeedTuple:
+        """Return the existing needs the given need links to with a link type, e.g. ``links`` or ``parent_need``."""
+        ids = self._graph.ids
+        return self._views_of(ids[position] for position in self._graph.iter_need_targets(link_type, need_id))
+
+    def incoming(self, need_id: str, link_type: str = "links") -> NeedTuple:
+        """
+        Return the needs that link to the given need with a link type.
+
+        The result does not depend on sphinx-needs having created the back links already.
+        """
+        ids = self._graph.ids
+        return self._views_of(ids[position] for position in self._graph.iter_need_sources(link_type, need_id))
+
+    @property
+    def paths(self) -> LinkPaths:
+        """Memoized path and cycle analysis of the needs, see :mod:`sphinx_modeling.modeling.paths`."""
+        if self._paths is None:
+            self._paths = LinkPaths(self._graph)
+        return self._paths
+
+    def _create_field_index(self, field: str) -> Dict[Hashable, List[str]]:
+        """Return the index of field value to need IDs in a single pass over all needs."""
+        index: Dict[Hashable, List[str]] = {}
+        for need_id, need in self._needs.items():
+            value = need.get(field)
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, Hashable):
+                    need_ids = index.setdefault(item, [])
+                    if not need_ids or need_ids[-1] != need_id:
+                        need_ids.append(need_id)
+        return index
+
+    def _view(self, need_id: str) -> Mapping[str, Any]:
+        """Return the read-only view of a need, each view gets created once."""
+        view = self._views.get(need_id)
+        if view is None:
+            view = self._views[need_id] = MappingProxyType(self._needs[need_id])
+        return view
+
+    def _views_of(self, need_ids: Iterable[str]) -> NeedTuple:
+        """Return the read-only views of the given needs."""
+        return tuple(self._view(need_id) for need_id in need_ids)
@@ -0,0 +1,257 @@
+"""
+Persistent store of validation results.
+
+The results of the last validation run are kept in an SQLite database with one row per need that has a model.
+Each row holds the docname, the model name, the need fingerprint (only if the cache is active) and the
+structured validation errors of the need, see :mod:`sphinx_modeling.modeling.errors`.
+If the cache is active, the digests of all needs are stored as well to find changed needs in the next build,
+together with a snapshot of each need as it was validated. The hashes of the models allow to detect
+changed models in builds that do not read any document.
+
+Rows are only written if their content changed, so the cost of storing results grows with the number of
+changed needs. Failed needs can be queried without loading the results of all needs.
+"""
+
+from contextlib import suppress
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from sphinx_modeling.modeling.cache import CacheEntries, get_need_snapshot
+from sphinx_modeling.modeling.errors import ErrorDict, NeedFailure, render_messages
+
+
+SCHEMA_VERSION = 4
+"""Version of the database schema, stored as SQLite user_version; other versions get dropped."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    need_id TEXT PRIMARY KEY,
+    docname TEXT,
+    model TEXT NOT NULL,
+    fingerprint TEXT,
+    position INTEGER,
+    errors TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS needs (
+    need_id TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    need TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS models (
+    need_type TEXT PRIMARY KEY,
+    model_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_docname ON results (docname);
+CREATE INDEX IF NOT EXISTS results_position ON results (position) WHERE position IS NOT NULL;
+"""
+
+
+class NeedResult(NamedTuple):
+    """Validation result of a single need."""
+
+    need_id: str
+    docname: Optional[str]
+    model: str
+    fingerprint: Optional[str]
+    errors: List[ErrorDict]
+
+
+class ResultStore:
+    """
+    SQLite database of validation results.
+
+    Failed needs keep their index in need order as position, so their messages can be emitted in the same order
+    again. The position does not depend on other failures, so a fixed or new failure only changes its own row.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open the database, it gets created if it does not exist or cannot be read."""
+        dir_name = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+        self.path = path
+        try:
+            self.connection = self._connect()
+        except sqlite3.DatabaseError:
+            # no database or a broken one, results get re-created
+            with suppress(OSError):
+                os.remove(path)
+            self.connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database and create the schema."""
+        connection = sqlite3.connect(self.path)
+        try:
+            if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                connection.executescript(
+                    "DROP TABLE IF EXISTS meta; DROP TABLE IF EXISTS results; DROP TABLE IF EXISTS digests; "
+                    "DROP TABLE IF EXISTS needs; DROP TABLE IF EXISTS models;"
+                )
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            connection.executescript(_SCHEMA)
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def __enter__(self) -> "ResultStore":
+        """Return the opened store."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def get_cache_entries(self, config_hash: str) -> CacheEntries:
+        """
+        Return fingerprints and errors of all needs that were validated with the cache active.
+
+        An empty mapping is returned if the results were stored with another configuration.
+        """
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'config_hash'").fetchone()
+        if row is None or row[0] != config_hash:
+            return {}
+        return {
+            need_id: (fingerprint, _load_errors(errors))
+            for need_id, fingerprint, errors in self.connection.execute(
+                "SELECT need_id, fingerprint, errors FROM results WHERE fingerprint IS NOT NULL"
+            )
+        }
+
+    def get_need_digests(self, config_hash: str) -> Dict[str, str]:
+        """Return the digests of all needs of the previous build, empty if it used another configuration."""
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'config_hash'").fetchone()
+        if row is None or row[0] != config_hash:
+            return {}
+        return dict(self.connection.execute("SELECT need_id, digest FROM needs"))
+
+    def get_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return all needs as they were validated in the previous build, empty if the cache was not active."""
+        return {
+            need_id: json.loads(need) for need_id, need in self.connection.execute("SELECT need_id, need FROM needs")
+        }
+
+    def get_model_hashes(self) -> Dict[str, str]:
+        """Return the model hashes by need type the stored results were created with."""
+        return dict(self.connection.execute("SELECT need_type, model_hash FROM models"))
+
+    def update(
+        self,
+        results: Iterable[NeedResult],
+        config_hash: str,
+        complete: bool = True,
+        digests: Optional[Mapping[str, str]] = None,
+        needs: Optional[Mapping[str, Any]] = None,
+        model_hashes: Optional[Mapping[str, str]] = None,
+    ) -> int:
+        """
+        Replace the stored results with the given ones in a single transaction.
+
+        Only changed rows are written; results of needs that are not given anymore get deleted.
+
+        :param results: results of all needs in report order
+        :param config_hash: hash of the configuration the results were created with
+        :param complete: flag whether results of all needs are given; if not, no results get deleted and
+                         digests and model hashes are kept, so needs that did not get validated stay invalidated
+        :param digests: digests of all needs, stored digests and the snapshot get removed if not given
+        :param needs: needs the digests belong to, changed needs get stored in the snapshot
+        :param model_hashes: hashes of the models by need type
+        :return: number of written and deleted rows
+        """
+        existing: Dict[str, Tuple[Any, ...]] = {
+            row[0]: row[1:]
+            for row in self.connection.execute(
+                "SELECT need_id, docname, model, fingerprint, position, errors FROM results"
+            )
+        }
+        changed_rows = []
+        for position, result in enumerate(results):
+            row: Tuple[Any, ...] = (
+                result.docname,
+                result.model,
+                result.fingerprint,
+                position if result.errors else None,
+                json.dumps(result.errors) if result.errors else "",
+            )
+            if existing.pop(result.need_id, None) != row:
+                changed_rows.append((result.need_id, *row))
+        if not complete:
+            existing = {}
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('config_hash', ?)",
+                (config_hash,),
+            )
+            self.connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)", changed_rows)
+            self.connection.executemany("DELETE FROM results WHERE need_id = ?", [(need_id,) for need_id in existing])
+            if complete:
+                self._update_snapshot(digests or {}, needs or {})
+                self.connection.execute("DELETE FROM models")
+                self.connection.executemany("INSERT INTO models VALUES (?, ?)", (model_hashes or {}).items())
+        return len(changed_rows) + len(existing)
+
+    def _update_snapshot(self, digests: Mapping[str, str], needs: Mapping[str, Any]) -> None:
+        """Replace the stored need digests and snapshot, only changed needs are written."""
+        existing = dict(self.connection.execute("SELECT need_id, digest FROM needs"))
+        changed_rows = [
+            (need_id, digest, get_need_snapshot(needs[need_id]))
+            for need_id, digest in digests.items()
+            if existing.pop(need_id, None) != digest
+        ]
+        self.connection.executemany("INSERT OR REPLACE INTO needs VALUES (?, ?, ?)", changed_rows)
+        self.connection.executemany("DELETE FROM needs WHERE need_id = ?", [(need_id,) for need_id in existing])
+
+    def get_need_count(self) -> int:
+        """Return the number of needs with a stored result."""
+        count: int = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return count
+
+    def is_failed(self, need_id: str) -> bool:
+        """Return whether the stored result of a need has validation errors."""
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM results WHERE need_id = ? AND position IS NOT NULL", (need_id,)
+            ).fetchone()
+            is not None
+        )
+
+    def iter_failures(self, docname: Optional[str] = None) -> Iterator[NeedFailure]:
+        """
+        Yield all failed needs in report order.
+
+        :param docname: only yield failed needs of this document
+        """
+        query = "SELECT need_id, model, errors, docname FROM results WHERE position IS NOT NULL"
+        parameters: Tuple[str, ...] = ()
+        if docname is not None:
+            query += " AND docname = ?"
+            parameters = (docname,)
+        for need_id, model, errors, failure_docname in self.connection.execute(
+            query + " ORDER BY position", parameters
+        ):
+            yield NeedFailure(need_id, model, _load_errors(errors), failure_docname)
+
+    def get_failures(self, docname: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Return the rendered messages of all failed needs in report order.
+
+        :param docname: only return failed needs of this document
+        :return: mapping of need ID to validation messages
+        """
+        return {failure.need_id: render_messages(failure) for failure in self.iter_failures(docname)}
+
+
+def _load_errors(errors: str) -> List[ErrorDict]:
+    """Return the stored errors of a need, successful needs have no errors."""
+    loaded: List[ErrorDict] = json.loads(errors) if errors else []
+    return loaded
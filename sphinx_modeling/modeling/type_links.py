@@ -0,0 +1,148 @@
+"""
+ID-only validation of type-only link models.
+
+Many link models only constrain the type of the linked need::
+
+    class LinkedStory(BaseModel):
+        type: Literal["story"]
+
+Links to such models get checked against an index of need ID to need type, so linked needs do neither get
+resolved nor passed through pydantic. Failing links are still validated by pydantic with the linked need type,
+so the error messages stay the same.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Tuple, Type
+
+from pydantic import BaseModel, Extra
+from pydantic.fields import ModelField
+from pydantic.typing import all_literal_values, is_literal_type
+from pydantic.utils import lenient_issubclass
+
+from sphinx_modeling.modeling.links import NeedView
+from sphinx_modeling.modeling.plan import iter_sub_model_fields
+
+
+FieldValidator = Callable[..., Any]
+
+
+def get_type_index(needs: Mapping[str, Mapping[str, Any]]) -> Dict[str, str]:
+    """Return the index of need ID to need type."""
+    return {need_id: need["type"] for need_id, need in needs.items()}
+
+
+def is_type_only_model(model: Any) -> bool:
+    """
+    Return whether a model only validates the need type against a Literal.
+
+    Models with validators or other fields are not type-only. Models that forbid or allow extra fields are not
+    type-only either, as their validation result depends on all fields of the linked need.
+    """
+    if not lenient_issubclass(model, BaseModel) or set(model.__fields__) != {"type"}:
+        return False
+    field = model.__fields__["type"]
+    return (
+        is_literal_type(field.outer_type_)
+        and not field.class_validators
+        and not model.__pre_root_validators__
+        and not model.__post_root_validators__
+        and model.__config__.extra == Extra.ignore
+    )
+
+
+def get_id_link_fields(model: Type[BaseModel], link_fields: Iterable[str]) -> FrozenSet[str]:
+    """
+    Return the link fields of a model that only validate type-only link models.
+
+    Those fields keep the linked need IDs instead of the resolved needs.
+
+    :param link_fields: names of all need fields that hold need links
+    """
+    id_link_fields = set()
+    for name in set(link_fields) & set(model.__fields__):
+        leaves = _get_leaf_fields(model.__fields__[name])
+        if all(not leaf.class_validators and is_type_only_model(leaf.type_) for leaf in leaves):
+            id_link_fields.add(name)
+    return frozenset(id_link_fields)
+
+
+def keep_link_ids(
+    reduced_need: Dict[str, Any], need: Mapping[str, Any], id_link_fields: FrozenSet[str], needs: Mapping[str, Any]
+) -> None:
+    """
+    Replace resolved link fields with the IDs of the linked needs.
+
+    Like for link resolution, IDs of needs that do not exist are removed.
+
+    :param reduced_need: need dictionary as passed to pydantic, gets updated
+    :param need: need view or need dictionary the reduced need was created from
+    """
+    raw_need = need.need if isinstance(need, NeedView) else need
+    for field in id_link_fields:
+        if field in reduced_need:
+            value = raw_need[field]
+            if isinstance(value, list):
+                value = [link_target for link_target in value if link_target in needs]
+            reduced_need[field] = value
+
+
+class TypeIndexValidation:
+    """
+    Context manager that validates type-only link models against the need type index.
+
+    The validators of all fields that hold a type-only link model get replaced while the context is active.
+    """
+
+    def __init__(self, models: List[Type[BaseModel]], type_index: Dict[str, str]) -> None:
+        """Collect the fields of all given models and their nested models."""
+        self.type_index = type_index
+        self._fields = [
+            field
+            for field in iter_sub_model_fields(models)
+            if not field.class_validators and is_type_only_model(field.type_)
+        ]
+        self._original_validators: List[Tuple[ModelField, List[FieldValidator]]] = []
+
+    def __enter__(self) -> "TypeIndexValidation":
+        """Replace the field validators with type index lookups."""
+        for field in self._fields:
+            self._original_validators.append((field, field.validators))
+            field.validators = [self._create_validator(field.type_, field.validators)]
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Restore the original field validators."""
+        for field, validators in reversed(self._original_validators):
+            field.validators = validators
+        self._original_validators = []
+
+    def _create_validator(self, model: Type[BaseModel], validators: List[FieldValidator]) -> FieldValidator:
+        """Create a field validator that checks a linked need ID or need view by its type."""
+        permitted = frozenset(all_literal_values(model.__fields__["type"].outer_type_))
+        type_index = self.type_index
+
+        def validate(cls: Any, value: Any, values: Any, field: ModelField, config: Any) -> Any:
+            if isinstance(value, str) and value in type_index:
+                value = {"type": type_index[value]}
+            elif isinstance(value, Mapping) and "type" in value:
+                value = {"type": value["type"]}  # other fields are ignored by the model
+            if isinstance(value, dict) and value.get("type") in permitted:
+                return model.construct(_fields_set={"type"}, type=value["type"])
+            # let pydantic create the error message
+            for validator in validators:
+                value = validator(cls, value, values, field, config)
+            return value
+
+        return validate
+
+
+def _get_leaf_fields(field: ModelField) -> List[ModelField]:
+    """Return all fields without sub fields, e.g. the item field of a list."""
+    leaves: List[ModelField] = []
+    pending: List[ModelField] = [field]
+    while pending:
+        current = pending.pop()
+        if current.sub_fields:
+            pending.extend(current.sub_fields)
+        else:
+            leaves.append(current)
+    return leaves
@@ -0,0 +1,175 @@
+"""
+Streaming reader of sphinx-needs ``needs.json`` files.
+
+The needs of a single version are parsed one by one, so only a single need is held in memory at a time.
+Everything else in the file, like other versions or filters, is skipped without being parsed into objects.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple
+
+
+CHUNK_SIZE = 1 << 16
+"""Number of characters read from the file at once."""
+
+_WHITESPACE = re.compile(r"\s*")
+_STRUCTURE = re.compile(r'["{}\[\]]')
+_STRING_END = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[\s,}\]]")
+
+
+class _JsonReader:
+    """Reader that walks a JSON document token by token with a bounded buffer."""
+
+    def __init__(self, fp: TextIO) -> None:
+        """Start reading at the beginning of the file."""
+        self.fp = fp
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Drop the consumed part of the buffer and read the next chunk, return whether data was added."""
+        chunk = self.fp.read(CHUNK_SIZE)
+        self.buffer = self.buffer[self.pos :] + chunk  # noqa: E203
+        self.pos = 0
+        self.eof = not chunk
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it, empty at the end of the file."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos : self.pos + 1]  # noqa: E203
+
+    def expect(self, char: str) -> None:
+        """Consume the given character."""
+        if self.peek() != char:
+            raise ValueError(f"invalid JSON: expected '{char}' at '{self.buffer[self.pos : self.pos + 20]}'")
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """Parse and return the next value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            if end == len(self.buffer) and not self.eof:
+                self._fill()  # a number could continue in the next chunk
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Consume the next value without parsing it."""
+        if self.peek() not in "{[":
+            self._skip_scalar()
+            return
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                if not self._fill():
+                    raise ValueError("invalid JSON: unexpected end of file")
+                continue
+            self.pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._skip_string_rest()
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if not depth:
+                    return
+
+    def iter_object(self) -> Iterator[str]:
+        """Consume an object and yield its keys, the caller has to consume each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return
+
+    def _skip_scalar(self) -> None:
+        """Consume a string, number or literal."""
+        if self.peek() == '"':
+            self.pos += 1
+            self._skip_string_rest()
+            return
+        while True:
+            match = _SCALAR_END.search(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.start()
+                return
+            self.pos = len(self.buffer)
+            if not self._fill():
+                return
+
+    def _skip_string_rest(self) -> None:
+        """Consume the rest of a string after its opening quote."""
+        while True:
+            match = _STRING_END.search(self.buffer, self.pos)
+            if match is None or (match.group() == "\\" and match.end() == len(self.buffer)):
+                # keep a trailing backslash, the escaped character follows in the next chunk
+                self.pos = len(self.buffer) if match is None else match.start()
+                if not self._fill():
+                    raise ValueError("invalid JSON: unterminated string")
+                continue
+            if match.group() == "\\":
+                self.pos = match.end() + 1
+                continue
+            self.pos = match.end()
+            return
+
+
+def iter_needs(needs_path: str, version: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield need ID and need of a single version of a needs.json file, one need at a time.
+
+    sphinx-needs writes the keys sorted, so the current version is known before the versions get read.
+
+    :param needs_path: path to the needs.json file
+    :param version: version to read, defaults to the current version of the file
+    :raises ValueError: if the file does not contain the version or is no valid JSON
+    """
+    found = False
+    with open(needs_path, encoding="utf-8") as fp:
+        reader = _JsonReader(fp)
+        for key in reader.iter_object():
+            if key == "current_version" and version is None:
+                version = reader.read_value()
+            elif key == "versions":
+                if version is None:
+                    raise ValueError(f"needs.json has no current_version before its versions: {needs_path}")
+                for version_key in reader.iter_object():
+                    if version_key != version:
+                        reader.skip_value()
+                        continue
+                    found = True
+                    for field in reader.iter_object():
+                        if field != "needs":
+                            reader.skip_value()
+                            continue
+                        for need_id in reader.iter_object():
+                            yield need_id, reader.read_value()
+            else:
+                reader.skip_value()
+    if not found:
+        raise ValueError(f"needs.json does not contain version '{version}': {needs_path}")
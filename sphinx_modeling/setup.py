@@ -1,8 +1,6 @@
 """Extension entry point for Sphinx."""
-from contextlib import suppress
 import os
-import pickle
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from docutils import nodes
 from sphinx.application import Sphinx
@@ -10,14 +8,35 @@ from sphinx.config import Config
 from sphinx.environment import BuildEnvironment
 from sphinx_needs.api import add_dynamic_function, add_extra_option, add_need_type
 
+from sphinx_modeling.builder import MODELING_REPORT_FILE, ModelingBuilder, write_report
 from sphinx_modeling.logging import get_logger
-from sphinx_modeling.modeling.defaults import MODELING_REMOVE_BACKLINKS, MODELING_REMOVE_FIELDS, MODELING_RESOLVE_LINKS
+from sphinx_modeling.modeling.cache import get_changed_types, get_model_hashes
+from sphinx_modeling.modeling.defaults import (
+    MODELING_CACHE,
+    MODELING_FAIL_FAST,
+    MODELING_FAST_CHECK,
+    MODELING_INSTANCES,
+    MODELING_INSTANCES_MAX_SIZE,
+    MODELING_MAX_MESSAGES,
+    MODELING_MEMOIZE_LINKS,
+    MODELING_PARALLEL,
+    MODELING_PARALLEL_CHUNK_SIZE,
+    MODELING_PROFILE,
+    MODELING_REMOVE_BACKLINKS,
+    MODELING_REMOVE_FIELDS,
+    MODELING_RESOLVE_LINKS,
+    MODELING_TYPE_ONLY_LINKS,
+)
+from sphinx_modeling.modeling.errors import FailureReport, ModelingError
 from sphinx_modeling.modeling.main import check_model
+from sphinx_modeling.modeling.store import ResultStore
+from sphinx_modeling.standalone import StandaloneEnv
 
 
 VERSION = "0.2.0"
 MODELING_MSG_FOLDER = ".modeling"
-MODELING_MSG_FILE = "messages.pickle"
+MODELING_STORE_FILE = "results.sqlite"
+MODELING_PROFILE_FILE = "profile.json"
 
 
 def setup(app: Sphinx) -> Dict[str, Any]:
@@ -43,14 +62,83 @@ def setup(app: Sphinx) -> Dict[str, Any]:
         "modeling_resolve_links",
         MODELING_RESOLVE_LINKS,
         "html",
+        types={bool, str},  # a set, so -D modeling_resolve_links=lazy is not converted to a bool
+    )
+    app.add_config_value(
+        "modeling_max_messages",
+        MODELING_MAX_MESSAGES,
+        "html",
+        types=[int],
+    )
+    app.add_config_value(
+        "modeling_fail_fast",
+        MODELING_FAIL_FAST,
+        "html",
+        types=[int],
+    )
+    app.add_config_value(
+        "modeling_cache",
+        MODELING_CACHE,
+        "html",
         types=[bool],
     )
+    app.add_config_value(
+        "modeling_memoize_links",
+        MODELING_MEMOIZE_LINKS,
+        "html",
+        types=[bool],
+    )
+    app.add_config_value(
+        "modeling_type_only_links",
+        MODELING_TYPE_ONLY_LINKS,
+        "html",
+        types=[bool],
+    )
+    app.add_config_value(
+        "modeling_fast_check",
+        MODELING_FAST_CHECK,
+        "html",
+        types=[bool],
+    )
+    app.add_config_value(
+        "modeling_profile",
+        MODELING_PROFILE,
+        "html",
+        types=[bool],
+    )
+    app.add_config_value(
+        "modeling_instances",
+        MODELING_INSTANCES,
+        "html",
+        types=[str],
+    )
+    app.add_config_value(
+        "modeling_instances_max_size",
+        MODELING_INSTANCES_MAX_SIZE,
+        "html",
+        types=[int],
+    )
+    app.add_config_value(
+        "modeling_parallel",
+        MODELING_PARALLEL,
+        "html",
+        types=[bool, int],
+    )
+    app.add_config_value(
+        "modeling_parallel_chunk_size",
+        MODELING_PARALLEL_CHUNK_SIZE,
+        "html",
+        types=[int],
+    )
+
+    app.add_builder(ModelingBuilder)
 
     # events
     # app.connect("config-inited", sphinx_needs_generate_config)  # not yet implemented
     app.connect("env-before-read-docs", prepare_env)
     app.connect("env-before-read-docs", emit_old_messages)
     app.connect("doctree-resolved", process_models, 1000)  # call this after sphinx-needs finished processing
+    app.connect("build-finished", write_modeling_report)
 
     return {
         "version": VERSION,  # identifies the version of our extension
@@ -71,34 +159,83 @@ def prepare_env(app: Sphinx, env: BuildEnvironment, _docname: str) -> None:
         env.needs_modeling_workflow = {  # type: ignore
             "models_checked": False,
         }
+    # the flag can be set before the environment gets pickled, see emit_old_messages
+    env.needs_modeling_workflow["models_checked"] = False  # type: ignore
+    # the validation runs only in the main process; builders may resolve doctrees in forked worker processes
+    # which have their own copy of the env and would validate all needs again
+    env.needs_modeling_workflow["main_pid"] = os.getpid()  # type: ignore
 
 
 def process_models(app: Sphinx, doctree: nodes.document, fromdocname: str) -> None:
     """Check the user provided models against all needs."""
     env = app.builder.env
-    msg_path = _get_modeling_msg_file_path(app)
-    check_model(env, msg_path)
+    if env.needs_modeling_workflow["main_pid"] != os.getpid():  # type: ignore
+        return
+    store_path = _get_modeling_store_file_path(app)
+    profile_path = _get_modeling_profile_file_path(app)
+    check_model(env, store_path, profile_path)
 
 
 def emit_old_messages(app: Sphinx, env: BuildEnvironment, docnames: List[str]) -> None:
-    """Emit previous log messages in case no document changed in an incremental build."""
+    """
+    Emit previous log messages in case no document changed in an incremental build.
+
+    If models changed, the needs get validated against the snapshot of the previous build instead.
+    """
     if not docnames:
         # incremental build detected without a single document changed which means sphinx-needs
         # does not calculate parent_needs, parent_need and backlinks; this happens only
         # when doctree-resolved gets fired; it means modeling cannot correctly validate models;
         # therefore previous messages are logged as those have not changed
         log = get_logger(__name__)
-        msg_path = _get_modeling_msg_file_path(app)
-        with suppress(FileNotFoundError), open(msg_path, "rb") as fp:
-            # if the file does not exist, no messages can be emitted, maybe the file was manually deleted
-            messages = pickle.load(fp)
-            for msg in messages:
-                log.warning(msg)
+        store_path = _get_modeling_store_file_path(app)
+        if not os.path.exists(store_path):
+            # no messages can be emitted, maybe the file was manually deleted
+            return
+        with ResultStore(store_path) as store:
+            previous_hashes = store.get_model_hashes()
+            changed_types = get_changed_types(previous_hashes, get_model_hashes(app.config.modeling_models))
+            snapshot = store.get_snapshot() if previous_hashes and changed_types else {}
+        if snapshot:
+            # models got edited in conf.py, which does not make Sphinx read documents again
+            log.info(f"Model validation: models of need types {', '.join(changed_types)} changed")
+            snapshot_env = StandaloneEnv(snapshot, app.config)  # type: ignore[arg-type]
+            check_model(snapshot_env, store_path, _get_modeling_profile_file_path(app))  # type: ignore[arg-type]
+            env.needs_modeling_workflow["models_checked"] = True  # type: ignore
+            return
+        if previous_hashes and changed_types:
+            log.warning(
+                f"Model validation: models of need types {', '.join(changed_types)} changed, but no need snapshot "
+                "exists to validate them; activate modeling_cache or rebuild all documents"
+            )
+        fail_fast = app.config.modeling_fail_fast
+        report = FailureReport(app.config.modeling_max_messages)
+        messages = []
+        with ResultStore(store_path) as store:
+            for failure in store.iter_failures():
+                messages.extend(report.add(failure))
+                if fail_fast and report.count >= fail_fast:
+                    # warnings logged while reading are only emitted after reading, so they would get lost
+                    stopped = f"Model validation: stopped after {report.count} failed needs (modeling_fail_fast)"
+                    raise ModelingError("\n".join(messages + [stopped]))
+        for msg in messages + report.get_summary():
+            log.warning(msg)
+
+
+def write_modeling_report(app: Sphinx, exception: Optional[Exception]) -> None:
+    """Write the report of the modeling builder, also for builds without outdated documents."""
+    if exception is None and isinstance(app.builder, ModelingBuilder):
+        write_report(_get_modeling_store_file_path(app), os.path.join(app.outdir, MODELING_REPORT_FILE))
+
+
+def _get_modeling_store_file_path(app: Sphinx) -> str:
+    """Return path to the modeling result store."""
+    return os.path.join(app.outdir, MODELING_MSG_FOLDER, MODELING_STORE_FILE)
 
 
-def _get_modeling_msg_file_path(app: Sphinx) -> str:
-    """Return path to the modeling messages pickle file."""
-    return os.path.join(app.outdir, MODELING_MSG_FOLDER, MODELING_MSG_FILE)
+def _get_modeling_profile_file_path(app: Sphinx) -> str:
+    """Return path to the modeling validation profile file."""
+    return os.path.join(app.outdir, MODELING_MSG_FOLDER, MODELING_PROFILE_FILE)
 
 
 def sphinx_needs_generate_config(
@@ -0,0 +1,260 @@
+"""
+Validation of sphinx-needs ``needs.json`` exports without running Sphinx.
+
+The models and the link configuration are read from a Sphinx ``conf.py``. The exported needs are brought into
+the shape they have in the Sphinx environment, so they get validated by the same logic as in a Sphinx build.
+"""
+
+from contextlib import ExitStack
+import json
+import os
+from types import SimpleNamespace
+from typing import Any, Dict, Generator, List, Mapping, NamedTuple, Optional, Set
+
+from sphinx.config import eval_config_file
+from sphinx.util.tags import Tags
+
+from sphinx_modeling.modeling.aggregates import get_aggregate_constraints
+from sphinx_modeling.modeling.defaults import (
+    MODELING_CACHE,
+    MODELING_FAIL_FAST,
+    MODELING_FAST_CHECK,
+    MODELING_INSTANCES,
+    MODELING_INSTANCES_MAX_SIZE,
+    MODELING_MAX_MESSAGES,
+    MODELING_MEMOIZE_LINKS,
+    MODELING_PARALLEL,
+    MODELING_PARALLEL_CHUNK_SIZE,
+    MODELING_PROFILE,
+    MODELING_REMOVE_BACKLINKS,
+    MODELING_REMOVE_FIELDS,
+    MODELING_RESOLVE_LINKS,
+    MODELING_TYPE_ONLY_LINKS,
+)
+from sphinx_modeling.modeling.fast_check import compile_checker
+from sphinx_modeling.modeling.main import _validate_need
+from sphinx_modeling.modeling.plan import ValidationPlan
+from sphinx_modeling.modeling.store import NeedResult
+from sphinx_modeling.modeling.type_links import TypeIndexValidation, get_id_link_fields
+from sphinx_modeling.needs_json import iter_needs
+
+
+CONFIG_DEFAULTS: Dict[str, Any] = {
+    "modeling_models": {},
+    "modeling_remove_fields": MODELING_REMOVE_FIELDS,
+    "modeling_remove_backlinks": MODELING_REMOVE_BACKLINKS,
+    "modeling_resolve_links": MODELING_RESOLVE_LINKS,
+    "modeling_max_messages": MODELING_MAX_MESSAGES,
+    "modeling_fail_fast": MODELING_FAIL_FAST,
+    "modeling_cache": MODELING_CACHE,
+    "modeling_memoize_links": MODELING_MEMOIZE_LINKS,
+    "modeling_type_only_links": MODELING_TYPE_ONLY_LINKS,
+    "modeling_fast_check": MODELING_FAST_CHECK,
+    "modeling_instances": MODELING_INSTANCES,
+    "modeling_instances_max_size": MODELING_INSTANCES_MAX_SIZE,
+    "modeling_profile": MODELING_PROFILE,
+    "modeling_parallel": MODELING_PARALLEL,
+    "modeling_parallel_chunk_size": MODELING_PARALLEL_CHUNK_SIZE,
+    "needs_extra_links": [],
+}
+"""Configuration values read from conf.py, with their defaults."""
+
+COMMON_LINK_TYPES = ["links", "parent_needs"]
+"""Link types that sphinx-needs always adds to needs_extra_links."""
+
+
+class NeedsIndex(NamedTuple):
+    """Compact index of all needs of a needs.json file, built by :func:`index_needs`."""
+
+    types: Dict[str, str]
+    """Need type by need ID."""
+    back_links: Dict[str, Dict[str, List[str]]]
+    """Back links by need ID and back link field, only for the back link fields missing in the export."""
+    missing_back_link_types: Set[str]
+    """Link types whose back links are missing in the export."""
+
+
+class StandaloneEnv:
+    """Stand-in for the Sphinx environment with the attributes used by the validation."""
+
+    def __init__(self, needs: Mapping[str, Any], config: SimpleNamespace) -> None:
+        """
+        Create the environment.
+
+        :param needs: all needs in the shape of the Sphinx environment
+        :param config: configuration as returned by :func:`load_config` or the Sphinx configuration
+        """
+        self.needs_all_needs = needs
+        self.config = config
+        self.needs_modeling_workflow = {"models_checked": False}
+
+
+def load_config(conf_path: str) -> SimpleNamespace:
+    """
+    Read the modeling and link configuration from a Sphinx conf.py.
+
+    The file is executed the same way as Sphinx does it. Link types that sphinx-needs adds on its own
+    get added to needs_extra_links.
+    """
+    namespace = eval_config_file(os.path.abspath(conf_path), Tags())
+    config = SimpleNamespace(**{name: namespace.get(name, default) for name, default in CONFIG_DEFAULTS.items()})
+    link_options = {link["option"] for link in config.needs_extra_links}
+    config.needs_extra_links = [
+        {"option": link_type} for link_type in COMMON_LINK_TYPES if link_type not in link_options
+    ] + list(config.needs_extra_links)
+    return config
+
+
+def load_needs(needs_path: str, version: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the needs of a single version from a needs.json file.
+
+    :param needs_path: path to the needs.json file
+    :param version: version to read, defaults to the current version of the file
+    :raises ValueError: if the file does not contain the version
+    """
+    with open(needs_path, encoding="utf-8") as fp:
+        needs_json = json.load(fp)
+    version = version or needs_json.get("current_version")
+    if version not in needs_json.get("versions", {}):
+        raise ValueError(f"needs.json does not contain version '{version}': {needs_path}")
+    needs: Dict[str, Dict[str, Any]] = needs_json["versions"][version]["needs"]
+    return needs
+
+
+def restore_need_fields(needs: Dict[str, Dict[str, Any]], link_types: List[str]) -> None:
+    """
+    Restore the need fields that sphinx-needs does not export to needs.json.
+
+    The export renames ``content`` to ``description`` and leaves out the back links of ``links``.
+    Missing back links get created the same way as sphinx-needs does it.
+
+    :param needs: exported needs, they get modified
+    :param link_types: all link options of needs_extra_links
+    """
+    for need in needs.values():
+        if "description" in need and "content" not in need:
+            need["content"] = need.pop("description")
+    for link_type in link_types:
+        link_type_back = f"{link_type}_back"
+        if all(link_type_back in need for need in needs.values()):
+            continue
+        for need in needs.values():
+            need[link_type_back] = []
+        for need_id, need in needs.items():
+            for link in need.get(link_type, []):
+                target = needs.get(link.split(".")[0])
+                if target is not None and need_id not in target[link_type_back]:
+                    target[link_type_back].append(need_id)
+
+
+def index_needs(needs_path: str, link_types: List[str], version: Optional[str] = None) -> NeedsIndex:
+    """
+    Stream a needs.json file and build the index of need types and missing back links.
+
+    :param needs_path: path to the needs.json file
+    :param link_types: all link options of needs_extra_links
+    :param version: version to read, defaults to the current version of the file
+    """
+    index = NeedsIndex({}, {}, set())
+    for need_id, need in iter_needs(needs_path, version):
+        if not index.types:
+            # the export either has the back links of a link type for all needs or for none
+            index.missing_back_link_types.update(
+                link_type for link_type in link_types if f"{link_type}_back" not in need
+            )
+        index.types[need_id] = need["type"]
+        for link_type in index.missing_back_link_types:
+            link_type_back = f"{link_type}_back"
+            for link in need.get(link_type, []):
+                back_links = index.back_links.setdefault(link.split(".")[0], {}).setdefault(link_type_back, [])
+                if need_id not in back_links:
+                    back_links.append(need_id)
+    return index
+
+
+def check_streamable(config: SimpleNamespace) -> None:
+    """
+    Check that all links can be validated by streaming validation.
+
+    Streaming validation only keeps the types of all needs, so linked needs can only be validated by type
+    and aggregate constraints, which need all needs at once, are not supported.
+
+    :raises ValueError: if link fields of models need the content of linked needs or models have aggregate constraints
+    """
+    aggregate_models = sorted(
+        model.__name__ for model in config.modeling_models.values() if get_aggregate_constraints(model)
+    )
+    if aggregate_models:
+        raise ValueError(
+            f"streaming validation does not support aggregate constraints, used by: {', '.join(aggregate_models)}"
+        )
+    if not config.modeling_resolve_links:
+        return
+    link_types = {link["option"] for link in config.needs_extra_links}
+    link_fields = link_types | {f"{link_type}_back" for link_type in link_types} | {"parent_need"}
+    unstreamable_link_fields = sorted(
+        f"{model.__name__}.{field}"
+        for model in config.modeling_models.values()
+        for field in (link_fields & set(model.__fields__)) - get_id_link_fields(model, link_fields)
+    )
+    if unstreamable_link_fields:
+        raise ValueError(
+            "streaming validation only supports links to type-only models, "
+            f"not supported are: {', '.join(unstreamable_link_fields)}"
+        )
+
+
+def iter_streaming_validation(
+    needs_path: str, config: SimpleNamespace, index: NeedsIndex, version: Optional[str] = None
+) -> Generator[NeedResult, None, None]:
+    """
+    Stream a needs.json file a second time and validate each need as soon as it is read.
+
+    Links get validated against the need types of the index, like with modeling_type_only_links.
+    User validators get the need types by need ID as ``all_needs``.
+
+    :param needs_path: path to the needs.json file
+    :param config: configuration as returned by :func:`load_config` or the Sphinx configuration
+    :param index: index of the same needs.json file as returned by :func:`index_needs`
+    :param version: version to read, defaults to the current version of the file
+    :raises ValueError: if link fields need the content of linked needs, see :func:`check_streamable`
+    """
+    check_streamable(config)
+    link_types = [link["option"] for link in config.needs_extra_links]
+    link_fields = set(link_types) | {f"{link_type}_back" for link_type in link_types} | {"parent_need"}
+    plans = {
+        need_type: ValidationPlan(
+            model,
+            config.modeling_remove_fields,
+            config.modeling_remove_backlinks,
+            [f"{link_type}_back" for link_type in link_types],
+            get_id_link_fields(model, link_fields) if config.modeling_resolve_links else (),
+            compile_checker(model) if config.modeling_fast_check else None,
+        )
+        for need_type, model in config.modeling_models.items()
+    }
+    env = StandaloneEnv(index.types, config)
+    with ExitStack() as stack:
+        if config.modeling_resolve_links:
+            stack.enter_context(TypeIndexValidation(list(config.modeling_models.values()), index.types))
+        for need_id, need in iter_needs(needs_path, version):
+            plan = plans.get(need["type"])
+            if plan is None:
+                continue
+            if "description" in need and "content" not in need:
+                need["content"] = need.pop("description")
+            back_links = index.back_links.get(need_id, {})
+            for link_type in index.missing_back_link_types:
+                need[f"{link_type}_back"] = back_links.get(f"{link_type}_back", [])
+            # instances are not kept, so memory does not grow with the number of needs
+            errors = _validate_need(
+                need,
+                index.types,
+                env,  # type: ignore[arg-type]
+                plan,
+                None,
+                keep_instance=False,
+                type_index=index.types if config.modeling_resolve_links else None,
+            )
+            yield NeedResult(need_id, need.get("docname"), plan.model.__name__, None, errors)
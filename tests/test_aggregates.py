@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from sphinx_modeling.modeling.aggregates import AggregateConstraint, LinkCount, Unique, get_aggregate_errors
+from sphinx_modeling.modeling.main import BaseModelNeeds, iter_validation
+from sphinx_modeling.modeling.query import NeedsQuery
+from sphinx_modeling.standalone import CONFIG_DEFAULTS, StandaloneEnv, check_streamable
+
+
+NEEDS = {
+    "US_001": {"id": "US_001", "type": "story", "title": "Login", "links": []},
+    "US_002": {"id": "US_002", "type": "story", "title": "Login", "links": []},
+    "US_003": {"id": "US_003", "type": "story", "title": "Logout", "links": ["US_001"]},
+    "TC_001": {"id": "TC_001", "type": "test", "title": "Test", "links": ["US_001", "US_003"]},
+}
+
+
+class Story(BaseModelNeeds):
+    id: str
+    title: str
+
+    class Config:
+        aggregate_constraints = [
+            Unique("title"),
+            LinkCount("links", direction="incoming", need_type="test", min_items=1),
+        ]
+
+
+class TestCase(BaseModelNeeds):
+    id: str
+    links: List[str]
+
+    class Config:
+        aggregate_constraints = [LinkCount("links", max_items=1)]
+
+
+def test_get_aggregate_errors():
+    errors = get_aggregate_errors({"story": Story, "test": TestCase}, NeedsQuery(NEEDS))
+
+    assert sorted(errors) == ["TC_001", "US_001", "US_002"]
+    assert errors["US_001"] == [
+        {
+            "loc": ["title"],
+            "msg": "value is not unique, also used by US_002",
+            "type": "value_error.aggregate.unique",
+            "ctx": "value=Login",
+        }
+    ]
+    assert [error["type"] for error in errors["US_002"]] == [
+        "value_error.aggregate.unique",
+        "value_error.aggregate.min_items",
+    ]
+    assert errors["US_002"][1]["msg"] == "ensure at least 1 incoming links of type 'links' from test needs"
+    assert errors["TC_001"] == [
+        {
+            "loc": ["links"],
+            "msg": "ensure at most 1 outgoing links of type 'links'",
+            "type": "value_error.aggregate.max_items",
+            "ctx": "count=2; limit_value=1",
+        }
+    ]
+
+    with pytest.raises(ValueError, match="direction must be one of"):
+        LinkCount(direction="both")
+
+
+def test_aggregate_errors_in_validation():
+    config = SimpleNamespace(**{**CONFIG_DEFAULTS, "modeling_models": {"story": Story, "test": TestCase}})
+    config.modeling_resolve_links = False
+
+    results = {result.need_id: result.errors for result in iter_validation(StandaloneEnv(NEEDS, config))}
+    assert [need_id for need_id, errors in results.items() if errors] == ["US_001", "US_002", "TC_001"]
+
+    with pytest.raises(ValueError, match="does not support aggregate constraints, used by: Story, TestCase"):
+        check_streamable(config)
+
+
+def test_aggregate_constraint_without_check():
+    class Incomplete(AggregateConstraint):
+        pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
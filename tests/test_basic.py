@@ -27,3 +27,22 @@ def test_modeling_success(test_app):
     assert out.returncode == 0
 
     assert "Validation was successful!" in out.stdout.decode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling"}],
+    indirect=True,
+)
+def test_modeling_success_lazy_links(test_app):
+    app = test_app
+
+    src_dir = Path(app.srcdir)
+    out_dir = src_dir / "_build"
+
+    out = subprocess.run(
+        ["sphinx-build", "-M", "html", src_dir, out_dir, "-D", "modeling_resolve_links=lazy"], capture_output=True
+    )
+    assert out.returncode == 0
+
+    assert "Validation was successful!" in out.stdout.decode("utf-8")
@@ -0,0 +1,43 @@
+import json
+from pathlib import Path
+import subprocess
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling"}],
+    indirect=True,
+)
+def test_modeling_builder(test_app):
+    app = test_app
+
+    src_dir = Path(app.srcdir)
+    index_rst = src_dir / "index.rst"
+    index_rst.write_text(index_rst.read_text(encoding="utf8").replace(":active: True", ":active: Maybe", 1))
+    out_dir = src_dir / "_build"
+    build_cmd = ["sphinx-build", "-b", "modeling", src_dir, out_dir]
+
+    out = subprocess.run(build_cmd, capture_output=True)
+    assert out.returncode == 0
+    assert "Model validation: failed for need US_001" in out.stdout.decode("utf-8")
+    assert not (out_dir / "index.html").exists()
+
+    report = json.loads((out_dir / "report.json").read_text(encoding="utf8"))
+    assert report["needs"] == 7
+    assert report["failed_needs"] == 1
+    assert report["failures"][0]["id"] == "US_001"
+    assert report["failures"][0]["docname"] == "index"
+    assert report["failures"][0]["errors"][0]["loc"] == ["active"]
+
+    # no document changed, the messages are emitted from the result store
+    out = subprocess.run(build_cmd, capture_output=True)
+    assert out.returncode == 0
+    assert "Model validation: failed for need US_001" in out.stderr.decode("utf-8")
+
+    # the report is written although Sphinx finds no outdated documents and skips the builder's finish()
+    (out_dir / "report.json").unlink()
+    out = subprocess.run(build_cmd, capture_output=True)
+    assert out.returncode == 0
+    assert json.loads((out_dir / "report.json").read_text(encoding="utf8"))["failed_needs"] == 1
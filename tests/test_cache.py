@@ -0,0 +1,71 @@
+from pathlib import Path
+import subprocess
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling"}],
+    indirect=True,
+)
+def test_modeling_cache(test_app):
+    app = test_app
+
+    src_dir = Path(app.srcdir)
+    out_dir = src_dir / "_build"
+    build_cmd = ["sphinx-build", "-v", "-D", "modeling_cache=1", "-b", "html", src_dir, out_dir]
+
+    out = subprocess.run(build_cmd, capture_output=True)
+    assert out.returncode == 0
+    assert "Validation was successful!" in out.stdout.decode("utf-8")
+    assert (out_dir / ".modeling" / "results.sqlite").exists()
+
+    index_rst = src_dir / "index.rst"
+    index_rst.write_text(index_rst.read_text(encoding="utf8").replace(":active: True", ":active: Maybe"))
+    out = subprocess.run(build_cmd, capture_output=True)
+    stdout = out.stdout.decode("utf-8")
+    assert "re-used 6 of 7 cached results" in stdout
+    assert "Model validation: failed for need US_001" in stdout
+
+    # fresh environment, all results come from the cache but are still reported
+    out = subprocess.run(build_cmd + ["-E"], capture_output=True)
+    stdout = out.stdout.decode("utf-8")
+    assert "re-used 7 of 7 cached results" in stdout
+    assert "Model validation: failed for need US_001" in stdout
+
+    # a linked need invalidates the needs that resolve it: SP_001 links and TC_001 is nested in IM_001
+    index_rst.write_text(index_rst.read_text(encoding="utf8").replace(":impact: True", ":impact: False", 1))
+    out = subprocess.run(build_cmd, capture_output=True)
+    stdout = out.stdout.decode("utf-8")
+    assert "re-used 4 of 7 cached results, 2 needs depend on changed needs" in stdout
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling"}],
+    indirect=True,
+)
+def test_modeling_cache_changed_model(test_app):
+    app = test_app
+
+    src_dir = Path(app.srcdir)
+    conf_py = src_dir / "conf.py"
+    build_cmd = ["sphinx-build", "-v", "-b", "html", src_dir, src_dir / "_build"]
+    cache_build_cmd = build_cmd[:2] + ["-D", "modeling_cache=1"] + build_cmd[2:]
+    assert subprocess.run(cache_build_cmd, capture_output=True).returncode == 0
+    assert subprocess.run(build_cmd[:-1] + [src_dir / "_build_no_cache"], capture_output=True).returncode == 0
+
+    # editing a model in conf.py does not make Sphinx read any document
+    conf_py.write_text(
+        conf_py.read_text(encoding="utf8").replace('importance: Literal["HIGH"]', 'importance: Literal["LOW"]')
+    )
+    out = subprocess.run(cache_build_cmd, capture_output=True)
+    stdout = out.stdout.decode("utf-8")
+    assert "Model validation: models of need types spec changed" in stdout
+    assert "re-used 6 of 7 cached results" in stdout
+    assert "Model validation: failed for need SP_001" in stdout
+
+    # without the cache no snapshot of the needs exists
+    out = subprocess.run(build_cmd[:-1] + [src_dir / "_build_no_cache"], capture_output=True)
+    assert "models of need types spec changed, but no need snapshot exists" in out.stderr.decode("utf-8")
@@ -0,0 +1,41 @@
+from pathlib import Path
+import subprocess
+
+import pytest
+
+from sphinx_modeling.cli import EXIT_ERROR, EXIT_FAILED, main
+from sphinx_modeling.modeling.main import PYDANTIC_INSTANCES
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling"}],
+    indirect=True,
+)
+def test_cli_validate(test_app, capsys):
+    app = test_app
+
+    src_dir = Path(app.srcdir)
+    index_rst = src_dir / "index.rst"
+    index_rst.write_text(index_rst.read_text(encoding="utf8").replace(":active: True", ":active: Maybe", 1))
+    out_dir = src_dir / "_build"
+    out = subprocess.run(["sphinx-build", "-b", "needs", src_dir, out_dir], capture_output=True)
+    assert out.returncode == 0
+    needs_json = str(out_dir / "needs.json")
+    conf_py = str(src_dir / "conf.py")
+
+    assert main(["validate", needs_json, "--conf", conf_py]) == EXIT_FAILED
+    stdout = capsys.readouterr().out
+    assert "Model validation: failed for need US_001" in stdout
+    # needs.json holds the content as description, it gets restored so models validate as in a Sphinx build
+    assert "Model validation: failed for need US_002" not in stdout
+    assert "Model validation: 1 of 7 validated needs failed" in stdout
+    # instances of valid needs are not retained on the command line
+    assert PYDANTIC_INSTANCES.mode == "off"
+    assert len(PYDANTIC_INSTANCES) == 0
+
+    assert main(["validate", needs_json, "--conf", conf_py, "--stream"]) == EXIT_FAILED
+    assert capsys.readouterr().out == stdout
+
+    assert main(["validate", needs_json, "--conf", conf_py, "--needs-version", "9.9"]) == EXIT_ERROR
+    assert "does not contain version '9.9'" in capsys.readouterr().err
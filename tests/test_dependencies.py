@@ -0,0 +1,79 @@
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Extra
+
+from sphinx_modeling.modeling.dependencies import get_changed_needs, get_dependents, get_resolution_depth
+from sphinx_modeling.modeling.graph import LinkGraph
+
+
+LINK_FIELDS = {"links", "links_back", "parent_need"}
+
+NEEDS = {
+    "EP_001": {"id": "EP_001", "type": "epic", "links": [], "links_back": ["US_001"]},
+    "US_001": {"id": "US_001", "type": "story", "links": ["EP_001"], "links_back": ["SP_001"]},
+    "SP_001": {"id": "SP_001", "type": "spec", "links": ["US_001"], "links_back": []},
+    "SP_002": {"id": "SP_002", "type": "spec", "links": ["XX_001"], "links_back": []},
+}
+
+
+class LinkedEpic(BaseModel):
+    type: str
+
+
+class LinkedStory(BaseModel):
+    type: str
+    links: List[LinkedEpic]
+
+
+class Spec(BaseModel):
+    id: str
+    links: List[LinkedStory]
+
+
+class Story(BaseModel):
+    id: str
+    links: List[str]
+
+
+class Epic(BaseModel):
+    id: str
+
+
+class Node(BaseModel):
+    links: List["Node"]
+
+
+Node.update_forward_refs()
+
+
+class Loose(BaseModel, extra=Extra.allow):
+    id: str
+
+
+class Untyped(BaseModel):
+    links: Optional[Any]
+
+
+def test_resolution_depth():
+    assert get_resolution_depth(Epic, LINK_FIELDS) == 0
+    assert get_resolution_depth(Story, LINK_FIELDS) == 1
+    assert get_resolution_depth(Spec, LINK_FIELDS) == 2
+    assert get_resolution_depth(Node, LINK_FIELDS) is None
+    assert get_resolution_depth(Loose, LINK_FIELDS) is None
+    assert get_resolution_depth(Untyped, LINK_FIELDS) is None
+
+
+def test_dependents():
+    graph = LinkGraph(NEEDS)
+    resolved_fields = {"epic": frozenset(), "story": frozenset({"links"}), "spec": frozenset({"links"})}
+    depths = {"epic": 0, "story": 1, "spec": 2}
+
+    # SP_001 resolves the epic through the story
+    assert get_dependents(graph, LINK_FIELDS, {"EP_001"}, resolved_fields, depths) == {"US_001", "SP_001"}
+    assert get_dependents(graph, LINK_FIELDS, {"EP_001"}, resolved_fields, {**depths, "spec": 1}) == {"US_001"}
+    # back links are not resolved into stories
+    assert "US_001" not in get_dependents(graph, LINK_FIELDS, {"SP_001"}, resolved_fields, depths)
+    # a need that gets added is resolved by needs that already link to it
+    assert get_changed_needs({"XX_001": "d"}, {}) == {"XX_001"}
+    assert get_dependents(graph, LINK_FIELDS, {"XX_001"}, resolved_fields, depths) == {"SP_002"}
+    assert get_changed_needs({"US_001": "a"}, {"US_001": "b", "XX_001": "c"}) == {"US_001", "XX_001"}
@@ -0,0 +1,62 @@
+from typing import List
+
+from pydantic import BaseModel, ValidationError, conlist
+import pytest
+
+from sphinx_modeling.modeling.errors import (
+    FailureReport,
+    NeedFailure,
+    get_exception_errors,
+    get_validation_errors,
+    render_messages,
+)
+
+
+try:
+    from typing import Literal
+except ImportError:
+    from typing_extensions import Literal
+
+
+class LinkedStory(BaseModel):
+    type: Literal["story"]
+
+
+class Spec(BaseModel):
+    id: str
+    links: conlist(LinkedStory, max_items=2)
+    tags: List[str]
+
+
+def get_failure(need_id, **fields):
+    with pytest.raises(ValidationError) as exc_info:
+        Spec(id=need_id, **fields)
+    return NeedFailure(need_id, "Spec", get_validation_errors(exc_info.value)), str(exc_info.value)
+
+
+def test_render_messages():
+    failure, text = get_failure("SP_001", links=[{"type": "story"}, {"type": "spec"}])
+    assert render_messages(failure) == ["Model validation: failed for need SP_001", text]
+
+    failure = NeedFailure("SP_002", "Spec", get_exception_errors(KeyError("id")))
+    assert render_messages(failure) == ["Model validation: failed for need SP_002", "KeyError('id')"]
+
+
+def test_report_summary():
+    failures = [
+        get_failure(f"SP_00{index}", links=[{"type": "story"}, {"type": "spec"}], tags=[])[0] for index in range(5)
+    ]
+    failures.append(get_failure("SP_010", links=[{"type": "spec"}, {"type": "story"}], tags=[])[0])
+
+    report = FailureReport(0)
+    assert sum(len(report.add(failure)) for failure in failures) == 12
+    assert report.get_summary() == []
+
+    report = FailureReport(2)
+    messages = [msg for failure in failures for msg in report.add(failure)]
+    assert messages == render_messages(failures[0]) + render_messages(failures[1])
+    assert report.count == 6
+    assert report.get_summary() == [
+        "Model validation: 6 needs failed, messages of 4 needs are not shown (see modeling_max_messages)",
+        "  Spec links -> * -> type (value_error.const): 6 needs, e.g. SP_000, SP_001, SP_002, ...",
+    ]
@@ -0,0 +1,32 @@
+from pathlib import Path
+import subprocess
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling"}],
+    indirect=True,
+)
+def test_modeling_fail_fast(test_app):
+    app = test_app
+
+    src_dir = Path(app.srcdir)
+    index_rst = src_dir / "index.rst"
+    index_rst.write_text(index_rst.read_text(encoding="utf8").replace(":active: True", ":active: Maybe"))
+    index_rst.write_text(index_rst.read_text(encoding="utf8").replace(":active: False", ":active: Maybe"))
+    build_cmd = ["sphinx-build", "-D", "modeling_fail_fast=1", "-b", "html", src_dir, src_dir / "_build"]
+
+    out = subprocess.run(build_cmd, capture_output=True)
+    stdout = out.stdout.decode("utf-8")
+    assert out.returncode != 0
+    assert "Model validation: failed for need US_001" in stdout
+    assert "Model validation: failed for need US_002" not in stdout
+    assert "stopped after 1 failed needs" in out.stderr.decode("utf-8")
+
+    # the environment of a failed build is not stored, so all needs get validated and stop the build again
+    out = subprocess.run(build_cmd, capture_output=True)
+    assert out.returncode != 0
+    assert "Model validation: failed for need US_001" in out.stdout.decode("utf-8")
+    assert "stopped after 1 failed needs" in out.stderr.decode("utf-8")
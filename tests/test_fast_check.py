@@ -0,0 +1,111 @@
+from itertools import product
+from types import SimpleNamespace
+from typing import List, Optional, Union
+
+from pydantic import BaseModel, Extra, ValidationError, conlist, constr, validator
+import pytest
+
+from sphinx_modeling.modeling.fast_check import compile_checker
+from sphinx_modeling.modeling.main import PYDANTIC_INSTANCES, BaseModelNeeds, iter_validation
+from sphinx_modeling.standalone import CONFIG_DEFAULTS, StandaloneEnv
+
+
+try:
+    from typing import Literal
+except ImportError:
+    from typing_extensions import Literal
+
+
+spec_id = constr(regex=r"^SP_[A-Z0-9]{3}", max_length=8)
+
+
+class LinkedStory(BaseModel):
+    type: Literal["story"]
+
+
+class Spec(BaseModelNeeds, extra=Extra.forbid):
+    id: spec_id
+    type: Literal["spec"]
+    active: Optional[Literal["True", "False"]]
+    tags: List[str] = []
+    owners: conlist(constr(min_length=2), min_items=1, max_items=2)
+    links: Optional[conlist(LinkedStory, min_items=1)]
+
+
+class SpecWithValidator(Spec):
+    @validator("id", allow_reuse=True)
+    def check_id(cls, value):  # noqa: N805
+        return value
+
+
+class SpecWithUnion(BaseModelNeeds):
+    links: Union[conlist(LinkedStory, max_items=1), List[str]]
+
+
+class SpecWithInt(BaseModelNeeds):
+    priority: int
+
+
+VALUES = {
+    "id": [None, "SP_001", "SP_0012345", "SP_ABC_long", "SP_1", "XSP_001", 1],
+    "type": [None, "spec", "story", ["spec"]],
+    "active": [None, "True", "true"],
+    "tags": [None, [], ["a"], ["a", 1], "a"],
+    "owners": [None, ["ab"], ["a"], ["ab", "cd", "ef"], [], ("ab",)],
+    "links": [None, [{"type": "story"}], [{"type": "spec"}], [], ["US_001"], [{"type": "story", "id": "US_001"}]],
+    "extra": [None, "value"],
+}
+
+
+def is_valid(model, values):
+    try:
+        model(**values, all_needs={}, env=None, needs_query=None)
+    except ValidationError:
+        return False
+    return True
+
+
+def test_compile_checker():
+    check = compile_checker(Spec)
+    assert check is not None
+    passed = 0
+    for combination in product(*VALUES.values()):
+        values = {name: value for name, value in zip(VALUES, combination) if value is not None}
+        if check(values, None):
+            passed += 1
+            # the checker must never accept a need pydantic rejects
+            assert is_valid(Spec, values), values
+    assert passed > 0
+
+    assert check({"id": "SP_001", "type": "spec", "owners": ["ab"], "links": ["US_001"]}, {"US_001": "story"})
+    assert not check({"id": "SP_001", "type": "spec", "owners": ["ab"], "links": ["SP_001"]}, {"SP_001": "spec"})
+
+
+@pytest.mark.parametrize("model", [SpecWithValidator, SpecWithUnion, SpecWithInt])
+def test_compile_checker_unsupported(model):
+    assert compile_checker(model) is None
+
+
+NEEDS = {
+    "US_001": {"id": "US_001", "type": "story", "links": []},
+    "SP_001": {"id": "SP_001", "type": "spec", "owners": ["ab"], "links": ["US_001"]},
+    "SP_002": {"id": "SP_002", "type": "spec", "owners": ["ab"], "links": ["SP_001"]},
+    "SP_003": {"id": "SP_003", "type": "spec", "owners": "ab", "links": []},
+}
+
+
+@pytest.mark.parametrize("type_only_links", [False, True])
+def test_fast_check_in_validation(type_only_links):
+    results = {}
+    for fast_check in (False, True):
+        config = SimpleNamespace(**{**CONFIG_DEFAULTS, "modeling_models": {"spec": Spec}})
+        config.modeling_fast_check = fast_check
+        config.modeling_type_only_links = type_only_links
+        PYDANTIC_INSTANCES.clear()
+        results[fast_check] = [result.errors for result in iter_validation(StandaloneEnv(NEEDS, config))]
+
+    # failing needs fall back to pydantic, so the errors are the same
+    assert results[True] == results[False]
+    assert [bool(errors) for errors in results[True]] == [False, True, True]
+    # valid needs are not instantiated
+    assert "SP_001" not in PYDANTIC_INSTANCES
@@ -0,0 +1,32 @@
+from sphinx_modeling.modeling.graph import LinkGraph
+
+
+NEEDS = {
+    "US_001": {"id": "US_001", "links": [], "parent_need": ""},
+    "SP_001": {"id": "SP_001", "links": ["US_001", "XX_001"], "parent_need": ""},
+    "SP_002": {"id": "SP_002", "links": ["US_001.p1", "US_001"], "parent_need": "SP_001"},
+}
+
+
+def ids(graph, positions):
+    return [graph.ids[position] for position in positions]
+
+
+def test_link_graph():
+    graph = LinkGraph(NEEDS)
+
+    offsets, targets = graph.get_adjacency("links")
+    assert list(offsets) == [0, 0, 2, 4]
+    assert ids(graph, targets) == ["US_001", "XX_001", "US_001.p1", "US_001"]
+    assert not graph.is_need(graph.positions["XX_001"])
+
+    assert ids(graph, graph.iter_targets("links", "SP_001")) == ["US_001", "XX_001"]
+    assert ids(graph, graph.iter_sources("links", "US_001")) == ["SP_001", "SP_002"]
+    assert ids(graph, graph.iter_sources("links", "XX_001")) == ["SP_001"]
+    assert ids(graph, graph.iter_sources("links", "YY_001")) == []
+    assert ids(graph, graph.iter_sources("parent_need", "SP_001")) == ["SP_002"]
+
+    # links to need parts count as links to the need
+    assert ids(graph, graph.iter_need_targets("links", "SP_002")) == ["US_001", "US_001"]
+    assert ids(graph, graph.iter_need_sources("links", "US_001")) == ["SP_001", "SP_002"]
+    assert ids(graph, graph.iter_need_sources("links", "XX_001")) == []
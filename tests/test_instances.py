@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sphinx_modeling.modeling.aggregates import Unique
+from sphinx_modeling.modeling.errors import ModelingError
+from sphinx_modeling.modeling.instances import InstanceStore
+from sphinx_modeling.modeling.main import PYDANTIC_INSTANCES, BaseModelNeeds, check_model, get_instance
+from sphinx_modeling.standalone import CONFIG_DEFAULTS, StandaloneEnv
+
+
+def test_instance_store_lru():
+    instances = InstanceStore("lru", 2)
+    instances["US_001"] = 1
+    instances["US_002"] = 2
+    assert instances["US_001"] == 1  # US_002 becomes the least recently used instance
+    instances["US_003"] = 3
+    assert dict(instances) == {"US_001": 1, "US_003": 3}
+
+    instances.configure("off", 0)
+    instances["US_001"] = 1
+    assert not instances
+
+    with pytest.raises(ModelingError, match="must be one of"):
+        instances.configure("weak", 0)
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling", "confoverrides": {"modeling_instances": "off"}}],
+    indirect=True,
+)
+def test_get_instance(test_app):
+    app = test_app
+    app.build()
+    assert not PYDANTIC_INSTANCES
+
+    instance = get_instance(app.env, "SP_001")
+    assert type(instance).__name__ == "Spec"
+    assert instance.links[0].type == "impl"
+    assert get_instance(app.env, "XX_001") is None
+
+
+class Story(BaseModelNeeds):
+    title: str
+
+    class Config:
+        aggregate_constraints = [Unique("title")]
+
+
+def test_get_instance_aggregate_failure(tmp_path):
+    needs = {
+        "US_001": {"id": "US_001", "type": "story", "title": "Login"},
+        "US_002": {"id": "US_002", "type": "story", "title": "Login"},
+        "US_003": {"id": "US_003", "type": "story", "title": "Logout"},
+    }
+    config = SimpleNamespace(**{**CONFIG_DEFAULTS, "modeling_models": {"story": Story}})
+    env = StandaloneEnv(needs, config)
+    check_model(env, str(tmp_path / "results.sqlite"))
+
+    # the needs only fail the aggregate constraint, pydantic alone would create their instances
+    assert sorted(PYDANTIC_INSTANCES) == ["US_003"]
+    assert get_instance(env, "US_001") is None
+    assert get_instance(env, "US_002") is None
+    assert "US_001" not in PYDANTIC_INSTANCES
+    PYDANTIC_INSTANCES.clear()
+    assert get_instance(env, "US_003").title == "Logout"
@@ -0,0 +1,107 @@
+from typing import List
+
+
+try:
+    from typing import Literal
+except ImportError:
+    from typing_extensions import Literal
+
+from pydantic import BaseModel, ValidationError
+import pytest
+
+from sphinx_modeling.modeling.links import LazyNeedViews, resolve_needs
+from sphinx_modeling.modeling.memo import LinkValidationMemo
+from sphinx_modeling.modeling.type_links import (
+    TypeIndexValidation,
+    get_id_link_fields,
+    get_type_index,
+    is_type_only_model,
+)
+
+
+NEEDS = {
+    "US_001": {"id": "US_001", "type": "story", "links": [], "links_back": ["SP_001"], "parent_need": ""},
+    "SP_001": {"id": "SP_001", "type": "spec", "links": ["US_001", "XX_404"], "links_back": [], "parent_need": ""},
+    "TC_001": {"id": "TC_001", "type": "test", "links": [], "links_back": [], "parent_need": "SP_001"},
+}
+LINK_TYPES = {"links", "links_back"}
+
+
+def test_resolve_needs_does_not_modify_needs():
+    views = resolve_needs(NEEDS, LINK_TYPES)
+
+    assert [linked["id"] for linked in views["SP_001"]["links"]] == ["US_001"]  # dead link removed
+    assert views["SP_001"]["links"][0]["links_back"][0] is views["SP_001"]
+    assert views["TC_001"]["parent_need"]["type"] == "spec"
+    assert dict(views["US_001"])["links"] == []
+    assert NEEDS["SP_001"]["links"] == ["US_001", "XX_404"]
+    assert NEEDS["TC_001"]["parent_need"] == "SP_001"
+
+
+def test_lazy_need_views():
+    views = LazyNeedViews(NEEDS, LINK_TYPES)
+
+    assert "SP_001" in views and not views.views  # existence checks do not create views
+    spec = views["SP_001"]
+    assert not spec.layer
+    assert spec["links"][0]["id"] == "US_001"
+    assert list(spec.layer) == ["links"]  # only the read link field got resolved
+    assert list(views.views) == ["SP_001", "US_001"]
+    assert views["TC_001"]["parent_need"] is spec
+    assert NEEDS["SP_001"]["links"] == ["US_001", "XX_404"]
+
+
+class LinkedStory(BaseModel):
+    type: Literal["story"]
+    links_back: List[str]
+
+
+class Spec(BaseModel):
+    links: List[LinkedStory]
+
+
+def test_link_validation_memo():
+    views = resolve_needs(NEEDS, {"links"})  # links_back keeps the need IDs
+    field_validators = Spec.__fields__["links"].sub_fields[0].validators
+
+    with LinkValidationMemo([Spec]) as memo:
+        first = Spec(links=[views["US_001"]])
+        second = Spec(links=[views["US_001"]])
+        assert first.links[0] is second.links[0]
+        assert (memo.hits, memo.misses) == (1, 1)
+
+        with pytest.raises(ValidationError) as first_error:
+            Spec(links=[views["SP_001"]])
+        with pytest.raises(ValidationError) as second_error:
+            Spec(links=[views["SP_001"]])
+        assert str(first_error.value) == str(second_error.value)
+        assert (memo.hits, memo.misses) == (2, 2)
+
+    assert Spec.__fields__["links"].sub_fields[0].validators is field_validators
+
+
+class LinkedStoryType(BaseModel):
+    type: Literal["story"]
+
+
+class Impl(BaseModel):
+    links: List[LinkedStoryType]
+    stories: List[LinkedStory]
+
+
+def test_type_index_validation():
+    assert is_type_only_model(LinkedStoryType)
+    assert not is_type_only_model(LinkedStory)
+    assert get_id_link_fields(Impl, {"links", "stories"}) == {"links"}
+
+    views = resolve_needs(NEEDS, {"links"})
+    with pytest.raises(ValidationError) as resolved_error:
+        Impl(links=[views["US_001"], views["SP_001"]], stories=[])
+
+    with TypeIndexValidation([Impl], get_type_index(NEEDS)):
+        impl = Impl(links=["US_001"], stories=[])
+        assert impl.links == [LinkedStoryType(type="story")]
+        with pytest.raises(ValidationError) as id_error:
+            Impl(links=["US_001", "SP_001"], stories=[])
+
+    assert str(id_error.value) == str(resolved_error.value)
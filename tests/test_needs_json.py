@@ -0,0 +1,28 @@
+import json
+
+import pytest
+
+from sphinx_modeling import needs_json
+from sphinx_modeling.needs_json import iter_needs
+
+
+NEEDS = {
+    "SP_001": {"id": "SP_001", "type": "spec", "links": ["US_001"], "description": 'escaped \\ " {[ content'},
+    "US_001": {"id": "US_001", "type": "story", "links": [], "description": "", "priority": 1.5, "hidden": None},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_iter_needs(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(needs_json, "CHUNK_SIZE", chunk_size)
+    path = tmp_path / "needs.json"
+    versions = {
+        "1.0": {"filters": {"F": {"filter": "}]"}}, "needs": {"OLD": {"id": "OLD"}}, "needs_amount": 1},
+        "2.0": {"filters": {}, "needs": NEEDS, "needs_amount": 2},
+    }
+    path.write_text(json.dumps({"current_version": "2.0", "project": "p", "versions": versions}, indent=4))
+
+    assert dict(iter_needs(str(path))) == NEEDS
+    assert list(iter_needs(str(path), "1.0")) == [("OLD", {"id": "OLD"})]
+    with pytest.raises(ValueError, match="does not contain version '3.0'"):
+        list(iter_needs(str(path), "3.0"))
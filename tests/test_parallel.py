@@ -0,0 +1,64 @@
+import os
+from pathlib import Path
+import subprocess
+
+import pytest
+
+from sphinx_modeling.setup import process_models
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling"}],
+    indirect=True,
+)
+def test_modeling_parallel(test_app):
+    app = test_app
+
+    src_dir = Path(app.srcdir)
+    index_rst = src_dir / "index.rst"
+    index_rst.write_text(
+        index_rst.read_text(encoding="utf8").replace(":links: IM_001, IM_002", ":links: IM_001, US_001")
+    )
+
+    def build(*overrides):
+        out = subprocess.run(
+            ["sphinx-build", "-v", "-E", *overrides, "-b", "html", src_dir, src_dir / "_build"], capture_output=True
+        )
+        assert out.returncode == 0
+        stdout = out.stdout.decode("utf-8")
+        start = stdout.index("Model validation: failed")
+        messages = stdout[start:].split("generating indices")[0]
+        return stdout, [
+            line
+            for line in messages.splitlines()
+            if not line.startswith(("writing output", "Model validation: stored"))
+        ]
+
+    _, serial_messages = build()
+    # -D converts modeling_parallel to a bool which would use all available CPU cores
+    conf_py = src_dir / "conf.py"
+    conf_py.write_text(conf_py.read_text(encoding="utf8") + "\nmodeling_parallel = 2\n")
+    stdout, parallel_messages = build("-D", "modeling_parallel_chunk_size=2")
+
+    assert "worker processes" in stdout
+    assert "Model validation: failed for need SP_001" in parallel_messages
+    assert parallel_messages == serial_messages
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling"}],
+    indirect=True,
+)
+def test_modeling_main_process_only(test_app, monkeypatch):
+    app = test_app
+    app.build()
+    workflow = app.env.needs_modeling_workflow
+    assert workflow["models_checked"]
+
+    # a doctree resolved in a forked worker process does not validate again
+    workflow["models_checked"] = False
+    monkeypatch.setattr(os, "getpid", lambda: workflow["main_pid"] + 1)
+    process_models(app, None, "index")
+    assert not workflow["models_checked"]
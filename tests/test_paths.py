@@ -0,0 +1,73 @@
+from sphinx_modeling.modeling.aggregates import LinkPath, NoCycles, get_aggregate_errors
+from sphinx_modeling.modeling.graph import LinkGraph
+from sphinx_modeling.modeling.main import BaseModelNeeds
+from sphinx_modeling.modeling.paths import LinkPaths
+from sphinx_modeling.modeling.query import NeedsQuery
+
+
+NEEDS = {
+    "US_001": {"id": "US_001", "type": "story", "links": []},
+    "SP_001": {"id": "SP_001", "type": "spec", "links": ["US_001", "SP_002"]},
+    "SP_002": {"id": "SP_002", "type": "spec", "links": ["SP_003"]},
+    "SP_003": {"id": "SP_003", "type": "spec", "links": ["SP_001"]},
+    "SP_004": {"id": "SP_004", "type": "spec", "links": ["SP_004"]},
+    "IM_001": {"id": "IM_001", "type": "impl", "links": ["SP_001.p1"]},
+    "IM_002": {"id": "IM_002", "type": "impl", "links": ["SP_004"]},
+    "TC_001": {"id": "TC_001", "type": "test", "links": ["IM_001", "IM_002"]},
+    "TC_002": {"id": "TC_002", "type": "test", "links": ["IM_002", "US_001"]},
+}
+
+
+def ids(paths, positions):
+    return [paths.graph.ids[position] for position in positions]
+
+
+def test_link_paths():
+    paths = LinkPaths(LinkGraph(NEEDS))
+
+    tracing = paths.get_tracing(["impl", "spec", "story"])
+    assert [need_id for need_id, flag in zip(NEEDS, tracing) if flag] == ["TC_001"]
+    assert paths.get_tracing(["impl", "spec", "story"]) is tracing
+
+    # back links follow the links in reverse
+    tracing = paths.get_tracing(["impl", "test"], ["links_back"])
+    assert [need_id for need_id, flag in zip(NEEDS, tracing) if flag] == ["SP_001", "SP_004"]
+
+    assert [ids(paths, cycle) for cycle in paths.get_cycles()] == [["SP_001", "SP_002", "SP_003"], ["SP_004"]]
+    assert paths.get_cycles(need_types=["spec", "story"]) == paths.get_cycles()
+    assert paths.get_cycles(need_types=["story", "impl", "test"]) == []
+
+
+def test_link_paths_long_chain():
+    needs = {f"N_{index}": {"id": f"N_{index}", "type": "node", "links": [f"N_{index + 1}"]} for index in range(5000)}
+    needs["N_4999"]["links"] = ["N_0"]
+
+    cycles = LinkPaths(LinkGraph(needs)).get_cycles()
+    assert len(cycles) == 1 and len(cycles[0]) == 5000
+
+
+class Spec(BaseModelNeeds):
+    class Config:
+        aggregate_constraints = [LinkPath("story"), NoCycles("links", need_types=["spec"])]
+
+
+class Verification(BaseModelNeeds):
+    class Config:
+        aggregate_constraints = [LinkPath("impl", "spec", "story")]
+
+
+def test_path_constraints():
+    errors = get_aggregate_errors({"spec": Spec, "test": Verification}, NeedsQuery(NEEDS))
+
+    assert sorted(errors) == ["SP_001", "SP_002", "SP_003", "SP_004", "TC_002"]
+    assert [error["msg"] for error in errors["SP_001"]] == ["need is part of a link cycle with SP_002, SP_003"]
+    assert errors["SP_004"] == [
+        {
+            "loc": ["links"],
+            "msg": "ensure a link path to story",
+            "type": "value_error.aggregate.path",
+            "ctx": "path=story",
+        },
+        {"loc": ["links"], "msg": "need links to itself", "type": "value_error.aggregate.cycle"},
+    ]
+    assert [error["msg"] for error in errors["TC_002"]] == ["ensure a link path to impl -> spec -> story"]
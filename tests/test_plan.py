@@ -0,0 +1,53 @@
+from typing import Optional
+
+from pydantic import root_validator
+
+from sphinx_modeling.modeling.main import BaseModelNeeds
+from sphinx_modeling.modeling.plan import ValidationPlan
+
+
+class Story(BaseModelNeeds):
+    id: str
+    type: str
+    links_back: Optional[list]
+
+    @root_validator(allow_reuse=True)
+    def check_context(cls, values):  # noqa: N805
+        assert "all_needs" in values
+        return values
+
+
+def test_plan_project():
+    plan = ValidationPlan(Story, ["docname"], True, ["links_back", "blocks_back"])
+    need = {
+        "id": "US_001",
+        "type": "story",
+        "docname": "index",
+        "style": None,
+        "parent_need": "",
+        "is_need": True,
+        "lineno": 10,
+        "title": "",
+        "status": "open",
+        "links": [],
+        "tags": ["a"],
+        "links_back": ["SP_001"],
+        "blocks_back": ["SP_002"],
+    }
+    assert plan.project(need) == {
+        "id": "US_001",
+        "type": "story",
+        "parent_need": "",
+        "is_need": True,
+        "status": "open",
+        "tags": ["a"],
+        "links_back": ["SP_001"],
+    }
+
+
+def test_plan_root_validator_order():
+    # compiling the plan multiple times must not change the root validator order again
+    for _ in range(3):
+        ValidationPlan(Story, [], True, [])
+        assert Story.__post_root_validators__[-1][1].__qualname__ == "BaseModelNeeds.remove_context"
+        Story(id="US_001", type="story", all_needs={}, env=None)
@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+import subprocess
+from typing import List
+
+from pydantic import BaseModel, conlist, root_validator, validator
+import pytest
+
+from sphinx_modeling.modeling.main import BaseModelNeeds
+from sphinx_modeling.modeling.profile import ValidationProfile
+
+
+class Linked(BaseModel):
+    id: str
+
+    @validator("id", allow_reuse=True)
+    def check_id(cls, value):  # noqa: N805
+        return value
+
+
+class Story(BaseModel):
+    links: List[Linked]
+
+    @root_validator(allow_reuse=True)
+    def check_links(cls, values):  # noqa: N805
+        return values
+
+
+def test_profile_restores_validators():
+    root_validators = list(Story.__post_root_validators__)
+
+    with ValidationProfile([Story]) as profile:
+        with profile.measure_need("US_001", Story):
+            Story(links=[{"id": "SP_001"}, {"id": "SP_002"}])
+
+    assert profile.models["Story"].calls == 1
+    assert profile.validators["Linked.check_id"].calls == 2
+    assert profile.validators["Story.check_links"].calls == 1
+    assert profile.to_dict()["validators"]["Linked.check_id"]["slowest_needs"][0]["id"] == "US_001"
+    assert Story.__post_root_validators__ == root_validators
+
+    # validators are not timed anymore once the profile is closed
+    Story(links=[{"id": "SP_001"}])
+    assert profile.validators["Linked.check_id"].calls == 2
+
+
+class Spec(BaseModelNeeds):
+    tags: conlist(str, min_items=1)
+
+    @validator("tags", allow_reuse=True)
+    def check_tags(cls, value):  # noqa: N805
+        return value
+
+
+def test_profile_user_validators_only():
+    with ValidationProfile([Spec]) as profile:
+        with profile.measure_need("SP_001", Spec):
+            Spec(tags=["a"], all_needs={}, env=None, needs_query=None)
+
+    # constraint validators of pydantic and the context removal of BaseModelNeeds are not timed
+    assert list(profile.validators) == ["Spec.check_tags"]
+    assert profile.validators["Spec.check_tags"].calls == 1
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "src_dir": "doc_test/doc_modeling"}],
+    indirect=True,
+)
+def test_modeling_profile(test_app):
+    app = test_app
+
+    src_dir = Path(app.srcdir)
+    out_dir = src_dir / "_build"
+    out = subprocess.run(
+        ["sphinx-build", "-D", "modeling_profile=1", "-b", "html", src_dir, out_dir], capture_output=True
+    )
+    assert out.returncode == 0
+    assert "Model validation profile: model" in out.stdout.decode("utf-8")
+
+    profile = json.loads((out_dir / ".modeling" / "profile.json").read_text(encoding="utf8"))
+    assert profile["models"]["Story"]["calls"] == 2
+    assert profile["validators"]["Story.check_id"]["calls"] == 2
+    assert profile["validators"]["empty_means_none"]["slowest_needs"][0]["id"] == "TC_001"
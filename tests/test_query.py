@@ -0,0 +1,55 @@
+from typing import Any, Dict
+
+from pydantic import root_validator
+import pytest
+
+from sphinx_modeling.modeling.main import BaseModelNeeds
+from sphinx_modeling.modeling.plan import ValidationPlan
+from sphinx_modeling.modeling.query import NeedsQuery
+
+
+NEEDS = {
+    "US_001": {"id": "US_001", "type": "story", "title": "Login", "docname": "a", "tags": ["ui", "ui"], "links": []},
+    "US_002": {"id": "US_002", "type": "story", "title": "Login", "docname": "b", "tags": [], "links": []},
+    "TC_001": {"id": "TC_001", "type": "test", "title": "Test", "docname": "a", "tags": ["ui"], "links": ["US_001"]},
+    "TC_002": {"id": "TC_002", "type": "test", "title": "Test 2", "docname": "b", "tags": [], "links": ["US_001.p1"]},
+}
+
+
+def ids(needs):
+    return [need["id"] for need in needs]
+
+
+def test_needs_query():
+    query = NeedsQuery(NEEDS)
+
+    assert ids(query.by_type("test")) == ["TC_001", "TC_002"]
+    assert ids(query.by_docname("a")) == ["US_001", "TC_001"]
+    assert ids(query.by_field("title", "Login")) == ["US_001", "US_002"]
+    assert ids(query.by_field("tags", "ui")) == ["US_001", "TC_001"]
+    assert ids(query.outgoing("TC_002")) == ["US_001"]
+    assert ids(query.incoming("US_001")) == ["TC_001", "TC_002"]
+    assert query.incoming("US_002") == ()
+    assert query.get("XX_001") is None
+    with pytest.raises(TypeError):
+        query.get("US_001")["title"] = "changed"
+
+
+class Story(BaseModelNeeds):
+    id: str
+    type: str
+
+    @root_validator(allow_reuse=True)
+    def check_tested(cls, values: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N805
+        if not values["needs_query"].incoming(values["id"]):
+            raise ValueError("story is not tested")
+        return values
+
+
+def test_needs_query_in_validator():
+    ValidationPlan(Story, [], True, [])  # runs the root validator removing the context variables last
+    query = NeedsQuery(NEEDS)
+    story = Story(id="US_001", type="story", all_needs=NEEDS, env=None, needs_query=query)
+    assert "needs_query" not in story.dict()
+    with pytest.raises(ValueError, match="story is not tested"):
+        Story(id="US_002", type="story", all_needs=NEEDS, env=None, needs_query=query)
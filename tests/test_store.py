@@ -0,0 +1,49 @@
+from sphinx_modeling.modeling.store import NeedResult, ResultStore
+
+
+ERRORS = [{"loc": ["links"], "msg": "field required", "type": "value_error.missing"}]
+
+
+def test_store_update(tmp_path):
+    store_path = str(tmp_path / "results.sqlite")
+    results = [
+        NeedResult("US_001", "index", "Story", "fp1", []),
+        NeedResult("SP_001", "index", "Spec", "fp2", ERRORS),
+        NeedResult("IM_001", "add", "Impl", "fp3", ERRORS),
+    ]
+    with ResultStore(store_path) as store:
+        assert store.update(results, "config") == 3
+        # unchanged results are not written again
+        assert store.update(results, "config") == 0
+        # a changed and a removed need
+        assert store.update([results[0], results[2]._replace(errors=[])], "config") == 2
+        assert store.get_failures() == {}
+
+    with ResultStore(store_path) as store:
+        assert store.update(results, "config") == 2
+        assert [failure.need_id for failure in store.iter_failures()] == ["SP_001", "IM_001"]
+        assert store.get_failures(docname="add") == {
+            "IM_001": [
+                "Model validation: failed for need IM_001",
+                "1 validation error for Impl\nlinks\n  field required (type=value_error.missing)",
+            ]
+        }
+        assert store.get_cache_entries("config")["SP_001"] == ("fp2", ERRORS)
+        assert store.get_cache_entries("other config") == {}
+
+
+def test_store_update_single_failure(tmp_path):
+    results = [NeedResult(f"SP_{index:03}", "index", "Spec", None, ERRORS) for index in range(10)]
+    with ResultStore(str(tmp_path / "results.sqlite")) as store:
+        store.update(results, "config")
+        # fixing or adding a failure does not move the other failures
+        assert store.update([results[0]._replace(errors=[])] + results[1:], "config") == 1
+        assert store.update(results, "config") == 1
+        assert [failure.need_id for failure in store.iter_failures()] == [result.need_id for result in results]
+
+
+def test_store_broken_file(tmp_path):
+    store_path = tmp_path / "results.sqlite"
+    store_path.write_text("no database")
+    with ResultStore(str(store_path)) as store:
+        assert store.get_failures() == {}